@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark das opções repetidas (action='append' e action='count')
+
+Com 100 mil repetições, compara:
+    1. Option(action='append') com valores texto (tupla)
+    2. Option(type=int, action='append') (array.array)
+    3. A abordagem manual: get_args() + varrer o argv de novo atrás das ocorrências
+    4. Option(action='count') com -v repetido
+
+Também mede o pico de memória (tracemalloc) da lista de ints contra o array.
+
+Uso:
+    python3 benchmarks/bench_accumulate.py
+    python3 benchmarks/bench_accumulate.py --repeat=1000000
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import get_args, Parser, Option  # noqa: E402
+
+
+def timed(label, func, repetitions):
+    """Executa `func` e imprime o tempo e as ocorrências por segundo"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:9.1f} ms  {repetitions / elapsed:14,.0f} ocorrências/s")
+    return result
+
+
+def peak_memory(func):
+    """Retorna o pico de memória Python alocada por `func`"""
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main():
+    repetitions = 100000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--repeat='):
+            repetitions = int(arg.split('=', 1)[1])
+
+    parser = Parser([
+        Option('--include', '-I', action='append'),
+        Option('--id', type=int, action='append'),
+        Option('--verbose', '-v', action='count'),
+    ])
+    includes = ['job'] + ['--include', 'src/module.py'] * repetitions
+    ids = ['job'] + [f'--id={i}' for i in range(repetitions)]
+    flags = ['job'] + ['-v'] * repetitions
+
+    def manual():
+        get_args(argv=includes)
+        return [includes[i + 1] for i, arg in enumerate(includes) if arg == '--include']
+
+    print(f"Repetições: {repetitions}")
+    timed("append (tupla de str)", lambda: parser.parse(includes), repetitions)
+    timed("append type=int (array.array)", lambda: parser.parse(ids), repetitions)
+    timed("manual: get_args() + nova varredura", manual, repetitions)
+    timed("count (-v repetido)", lambda: parser.parse(flags), repetitions)
+
+    as_array = peak_memory(lambda: parser.parse(ids))
+    as_list = peak_memory(lambda: [int(arg[5:]) for arg in ids[1:]])
+    print(f"\nPico de memória array.array: {as_array / 1024:10.1f} KB")
+    print(f"Pico de memória lista de int: {as_list / 1024:10.1f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
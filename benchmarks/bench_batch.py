@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parsing em lote (parse_many) contra o laço com get_args()
+
+Compara três formas de processar muitas linhas de comando armazenadas:
+    1. Reatribuir sys.argv e chamar get_args() em um laço
+    2. parse_many() retornando um dicionário por registro
+    3. parse_many() no modo colunar (uma lista por chave)
+
+Uso:
+    python3 benchmarks/bench_batch.py                 # 20000 registros
+    python3 benchmarks/bench_batch.py --records=100000
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import get_args, Parser, Option  # noqa: E402
+from friendly_arguments.parser import parse_many  # noqa: E402
+
+
+def build_argvs(records):
+    """Gera linhas de comando parecidas com as de um agendador de jobs"""
+    return [
+        ['job', f'--name=job{i}', '--queue', 'default', '-p', str(i % 10),
+         '--retries=3', '--verbose', f'--owner=user{i % 50}']
+        for i in range(records)
+    ]
+
+
+def bench(label, func, records, repeat=3):
+    """Executa `func` algumas vezes e imprime o melhor tempo"""
+    best = min(_timed(func) for _ in range(repeat))
+    print(f"{label:<32} {best * 1000:9.1f} ms  {records / best:12,.0f} registros/s")
+    return best
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    records = 20000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--records='):
+            records = int(arg.split('=', 1)[1])
+
+    argvs = build_argvs(records)
+    defaults = {'--queue': 'batch', '--retries': '0'}
+    parser = Parser([
+        Option('--name', '-n'),
+        Option('--priority', '-p', default='5'),
+        Option('--verbose', '-v', flag=True, default=False),
+    ])
+
+    def loop_get_args():
+        original = sys.argv
+        try:
+            for argv in argvs:
+                sys.argv = argv
+                get_args(defaults=defaults)
+        finally:
+            sys.argv = original
+
+    def loop_parse():
+        for argv in argvs:
+            parser.parse(argv, defaults)
+
+    print(f"Registros: {records}")
+    baseline = bench("laço sys.argv + get_args()", loop_get_args, records)
+    bench("laço Parser.parse()", loop_parse, records)
+    rows = bench("parse_many()", lambda: parse_many(argvs, parser, defaults), records)
+    columns = bench("parse_many(columnar=True)",
+                    lambda: parse_many(argvs, parser, defaults, columnar=True), records)
+
+    print(f"\nGanho parse_many(): {baseline / rows:.2f}x")
+    print(f"Ganho colunar:      {baseline / columns:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parsing em modo bytes
+
+Simula um argv com caminhos não UTF-8 e um payload base64 grande em
+--data= e compara o pico de memória Python (tracemalloc) e o tempo de:
+    1. get_args() sobre o argv decodificado, reencodando cada valor com
+       os.fsencode (a abordagem atual)
+    2. parse_bytes() sobre o argv em bytes
+    3. parse_bytes(views=True), sem nenhuma cópia dos valores
+
+Uso:
+    python3 benchmarks/bench_binary.py
+    python3 benchmarks/bench_binary.py --mb=200 --paths=10000
+"""
+
+import base64
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import get_args  # noqa: E402
+from friendly_arguments.binary import parse_bytes  # noqa: E402
+
+
+def build_argv(megabytes, paths):
+    """argv em bytes: --data=<base64> seguido de muitos --input com bytes latin-1"""
+    payload = base64.b64encode(os.urandom(megabytes * 1024 * 1024 * 3 // 4))
+    argv = [b'tool', b'--data=' + payload]
+    for i in range(paths):
+        argv += [b'--input', b'/dados/relat\xf3rio-%d.csv' % i]
+    return argv
+
+
+def measure(label, func):
+    """Mede tempo e pico de memória Python de `func`"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40} {elapsed * 1000:8.1f} ms  pico {peak / 1024 / 1024:8.2f} MB")
+
+
+def main():
+    megabytes, paths = 50, 1000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--mb='):
+            megabytes = int(arg.split('=', 1)[1])
+        elif arg.startswith('--paths='):
+            paths = int(arg.split('=', 1)[1])
+
+    argv = build_argv(megabytes, paths)
+    decoded = [os.fsdecode(token) for token in argv]  # o que o sys.argv contém
+    print(f"Payload: {megabytes} MB de base64, {paths} caminhos")
+
+    def decode_and_reencode():
+        args = get_args(argv=decoded)
+        return {key: os.fsencode(value) for key, value in args.items() if value is not True}
+
+    measure("get_args() + os.fsencode", decode_and_reencode)
+    measure("parse_bytes()", lambda: parse_bytes(argv))
+    measure("parse_bytes(views=True)", lambda: parse_bytes(argv, views=True))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark de subcomandos com importação preguiçosa
+
+Gera uma ferramenta com 200 subcomandos (um módulo por comando, num
+diretório temporário) e compara, em interpretadores novos:
+    1. Importar todos os módulos antes de parsear (a abordagem atual)
+    2. CommandTable.dispatch(), que importa só o módulo do comando
+
+Também mede a compilação da trie e a resolução de nomes em memória.
+
+Uso:
+    python3 benchmarks/bench_commands.py
+    python3 benchmarks/bench_commands.py --commands=1000
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from friendly_arguments.commands import CommandTable  # noqa: E402
+
+# Corpo de cada módulo de comando: algumas importações e definições, como
+# um módulo real de uma ferramenta de linha de comando
+MODULE_SOURCE = '''
+import json, decimal, email.message
+
+CONSTANTS = {{f'key{{i}}': i for i in range(500)}}
+
+{classes}
+
+def main(args):
+    return len(args)
+'''
+
+
+def write_tool(directory, count):
+    """Cria os módulos de comando e os dois scripts de entrada"""
+    names = [f'cmd{i:04d}' for i in range(count)]
+    classes = '\n'.join(
+        f"class Handler{i}:\n    def run(self, value):\n        return value * {i}\n"
+        for i in range(50)
+    )
+    for name in names:
+        with open(os.path.join(directory, f'{name}.py'), 'w', encoding='utf-8') as file:
+            file.write(MODULE_SOURCE.format(classes=classes))
+
+    registrations = ''.join(f"table.add({name!r}, '{name}:main')\n" for name in names)
+    with open(os.path.join(directory, 'lazy_tool.py'), 'w', encoding='utf-8') as file:
+        file.write(
+            "import sys\n"
+            "from friendly_arguments.commands import CommandTable\n"
+            "table = CommandTable()\n"
+            f"{registrations}"
+            "table.dispatch()\n"
+        )
+
+    imports = ''.join(f"import {name}\n" for name in names)
+    with open(os.path.join(directory, 'eager_tool.py'), 'w', encoding='utf-8') as file:
+        file.write(
+            "import sys\n"
+            f"{imports}"
+            "from friendly_arguments import get_args\n"
+            "args = get_args(argv=sys.argv[1:])\n"
+            "getattr(sys.modules[sys.argv[1]], 'main')(args)\n"
+        )
+    return names
+
+
+def run_script(directory, script, command, runs=5):
+    """Melhor tempo de parede (ms) de `python script command --verbose`"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPYCACHEPREFIX'] = os.path.join(directory, '__pycache__')
+    env['PYTHONPATH'] = os.pathsep.join([directory, ROOT])
+    args = [sys.executable, os.path.join(directory, script), command, '--verbose']
+
+    subprocess.run(args, env=env, check=True)  # aquece o cache de bytecode
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, env=env, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    count = 200
+    for arg in sys.argv[1:]:
+        if arg.startswith('--commands='):
+            count = int(arg.split('=', 1)[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        names = write_tool(directory, count)
+        command = names[count // 2]
+
+        eager = run_script(directory, 'eager_tool.py', command)
+        lazy = run_script(directory, 'lazy_tool.py', command)
+        print(f"Subcomandos: {count}")
+        print(f"Importando todos os módulos:   {eager:8.1f} ms")
+        print(f"CommandTable.dispatch():       {lazy:8.1f} ms  ({eager / lazy:.1f}x mais rápido)")
+
+    table = CommandTable()
+    for name in names:
+        table.add(name, f'{name}:main')
+
+    start = time.perf_counter()
+    table.compile()
+    print(f"\nCompilação da trie:            {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    words = [names[i % count] for i in range(100000)]
+    start = time.perf_counter()
+    for word in words:
+        table.resolve(word)
+    elapsed = time.perf_counter() - start
+    print(f"Resolução de nomes completos:  {len(words) / elapsed:12,.0f} por segundo")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
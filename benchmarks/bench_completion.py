@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark da completação de shell a partir do índice pré-computado
+
+Compara o tempo por tecla (interpretadores novos) de:
+    1. O helper friendly_arguments/complete.py lendo o índice
+    2. Importar o programa e reconstruir a especificação a cada tecla
+    3. Um interpretador vazio (`python -c pass`), como piso
+
+Uso:
+    python3 benchmarks/bench_completion.py
+    python3 benchmarks/bench_completion.py --options=2000
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from friendly_arguments import Parser, Option  # noqa: E402
+from friendly_arguments.completion import write_index, _HELPER  # noqa: E402
+
+# Programa que monta a especificação e completa sozinho, sem índice
+PROGRAM_SOURCE = '''
+import sys, json, logging, argparse
+from friendly_arguments import Parser, Option
+
+parser = Parser([Option(f'--option{{i}}', f'-o{{i}}') for i in range({count})])
+parser.compile()
+prefix = sys.argv[-1]
+for option in parser.options:
+    for name in option.names:
+        if name.startswith(prefix):
+            print(name)
+'''
+
+
+def best_time(args, env, runs=10):
+    """Melhor tempo de parede (ms) de um comando"""
+    subprocess.run(args, env=env, capture_output=True, check=True)  # aquece o bytecode
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, env=env, capture_output=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    count = 300
+    for arg in sys.argv[1:]:
+        if arg.startswith('--options='):
+            count = int(arg.split('=', 1)[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        env['PYTHONPYCACHEPREFIX'] = os.path.join(directory, '__pycache__')
+        env['PYTHONPATH'] = ROOT
+
+        parser = Parser([Option(f'--option{i}', f'-o{i}') for i in range(count)])
+        index = write_index(parser, 'tool', os.path.join(directory, 'tool.index'))
+        program = os.path.join(directory, 'tool.py')
+        with open(program, 'w', encoding='utf-8') as file:
+            file.write(PROGRAM_SOURCE.format(count=count))
+
+        helper = best_time([sys.executable, '-S', _HELPER, index, 'bash', '1', 'tool', '--option1'], env)
+        rebuild = best_time([sys.executable, program, '--option1'], env)
+        floor = best_time([sys.executable, '-c', 'pass'], env)
+
+    print(f"Opções: {count}")
+    print(f"Helper com índice:                {helper:8.1f} ms por tecla")
+    print(f"Importar o programa a cada tecla: {rebuild:8.1f} ms por tecla")
+    print(f"Interpretador vazio (piso):       {floor:8.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark do tempo de importação do friendly_arguments
+
+Mede o tempo cumulativo de `import friendly_arguments` informado por
+`python -X importtime`, em interpretadores novos e com o bytecode já
+compilado (num diretório temporário, sem sujar o repositório). O pacote
+deve custar quase o mesmo que `import sys`: recursos mais pesados são
+carregados sob demanda pelo `__getattr__` de `friendly_arguments/__init__.py`.
+
+Uso:
+    python3 benchmarks/bench_import.py           # 10 execuções
+    python3 benchmarks/bench_import.py --runs=30
+
+O mesmo limite (BUDGET_MS) é verificado por `python3 run_tests.py`.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tempo cumulativo máximo de `import friendly_arguments`, em milissegundos
+BUDGET_MS = 5.0
+
+
+def _environment(pycache):
+    """Ambiente do subprocesso: bytecode gravado fora do repositório"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPYCACHEPREFIX'] = pycache
+    env['PYTHONPATH'] = ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    return env
+
+
+def _import_time_us(env, module):
+    """Executa `python -X importtime -c 'import <module>'` e retorna o tempo cumulativo"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        env=env, cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        # Formato: "import time:  self | cumulative | name"
+        parts = [part.strip() for part in line.split(':', 1)[-1].split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"Módulo {module} não encontrado na saída de -X importtime")
+
+
+def _wall_time(env, code):
+    """Tempo total de um interpretador novo executando `code`"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], env=env, cwd=ROOT, check=True)
+    return time.perf_counter() - start
+
+
+def measure_import_time(runs=10, module='friendly_arguments'):
+    """
+    Retorna os tempos cumulativos (em microssegundos) de `runs` importações,
+    cada uma num interpretador novo.
+    """
+    with tempfile.TemporaryDirectory() as pycache:
+        env = _environment(pycache)
+        _import_time_us(env, module)  # aquece o cache de bytecode
+        return [_import_time_us(env, module) for _ in range(runs)]
+
+
+def main():
+    runs = 10
+    for arg in sys.argv[1:]:
+        if arg.startswith('--runs='):
+            runs = int(arg.split('=', 1)[1])
+
+    times = measure_import_time(runs)
+    best = min(times) / 1000
+    median = statistics.median(times) / 1000
+
+    with tempfile.TemporaryDirectory() as pycache:
+        env = _environment(pycache)
+        _wall_time(env, 'import friendly_arguments')
+        bare = min(_wall_time(env, 'import sys') for _ in range(runs))
+        package = min(_wall_time(env, 'import friendly_arguments') for _ in range(runs))
+
+    print(f"import friendly_arguments (-X importtime): melhor {best:.2f} ms, mediana {median:.2f} ms")
+    print(f"Interpretador com 'import sys':                {bare * 1000:8.2f} ms")
+    print(f"Interpretador com 'import friendly_arguments': {package * 1000:8.2f} ms")
+    print(f"Limite: {BUDGET_MS:.2f} ms")
+
+    if best > BUDGET_MS:
+        print("❌ Tempo de importação acima do limite")
+        return 1
+    print("✅ Tempo de importação dentro do limite")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parsing incremental em shells interativos
+
+Simula a digitação, letra por letra, de mais uma opção no fim de uma linha
+longa, re-parseando a cada tecla e consultando a opção que espera valor:
+    1. Parser.parse() da linha inteira a cada tecla
+    2. IncrementalParser.update() + expecting (resultado sob demanda)
+    3. IncrementalParser.replace_last() do token editado, sem comparar
+       a linha inteira
+
+Uso:
+    python3 benchmarks/bench_incremental.py
+    python3 benchmarks/bench_incremental.py --tokens=20000
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import ArgumentError, Option, Parser  # noqa: E402
+from friendly_arguments.incremental import IncrementalParser  # noqa: E402
+
+TYPED = ['--name', 'deploy-api', '--port', '8080', '-v']
+
+
+def build_line(count):
+    """Linha longa com opções declaradas, repetidas e desconhecidas"""
+    line = []
+    for i in range(count // 4):
+        line += ['--tag', f'item-{i}', f'--key-{i % 50}', str(i)]
+    return line
+
+
+def keystrokes(line):
+    """Cada estado da linha enquanto TYPED é digitado no fim"""
+    states = []
+    typed = []
+    for token in TYPED:
+        for end in range(1, len(token) + 1):
+            states.append(line + typed + [token[:end]])
+        typed.append(token)
+    return states
+
+
+def main():
+    count = 5000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--tokens='):
+            count = int(arg.split('=', 1)[1])
+
+    parser = Parser([
+        Option('--name', '-n'),
+        Option('--port', '-p', type=int, default=80),
+        Option('--verbose', '-v', flag=True, default=False),
+        Option('--tag', '-t', action='append'),
+    ])
+    line = build_line(count)
+    states = keystrokes(line)
+    print(f"Linha com {len(line):,} tokens, {len(states)} teclas")
+
+    start = time.perf_counter()
+    for tokens in states:
+        try:
+            parser.parse(['shell'] + tokens)
+        except ArgumentError:
+            pass  # '--port' ainda sem valor
+    full = (time.perf_counter() - start) / len(states)
+    print(f"{'Parser.parse() por tecla':<34} {full * 1e6:10.1f} µs")
+
+    shell = IncrementalParser(parser)
+    shell.update(line)
+    start = time.perf_counter()
+    for tokens in states:
+        shell.update(tokens)
+        shell.expecting
+    incremental = (time.perf_counter() - start) / len(states)
+    print(f"{'IncrementalParser.update() por tecla':<34} {incremental * 1e6:10.1f} µs")
+    print(f"{'':<34} {full / incremental:10.1f}x mais rápido")
+    assert shell.result == parser.parse(['shell'] + states[-1])
+
+    shell = IncrementalParser(parser)
+    shell.update(line)
+    start = time.perf_counter()
+    for token in TYPED:
+        shell.push(token[:1])
+        for end in range(2, len(token) + 1):
+            shell.replace_last(token[:end])
+        shell.expecting
+    edits = (time.perf_counter() - start) / len(states)
+    print(f"{'replace_last() por tecla':<34} {edits * 1e6:10.1f} µs")
+    print(f"{'':<34} {full / edits:10.1f}x mais rápido")
+    assert shell.result == parser.parse(['shell'] + states[-1])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark do custo dos hooks de instrumentação
+
+Compara o mesmo parsing (get_args() e Parser.parse() com opções tipadas):
+    1. Sem hooks registrados (o caminho normal, que deve custar o mesmo de antes)
+    2. Com collect_stats() (contagem de tokens e tempo das conversões)
+    3. Com um hook por token
+
+Uso:
+    python3 benchmarks/bench_instrumentation.py
+    python3 benchmarks/bench_instrumentation.py --calls=100000
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import get_args, Parser, Option  # noqa: E402
+from friendly_arguments.instrumentation import add_hook, clear_hooks, collect_stats  # noqa: E402
+
+
+def timed(label, func, calls):
+    """Executa `func` `calls` vezes e imprime o tempo por chamada"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<45} {elapsed / calls * 1e6:8.2f} µs/chamada")
+
+
+def main():
+    calls = 20000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--calls='):
+            calls = int(arg.split('=', 1)[1])
+
+    parser = Parser([
+        Option('--port', '-p', type=int, default=80),
+        Option('--ratio', type=float),
+        Option('--name', '-n'),
+    ])
+    argv = ['app', '--name', 'João', '-p', '8080', '--ratio=0.5', '--verbose', '--x=1']
+
+    def plain():
+        get_args(argv=argv)
+
+    def typed():
+        parser.parse(argv)
+
+    print(f"Chamadas: {calls}, tokens por chamada: {len(argv) - 1}\n")
+    timed("get_args() sem hooks", plain, calls)
+    timed("Parser.parse() tipado sem hooks", typed, calls)
+
+    with collect_stats() as stats:
+        timed("get_args() com collect_stats()", plain, calls)
+        timed("Parser.parse() tipado com collect_stats()", typed, calls)
+
+    add_hook('token', lambda token: None)
+    timed("Parser.parse() tipado com hook por token", typed, calls)
+    clear_hooks()
+
+    print(f"\n{stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark do processamento de manifestos (friendly_arguments.batch)
+
+Gera um manifesto JSONL com linhas de comando de jobs e compara o tempo
+para parsear, validar e gravar todas as linhas:
+    1. laço simples: json.loads + shlex.split + Parser.parse + json.dumps
+    2. process_manifest() no próprio processo (workers=0)
+    3. process_manifest() com um pool de processos
+
+Uso:
+    python3 benchmarks/bench_manifest.py
+    python3 benchmarks/bench_manifest.py --rows=1000000 --workers=8
+"""
+
+import json
+import os
+import shlex
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import ArgumentError, Option, Parser  # noqa: E402
+from friendly_arguments.batch import process_manifest  # noqa: E402
+
+PARSER = Parser([
+    Option('--name', '-n', required=True),
+    Option('--queue', '-q', choices=['default', 'fast', 'slow'], default='default'),
+    Option('--priority', '-p', type=int, default=5, min=0, max=9),
+    Option('--retries', type=int, default=3),
+    Option('--owner'),
+    Option('--verbose', '-v', flag=True, default=False),
+])
+
+
+def write_manifest(path, rows):
+    """Manifesto com 1% de linhas inválidas"""
+    with open(path, 'w', encoding='utf-8') as file:
+        for i in range(rows):
+            priority = 12 if i % 100 == 0 else i % 10
+            line = (f"--name 'job {i}' --queue fast -p {priority} --retries=2 "
+                    f"--owner user{i % 50} -v")
+            file.write(json.dumps({'id': i, 'args': line}) + '\n')
+
+
+def simple_loop(source, output):
+    """A abordagem direta, linha a linha"""
+    with open(source, encoding='utf-8') as lines, open(output, 'w', encoding='utf-8') as out:
+        for number, line in enumerate(lines, 1):
+            try:
+                args = PARSER.parse(['job'] + shlex.split(json.loads(line)['args']))
+                record = {'line': number, 'args': dict(args)}
+            except ArgumentError as error:
+                record = {'line': number, 'error': str(error)}
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def timed(label, func, rows):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.2f} s  {rows / elapsed:12,.0f} linhas/s")
+    return elapsed
+
+
+def main():
+    rows, workers = 200000, os.cpu_count() or 1
+    for arg in sys.argv[1:]:
+        if arg.startswith('--rows='):
+            rows = int(arg.split('=', 1)[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'jobs.jsonl')
+        output = os.path.join(directory, 'out.jsonl')
+        write_manifest(source, rows)
+        print(f"Manifesto: {rows:,} linhas JSONL, {workers} processos")
+
+        baseline = timed("json + shlex + Parser.parse()", lambda: simple_loop(source, output), rows)
+        elapsed = timed("process_manifest(workers=0)",
+                        lambda: process_manifest(source, output, PARSER, workers=0), rows)
+        print(f"{'':<34} {baseline / elapsed:8.1f}x mais rápido")
+        elapsed = timed(f"process_manifest(workers={workers})",
+                        lambda: process_manifest(source, output, PARSER, workers=workers), rows)
+        print(f"{'':<34} {baseline / elapsed:8.1f}x mais rápido")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memória dos registros com __slots__
+
+Parseia o mesmo lote de argv de jobs e mede, com tracemalloc, os bytes
+retidos por resultado (só o container; as strings do argv são
+compartilhadas) e o tempo de:
+    1. parse_many(): um Arguments (dict) por job
+    2. parse_records(): um registro de record_type() por job
+
+Uso:
+    python3 benchmarks/bench_records.py
+    python3 benchmarks/bench_records.py --jobs=1000000
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import Option, Parser, parse_many  # noqa: E402
+from friendly_arguments.record import parse_records  # noqa: E402
+
+
+def build_parser():
+    return Parser([
+        Option('--name', '-n'),
+        Option('--queue', '-q', default='default'),
+        Option('--priority', '-p', type=int, default=0),
+        Option('--retries', '-r', type=int, default=3),
+        Option('--dry-run', flag=True, default=False),
+        Option('--owner'),
+    ])
+
+
+def measure(label, func, jobs):
+    """Mede tempo e bytes retidos por job"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} {elapsed:7.2f} s  {retained / jobs:7.1f} bytes/job  "
+          f"{retained / 1024 / 1024:8.1f} MB no total")
+    return results
+
+
+def main():
+    jobs = 200000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--jobs='):
+            jobs = int(arg.split('=', 1)[1])
+
+    parser = build_parser()
+    parser.compile()
+    argvs = [['job', '-n', 'relatorio', '-q', 'lenta', '-p', '7', '--owner', 'ana']
+             for _ in range(jobs)]
+    print(f"{jobs} jobs, {len(parser.options)} opções declaradas")
+
+    dicts = measure("parse_many()", lambda: parse_many(argvs, parser), jobs)
+    del dicts
+    records = measure("parse_records()", lambda: list(parse_records(argvs, parser)), jobs)
+    del records
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memória dos arquivos de argumentos (@arquivo)
+
+Gera um arquivo de argumentos grande e compara o pico de memória Python
+(tracemalloc) de:
+    1. get_args(response_files=True), que lê o arquivo via mmap sob demanda
+    2. Ler o arquivo inteiro para uma lista e parsear a lista
+
+Uso:
+    python3 benchmarks/bench_response_files.py            # arquivo de ~50 MB
+    python3 benchmarks/bench_response_files.py --mb=500
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import get_args  # noqa: E402
+
+
+def write_manifest(path, megabytes):
+    """Escreve um arquivo com chaves repetidas até atingir o tamanho pedido"""
+    line = b'--include=' + b'x' * 80 + b'\n--level\n3\n--verbose\n'
+    chunk = line * 1000
+    with open(path, 'wb') as file:
+        for _ in range(max(1, megabytes * 1024 * 1024 // len(chunk))):
+            file.write(chunk)
+
+
+def measure(label, func):
+    """Mede tempo e pico de memória Python de `func`"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<36} {elapsed:8.2f} s  pico {peak / 1024 / 1024:10.2f} MB")
+    return peak
+
+
+def main():
+    megabytes = 50
+    for arg in sys.argv[1:]:
+        if arg.startswith('--mb='):
+            megabytes = int(arg.split('=', 1)[1])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'manifest.txt')
+        write_manifest(path, megabytes)
+        size = os.path.getsize(path)
+        print(f"Arquivo de argumentos: {size / 1024 / 1024:.1f} MB")
+
+        def streaming():
+            get_args(argv=['script.py', f'@{path}'], response_files=True)
+
+        def eager():
+            with open(path, 'rb') as file:
+                tokens = [os.fsdecode(line) for line in file.read().splitlines()]
+            get_args(argv=['script.py'] + tokens)
+
+        streamed = measure("get_args(response_files=True)", streaming)
+        loaded = measure("lista em memória + get_args()", eager)
+
+    print(f"\nMemória do modo streaming: {streamed / size:.4%} do tamanho do arquivo")
+    print(f"Redução: {loaded / max(streamed, 1):,.0f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark do modo servidor (serve() e client.py)
+
+Gera um programa que importa uma porção de módulos antes de parsear os
+argumentos e mede o tempo por execução:
+    1. o programa iniciado normalmente (interpretador + importações)
+    2. client.py enviando o argv para um servidor com o programa carregado
+
+Uso:
+    python3 benchmarks/bench_server.py
+    python3 benchmarks/bench_server.py --runs=50
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from friendly_arguments.server import client_command  # noqa: E402
+
+# Importações típicas de uma ferramenta de linha de comando pesada
+PROGRAM = textwrap.dedent('''
+    import sys
+    sys.path.insert(0, {root!r})
+
+    import argparse, asyncio, csv, decimal, email.parser, http.client, json
+    import logging, sqlite3, tarfile, unittest, urllib.request, xml.etree.ElementTree
+    from friendly_arguments import Option, Parser
+
+    PARSER = Parser([Option('--name', '-n'), Option('--count', '-c', type=int, default=1)])
+
+    def main(args):
+        for _ in range(args['--count']):
+            print(json.dumps({{'name': args['--name']}}))
+
+    if __name__ == '__main__':
+        if sys.argv[1:2] == ['--serve']:
+            from friendly_arguments.server import serve
+            serve(main, sys.argv[2], PARSER, idle_timeout=60)
+        else:
+            sys.exit(main(PARSER.parse()))
+''')
+
+
+def measure(label, command, runs):
+    """Mede o tempo médio de uma execução completa do comando"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = subprocess.run(command, shell=True, stdout=subprocess.DEVNULL)
+        if result.returncode != 0:
+            raise SystemExit(f"{label}: saída {result.returncode}")
+    elapsed = (time.perf_counter() - start) / runs
+    print(f"{label:<28} {elapsed * 1000:9.2f} ms por execução")
+    return elapsed
+
+
+def main():
+    runs = 20
+    for arg in sys.argv[1:]:
+        if arg.startswith('--runs='):
+            runs = int(arg.split('=', 1)[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        program = os.path.join(directory, 'tool.py')
+        with open(program, 'w') as file:
+            file.write(PROGRAM.format(root=ROOT))
+        path = os.path.join(directory, 'tool.sock')
+
+        server = subprocess.Popen([sys.executable, program, '--serve', path])
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+
+            print(f"{runs} execuções de 'tool.py --name ana -c 3'")
+            cold = measure("inicialização normal", f"{sys.executable} {program} --name ana -c 3", runs)
+            warm = measure("client.py + servidor", f"{client_command(path)} tool --name ana -c 3", runs)
+            print(f"\nGanho: {cold / warm:.1f}x")
+        finally:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark da propagação de argumentos para processos de um pool
+
+Parseia um argv com um --ids enorme e mede o tempo até todos os processos
+de um pool (contexto spawn) terem lido um valor de --ids, e os bytes
+enviados a cada processo:
+    1. o dicionário de argumentos como argumento do inicializador
+       (pickle completo, uma cópia por processo)
+    2. publish_arguments(): só o nome do bloco é enviado, e --ids é lido
+       no próprio bloco
+
+Uso:
+    python3 benchmarks/bench_shared.py
+    python3 benchmarks/bench_shared.py --ids=5000000 --workers=16
+"""
+
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import Option, Parser  # noqa: E402
+from friendly_arguments.shared import publish_arguments  # noqa: E402
+
+ARGS = None
+
+
+def init(args):
+    global ARGS
+    ARGS = args
+
+
+def read(index):
+    ids = ARGS['--ids']
+    return ids[index % len(ids)]
+
+
+def measure(label, initarg, workers):
+    """Mede o tempo para iniciar o pool e ler --ids em cada processo"""
+    context = multiprocessing.get_context('spawn')
+    sent = len(pickle.dumps(initarg, protocol=pickle.HIGHEST_PROTOCOL))
+    start = time.perf_counter()
+    with context.Pool(workers, initializer=init, initargs=(initarg,)) as pool:
+        pool.map(read, range(workers * 4), chunksize=1)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:9.1f} ms  {sent / 1024 / 1024:8.2f} MB por processo")
+
+
+def main():
+    count, workers = 2000000, 8
+    for arg in sys.argv[1:]:
+        if arg.startswith('--ids='):
+            count = int(arg.split('=', 1)[1])
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+
+    parser = Parser([Option('--ids', type=int, action='append'), Option('--name')])
+    argv = ['tool', '--name', 'lote']
+    for i in range(count):
+        argv += ['--ids', str(i)]
+    args = parser.parse(argv)
+    print(f"--ids com {count} valores, {workers} processos (spawn)")
+
+    measure("dicionário via pickle", dict(args), workers)
+    with publish_arguments(args) as shared:
+        measure("publish_arguments()", shared, workers)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
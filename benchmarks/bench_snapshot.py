@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark de snapshots da especificação (partida fria vs. quente)
+
+Compara, para um Parser com centenas de opções tipadas e com aliases:
+    1. Partida fria: construir as Options e compilar o Parser, declarado
+       no código ou gerado a partir de um esquema JSON
+    2. Partida quente: load_parser() de um snapshot gravado antes
+
+Declarar Options no código é barato, então nesse caso a carga empata com
+a construção; o snapshot compensa quando a construção faz trabalho, como
+ler e interpretar um esquema.
+
+Também mede save_result()/load_result() de um resultado e o tamanho dos
+arquivos gerados.
+
+Uso:
+    python3 benchmarks/bench_snapshot.py
+    python3 benchmarks/bench_snapshot.py --options=2000
+"""
+
+import enum
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from friendly_arguments.converters import ListOf  # noqa: E402
+from friendly_arguments.parser import Parser, Option  # noqa: E402
+from friendly_arguments.snapshot import (  # noqa: E402
+    load_parser, load_result, save_parser, save_result
+)
+
+
+class Mode(enum.Enum):
+    FAST = 'fast'
+    SAFE = 'safe'
+    DEBUG = 'debug'
+
+
+TYPES = [None, int, float, bool, Mode, ListOf(int), None, str]
+
+
+def build_parser(count):
+    """Spec com `count` opções: tipos variados, dois aliases e defaults"""
+    options = []
+    for i in range(count):
+        kind = TYPES[i % len(TYPES)]
+        extra = {}
+        if i % 3 == 0:
+            extra['default'] = None
+        if kind is None and i % 11 == 0:
+            extra['action'] = 'append'
+        options.append(Option(f'--option-{i}', f'-o{i}', f'--alias-{i}', type=kind, **extra))
+    return Parser(options).compile()
+
+
+def write_schema(path, count):
+    """Esquema JSON equivalente ao spec de build_parser()"""
+    names = {None: None, int: 'int', float: 'float', bool: 'bool', Mode: 'mode',
+             str: 'str'}
+    schema = []
+    for option in build_parser(count).options:
+        kind = option.type
+        schema.append({
+            'names': list(option.names),
+            'type': 'ids' if isinstance(kind, ListOf) else names[kind],
+            'action': option.action,
+            'default': option.default if option.has_default else '__missing__',
+            'help': f'Help text of {option.name}, ignored by the parser',
+        })
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(schema, file)
+
+
+def build_from_schema(path):
+    """Lê o esquema JSON e monta o Parser"""
+    types = {None: None, 'int': int, 'float': float, 'bool': bool, 'mode': Mode,
+             'str': str, 'ids': ListOf(int)}
+    with open(path, encoding='utf-8') as file:
+        schema = json.load(file)
+    options = []
+    for entry in schema:
+        extra = {} if entry['default'] == '__missing__' else {'default': entry['default']}
+        options.append(Option(*entry['names'], type=types[entry['type']],
+                              action=entry['action'], **extra))
+    return Parser(options).compile()
+
+
+def best_time(function, repeat=20):
+    """Melhor tempo (ms) entre `repeat` execuções"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    count = 500
+    for arg in sys.argv[1:]:
+        if arg.startswith('--options='):
+            count = int(arg.split('=', 1)[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        spec_path = os.path.join(directory, 'spec.snapshot')
+        result_path = os.path.join(directory, 'args.snapshot')
+
+        schema_path = os.path.join(directory, 'schema.json')
+        write_schema(schema_path, count)
+
+        save_parser(build_parser(count), spec_path)
+        cold = best_time(lambda: build_parser(count))
+        schema = best_time(lambda: build_from_schema(schema_path))
+        warm = best_time(lambda: load_parser(spec_path))
+
+        print(f"Opções: {count} (3 nomes cada)")
+        print(f"Partida fria, spec no código:        {cold:8.2f} ms")
+        print(f"Partida fria, spec de esquema JSON:  {schema:8.2f} ms")
+        print(f"Partida quente (load_parser):        {warm:8.2f} ms  "
+              f"({cold / warm:.1f}x / {schema / warm:.1f}x)")
+        print(f"Tamanho do snapshot:                 {os.path.getsize(spec_path) / 1024:8.1f} KiB")
+        print(f"Tamanho do esquema:                  {os.path.getsize(schema_path) / 1024:8.1f} KiB")
+
+        parser = load_parser(spec_path)
+        argv = ['prog']
+        for i in range(0, count, 2):
+            argv += [f'-o{i}', '1' if TYPES[i % len(TYPES)] is not Mode else 'fast']
+        args = parser.parse(argv)
+
+        parse = best_time(lambda: parser.parse(argv))
+        save_result(args, result_path)
+        load = best_time(lambda: load_result(result_path))
+        print(f"\nResultado com {len(args)} chaves")
+        print(f"Parsear de novo:                     {parse:8.2f} ms")
+        print(f"load_result():                       {load:8.2f} ms")
+        print(f"Tamanho do snapshot:                 {os.path.getsize(result_path) / 1024:8.1f} KiB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parsing de linhas de comando recebidas como string
+
+Compara, sobre 1M de linhas (70% sem aspas, 30% com aspas e escapes):
+    1. shlex.split() + get_args() (a abordagem atual)
+    2. parse_string() linha a linha
+    3. parse_strings() em lote
+
+Uso:
+    python3 benchmarks/bench_strings.py
+    python3 benchmarks/bench_strings.py --lines=100000
+"""
+
+import os
+import shlex
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import get_args  # noqa: E402
+from friendly_arguments.strings import parse_string, parse_strings  # noqa: E402
+
+PLAIN = '--env prod --service api-{i} --replicas 3 --timeout=30 -v'
+QUOTED = '--env prod --message "deploy v{i} \\"hotfix\\"" --path \'/srv/my app\' --tag=a\\ b -v'
+
+
+def build_lines(count):
+    """Linhas de comando variadas, 30% delas com aspas e escapes"""
+    return [(QUOTED if i % 10 < 3 else PLAIN).format(i=i) for i in range(count)]
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.2f} s  {count / elapsed:12,.0f} linhas/s")
+    return results, elapsed
+
+
+def main():
+    count = 1000000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--lines='):
+            count = int(arg.split('=', 1)[1])
+
+    lines = build_lines(count)
+    print(f"Linhas: {count:,}")
+
+    expected, baseline = timed(
+        "shlex.split() + get_args()",
+        lambda: [get_args(argv=['cmd'] + shlex.split(line)) for line in lines], count,
+    )
+    single, elapsed = timed("parse_string()", lambda: [parse_string(line) for line in lines], count)
+    print(f"{'':<28} {baseline / elapsed:8.1f}x mais rápido")
+    batch, elapsed = timed("parse_strings()", lambda: list(parse_strings(lines)), count)
+    print(f"{'':<28} {baseline / elapsed:8.1f}x mais rápido")
+
+    assert single == expected and batch == expected
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks do parser, com argparse e getopt como referência
+
+Gera vetores de argumentos de 10 a 1M tokens em quatro formatos:
+    equals   --key=value
+    space    --key value
+    flags    --flag (só flags booleanas)
+    aliases  -k value (aliases curtos declarados)
+
+Para cada formato e tamanho mede get_args(), Parser.parse(),
+get_params_sys_args() (formato equals), argparse e getopt com
+especificações equivalentes, informando latência por chamada, tokens/s
+e pico de memória (tracemalloc).
+
+argparse e getopt ficam superlineares com opções repetidas (argparse
+leva segundos com 10 mil tokens), por isso só são medidos até 10 mil.
+
+Regressões: a vazão de cada medição é dividida pela vazão de um laço
+de referência em Python puro (separar e guardar cada token), medido logo
+antes e logo depois dela, o que torna os números comparáveis entre
+máquinas e estáveis mesmo com a máquina ocupada. A suíte falha se algum
+valor normalizado cair mais que a tolerância em relação ao baseline
+salvo em benchmarks/baseline.json.
+
+Uso:
+    python3 run_tests.py --bench                     # suíte completa
+    python3 run_tests.py --bench --quick             # até 10 mil tokens
+    python3 run_tests.py --bench --update-baseline   # grava novo baseline
+    python3 benchmarks/bench_suite.py --tolerance=0.3      # tolerância de 30%
+"""
+
+import argparse
+import gc
+import getopt
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from friendly_arguments import get_args, get_arg, get_params_sys_args, Parser, Option  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SIZES = (10, 100, 1000, 10000, 100000, 1000000)
+QUICK_SIZES = (10, 100, 1000, 10000)
+SHAPES = ('equals', 'space', 'flags', 'aliases')
+
+# Número de chaves distintas em cada workload
+KEYS = 20
+
+# argparse e getopt são superlineares; acima disso eles não são medidos
+BASELINE_MAX_SIZE = 10000
+
+# Tamanhos menores que isso são ruidosos demais para detectar regressões
+REGRESSION_MIN_SIZE = 1000
+
+# Cada medição repete chamadas por pelo menos este tempo (segundos)
+MIN_MEASUREMENT_TIME = 0.05
+
+# Medições repetidas; vale a melhor, que é a menos afetada por ruído
+REPEAT = 5
+
+# Chamadas mais lentas que isso não são medidas com tracemalloc
+SLOW_CALL = 0.5
+
+DEFAULT_TOLERANCE = 0.25
+
+LETTERS = 'abcdefghijklmnopqrst'
+
+
+def build_argv(shape, size):
+    """Gera um vetor com `size` tokens (sem contar o nome do programa)"""
+    if shape == 'equals':
+        tokens = [f'--key{i % KEYS}=value{i}' for i in range(size)]
+    elif shape == 'space':
+        tokens = []
+        for i in range(size // 2):
+            tokens += [f'--key{i % KEYS}', f'value{i}']
+    elif shape == 'flags':
+        tokens = [f'--flag{i % KEYS}' for i in range(size)]
+    else:
+        tokens = []
+        for i in range(size // 2):
+            tokens += [f'-{LETTERS[i % KEYS]}', f'value{i}']
+    return ['bench'] + tokens
+
+
+def build_parser(shape):
+    """Parser do friendly_arguments equivalente ao workload"""
+    if shape == 'flags':
+        return Parser([Option(f'--flag{i}', flag=True) for i in range(KEYS)])
+    if shape == 'aliases':
+        return Parser([Option(f'--key{i}', f'-{LETTERS[i]}') for i in range(KEYS)])
+    return Parser([Option(f'--key{i}') for i in range(KEYS)])
+
+
+def build_argparse(shape):
+    """ArgumentParser equivalente ao workload"""
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    for i in range(KEYS):
+        if shape == 'flags':
+            parser.add_argument(f'--flag{i}', action='store_true')
+        elif shape == 'aliases':
+            parser.add_argument(f'-{LETTERS[i]}', f'--key{i}')
+        else:
+            parser.add_argument(f'--key{i}')
+    return parser
+
+
+def build_getopt(shape):
+    """Argumentos de getopt.getopt() equivalentes ao workload"""
+    if shape == 'flags':
+        return '', [f'flag{i}' for i in range(KEYS)]
+    if shape == 'aliases':
+        return ''.join(f'{LETTERS[i]}:' for i in range(KEYS)), []
+    return '', [f'key{i}=' for i in range(KEYS)]
+
+
+def targets(shape):
+    """Funções medidas para um formato: nome -> função(argv)"""
+    parser = build_parser(shape).compile()
+    stdlib_parser = build_argparse(shape)
+    shortopts, longopts = build_getopt(shape)
+    legacy_keys = [f'--key{i}=' for i in range(KEYS)]
+
+    def legacy(argv):
+        original = sys.argv
+        sys.argv = argv
+        try:
+            return get_params_sys_args(legacy_keys)
+        finally:
+            sys.argv = original
+
+    functions = {
+        'get_args': lambda argv: get_args(argv=argv),
+        'Parser.parse': parser.parse,
+    }
+    if shape == 'equals':
+        functions['get_params_sys_args'] = legacy
+    functions['argparse'] = lambda argv: stdlib_parser.parse_args(argv[1:])
+    functions['getopt'] = lambda argv: getopt.getopt(argv[1:], shortopts, longopts)
+    return functions
+
+
+def reference_loop(argv):
+    """Laço mínimo de parsing em Python puro, usado como calibração"""
+    result = {}
+    for token in argv[1:]:
+        if token.startswith('-'):
+            key, _, value = token.partition('=')
+            result[key] = value
+    return result
+
+
+REFERENCE_ARGV = build_argv('equals', 10000)
+
+
+def _timed(function, argv, duration):
+    """Chama `function` por pelo menos `duration` segundos; retorna segundos por chamada"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function(argv)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return elapsed / calls
+
+
+def measure(function, argv, with_memory=True, repeat=REPEAT):
+    """
+    Retorna (segundos por chamada, tokens/s, vazão normalizada, pico de memória)
+
+    Cada repetição mede o alvo entre duas execuções do laço de referência;
+    a vazão normalizada é a mediana das razões, o que cancela a maior parte
+    das variações de frequência da CPU e da carga da máquina.
+    """
+    tokens = len(argv) - 1
+    reference_tokens = len(REFERENCE_ARGV) - 1
+
+    # Como no timeit, o coletor de lixo fica desligado durante a medição
+    gc.disable()
+    try:
+        best = float('inf')
+        ratios = []
+        for _ in range(repeat):
+            before = _timed(reference_loop, REFERENCE_ARGV, MIN_MEASUREMENT_TIME / 2)
+            elapsed = _timed(function, argv, MIN_MEASUREMENT_TIME)
+            best = min(best, elapsed)
+            after = _timed(reference_loop, REFERENCE_ARGV, MIN_MEASUREMENT_TIME / 2)
+            reference = reference_tokens * 2 / (before + after)
+            ratios.append(tokens / elapsed / reference)
+    finally:
+        gc.enable()
+
+    peak = None
+    if with_memory and best < SLOW_CALL:
+        tracemalloc.start()
+        function(argv)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return best, tokens / best, statistics.median(ratios), peak
+
+
+def measure_get_arg():
+    """Buscas por segundo de get_arg() com aliases, em dict simples e Arguments"""
+    parser = Parser([Option(f'--key{i}', f'-{LETTERS[i]}') for i in range(KEYS)])
+    argv = build_argv('aliases', 1000)
+    plain = get_args(argv=argv)
+    compiled = parser.parse(argv)
+    results = {}
+    for label, args in (('get_arg (dict)', plain), ('get_arg (Arguments)', compiled)):
+        calls = 200000
+        start = time.perf_counter()
+        for _ in range(calls):
+            get_arg(args, '--key3', '-d', default=None)
+        results[label] = calls / (time.perf_counter() - start)
+    return results
+
+
+def format_bytes(value):
+    if value is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024:
+            return f'{value:.0f} {unit}'
+        value /= 1024
+    return f'{value:.1f} TB'
+
+
+def run(sizes, with_memory=True):
+    """Executa a suíte e retorna a vazão normalizada de cada medição"""
+    results = {}
+
+    print(f"{'formato':<8} {'tokens':>8} {'alvo':<20} {'latência':>12} {'tokens/s':>14} {'pico mem.':>10}")
+    for shape in SHAPES:
+        functions = targets(shape)
+        for size in sizes:
+            argv = build_argv(shape, size)
+            for name, function in functions.items():
+                if name in ('argparse', 'getopt') and size > BASELINE_MAX_SIZE:
+                    continue
+                # argparse e getopt não entram na verificação de regressão
+                repeat = 1 if name in ('argparse', 'getopt') and size >= BASELINE_MAX_SIZE else REPEAT
+                latency, rate, score, peak = measure(function, argv, with_memory, repeat)
+                results[f'{name}/{shape}/{size}'] = score
+                print(f"{shape:<8} {size:>8} {name:<20} {latency * 1000:9.3f} ms "
+                      f"{rate:14,.0f} {format_bytes(peak):>10}")
+
+    for label, rate in measure_get_arg().items():
+        print(f"{label:<38} {rate:14,.0f} buscas/s")
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Retorna a lista de regressões em relação ao baseline"""
+    regressions = []
+    for key, score in sorted(results.items()):
+        name, _, size = key.split('/')
+        if name in ('argparse', 'getopt') or int(size) < REGRESSION_MIN_SIZE:
+            continue
+        expected = baseline.get(key)
+        if expected and score < expected * (1 - tolerance):
+            regressions.append((key, score / expected - 1))
+    return regressions
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    sizes = QUICK_SIZES if '--quick' in argv else SIZES
+    tolerance = DEFAULT_TOLERANCE
+    for arg in argv:
+        if arg.startswith('--tolerance='):
+            tolerance = float(arg.split('=', 1)[1])
+
+    results = run(sizes, with_memory='--no-memory' not in argv)
+
+    if '--update-baseline' in argv:
+        baseline = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH, encoding='utf-8') as file:
+                baseline = json.load(file)
+        baseline.update({key: round(score, 4) for key, score in results.items()})
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write('\n')
+        print(f"Baseline gravado em {os.path.relpath(BASELINE_PATH, ROOT)}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("Sem baseline salvo; use --update-baseline para criar um")
+        return 0
+
+    with open(BASELINE_PATH, encoding='utf-8') as file:
+        baseline = json.load(file)
+
+    regressions = compare(results, baseline, tolerance)
+    if regressions:
+        print(f"❌ Regressões acima de {tolerance:.0%}:")
+        for key, change in regressions:
+            print(f"   {key}: {change:+.1%}")
+        return 1
+
+    print(f"✅ Nenhuma regressão acima de {tolerance:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
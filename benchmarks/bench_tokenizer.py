@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark do tokenizador por máquina de estados contra o laço anterior
+
+Mede tokens/s do Parser.parse() atual e de uma cópia do laço anterior
+(com lookahead e o teste de '=' antes de saber se o token é uma opção)
+nos mesmos formatos de argv:
+    space     --chave valor
+    equals    --chave=valor
+    flags     --flag (opções não declaradas)
+    declared  opções declaradas com aliases, tipo int e flags
+    negative  --offset -5 (o laço anterior lê -5 como uma flag)
+    combined  -abc e -n5 (o laço anterior não entende; só referência)
+
+Uso:
+    python3 benchmarks/bench_tokenizer.py
+    python3 benchmarks/bench_tokenizer.py --tokens=1000000
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import Option, Parser  # noqa: E402
+from friendly_arguments.parser import _END, _collect  # noqa: E402
+
+
+def legacy_parse_tokens(parser, tokens, args):
+    """Laço de parsing anterior, copiado para comparação"""
+    lookup = parser._lookup
+    repeated = {char: option for char, option in parser._short.items()
+                if option.action == 'count'}
+    collected = {}
+    token = next(tokens, _END)
+
+    while token is not _END:
+        if '=' in token:
+            key, value = token.split('=', 1)
+            option = lookup.get(key)
+            if option is not None:
+                key = option.name
+                if option.converter is not None:
+                    value = option.converter(value)
+                if option.action != 'store':
+                    _collect(collected, option, value)
+                    token = next(tokens, _END)
+                    continue
+            args[key] = value
+            token = next(tokens, _END)
+
+        elif token.startswith('-'):
+            option = lookup.get(token)
+            times = 1
+            if option is None and repeated:
+                option = repeated.get(token[1:2])
+                if option is not None and len(token) > 2 and \
+                        token.count(token[1]) == len(token) - 1:
+                    times = len(token) - 1
+                else:
+                    option = None
+            following = next(tokens, _END)
+
+            if option is None:
+                key = token
+            elif option.flag:
+                if option.action == 'store':
+                    args[option.name] = True
+                else:
+                    _collect(collected, option, times if option.action == 'count' else True)
+                token = following
+                continue
+            else:
+                key = option.name
+
+            if following is not _END and not following.startswith('-'):
+                value = following
+                token = next(tokens, _END)
+            else:
+                value = True
+                token = following
+
+            if option is not None:
+                if option.converter is not None:
+                    value = option.converter(value)
+                if option.action != 'store':
+                    _collect(collected, option, value)
+                    continue
+            args[key] = value
+
+        else:
+            token = next(tokens, _END)
+
+    for key, bucket in collected.items():
+        args[key] = tuple(bucket) if type(bucket) is list else bucket
+
+
+def build_workloads(count):
+    """argv por formato, com aproximadamente `count` tokens"""
+    pairs = count // 2
+    return {
+        'space': ['app'] + [token for i in range(pairs) for token in (f'--key{i % 500}', f'v{i}')],
+        'equals': ['app'] + [f'--key{i % 500}=v{i}' for i in range(count)],
+        'flags': ['app'] + [f'--flag{i % 500}' for i in range(count)],
+        'declared': ['app'] + [token for i in range(pairs // 2) for token in
+                               ('-n', f'job{i}', '-p', str(i % 100), '-v', '--dry-run')][:count],
+        'negative': ['app'] + [token for i in range(pairs) for token in ('--offset', f'-{i}')],
+        'combined': ['app'] + [token for i in range(pairs) for token in ('-vd', f'-p{i % 100}')],
+    }
+
+
+def build_parser():
+    return Parser([
+        Option('--name', '-n'),
+        Option('--port', '-p', type=int),
+        Option('--verbose', '-v', flag=True),
+        Option('--dry-run', '-d', flag=True),
+    ]).compile()
+
+
+def bench(label, func, tokens, repeat=3):
+    """Melhor de `repeat` execuções, em tokens/s"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<20} {best * 1000:9.1f} ms  {tokens / best:14,.0f} tokens/s")
+    return best
+
+
+def main():
+    count = 200000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--tokens='):
+            count = int(arg.split('=', 1)[1])
+
+    parser = build_parser()
+    for name, argv in build_workloads(count).items():
+        print(f"{name} ({len(argv) - 1} tokens)")
+        tokens = len(argv) - 1
+
+        def legacy():
+            args = {}
+            iterator = iter(argv)
+            next(iterator)
+            legacy_parse_tokens(parser, iterator, args)
+            return args
+
+        old = bench("laço anterior", legacy, tokens)
+        new = bench("máquina de estados", lambda: parser.parse(argv), tokens)
+        print(f"  {'':<20} {old / new:9.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
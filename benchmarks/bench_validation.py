@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark da validação compilada com 500 opções
+
+Parseia o mesmo argv com uma especificação de 500 opções (100 obrigatórias,
+200 com intervalo numérico, 100 com escolhas e 50 pares exclusivos) e mede
+o tempo por parse de:
+    1. parser sem restrições (referência: custo só do parsing)
+    2. parser sem restrições + validação manual depois do parse, com um
+       laço sobre o resultado por tipo de regra (a abordagem atual)
+    3. parser com as restrições declaradas (um único validador compilado)
+
+Uso:
+    python3 benchmarks/bench_validation.py
+    python3 benchmarks/bench_validation.py --options=2000 --repeat=2000
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from friendly_arguments import Option, Parser  # noqa: E402
+
+LEVELS = ('debug', 'info', 'warning')
+
+
+def build_spec(count):
+    """Lista de (nome, kwargs de tipo, kwargs de restrição)"""
+    spec = []
+    for i in range(count):
+        kind = i % 10
+        if kind < 2:
+            spec.append((f'--name-{i}', {}, {'required': True}))
+        elif kind < 6:
+            spec.append((f'--size-{i}', {'type': int}, {'min': 0, 'max': 1000}))
+        elif kind < 8:
+            spec.append((f'--level-{i}', {}, {'choices': LEVELS}))
+        else:
+            spec.append((f'--flag-{i}', {'flag': True, 'default': False}, {}))
+    return spec
+
+
+def build_parser(spec, constraints):
+    parser = Parser([
+        Option(name, **extra, **(rules if constraints else {})) for name, extra, rules in spec
+    ])
+    if constraints:
+        flags = [name for name, _, _ in spec if name.startswith('--flag-')]
+        for first, second in zip(flags[0::2], flags[1::2]):
+            parser.add_exclusive(first, second)
+    return parser.compile()
+
+
+def build_argv(spec):
+    argv = ['app']
+    for name, _, _ in spec:
+        if name.startswith('--name-'):
+            argv += [name, 'x']
+        elif name.startswith('--size-'):
+            argv += [name, '42']
+        elif name.startswith('--level-'):
+            argv += [name, 'info']
+    return argv
+
+
+def manual_validator(spec):
+    """Validação escrita à mão: um laço por tipo de regra, como antes"""
+    required = [name for name, _, rules in spec if rules.get('required')]
+    ranges = [(name, rules['min'], rules['max']) for name, _, rules in spec if 'min' in rules]
+    choices = [(name, rules['choices']) for name, _, rules in spec if 'choices' in rules]
+    flags = [name for name, _, _ in spec if name.startswith('--flag-')]
+    pairs = list(zip(flags[0::2], flags[1::2]))
+
+    def validate(args):
+        errors = []
+        for name in required:
+            if name not in args:
+                errors.append(f"{name} is required")
+        for name, low, high in ranges:
+            if name in args and not low <= args[name] <= high:
+                errors.append(f"{name} out of range")
+        for name, accepted in choices:
+            if name in args and args[name] not in accepted:
+                errors.append(f"{name} invalid")
+        for first, second in pairs:
+            if args.get(first) and args.get(second):
+                errors.append(f"{first} and {second} are exclusive")
+        if errors:
+            raise ValueError(errors)
+
+    return validate
+
+
+def measure(label, func, repeat, baseline=None):
+    """Mede o tempo médio por parse"""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    extra = '' if baseline is None else f"  (+{(elapsed - baseline) / baseline * 100:5.1f}%)"
+    print(f"{label:<40} {elapsed * 1e6:9.1f} µs/parse{extra}")
+    return elapsed
+
+
+def main():
+    count, repeat = 500, 500
+    for arg in sys.argv[1:]:
+        if arg.startswith('--options='):
+            count = int(arg.split('=', 1)[1])
+        elif arg.startswith('--repeat='):
+            repeat = int(arg.split('=', 1)[1])
+
+    spec = build_spec(count)
+    argv = build_argv(spec)
+    plain = build_parser(spec, constraints=False)
+    checked = build_parser(spec, constraints=True)
+    manual = manual_validator(spec)
+    print(f"{count} opções, {len(argv) - 1} tokens, {repeat} repetições")
+
+    baseline = measure("sem restrições", lambda: plain.parse(argv), repeat)
+    measure("sem restrições + validação manual", lambda: manual(plain.parse(argv)),
+            repeat, baseline)
+    measure("restrições declaradas", lambda: checked.parse(argv), repeat, baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
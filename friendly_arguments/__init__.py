@@ -4,6 +4,74 @@ __version__ = '0.2.0'
 __github__ = 'https://github.com/Horlando-Leao/FriendlyArguments'
 
 # Import main functions for easy access
-from .named import get_args, get_arg, get_params_sys_args
+from .named import get_args, get_arg, get_params_sys_args, compile_keys, KeyIndex
+from .parser import Parser, Option, Arguments, ArgumentError, parse_many
 
-__all__ = ['get_args', 'get_arg', 'get_params_sys_args']
\ No newline at end of file
+# Everything else is imported on first use, so `import friendly_arguments`
+# stays almost as cheap as `import sys` (see benchmarks/bench_import.py).
+# New features with heavier imports should be registered here, not above.
+_LAZY_ATTRIBUTES = {
+    'ListOf': 'converters',
+    'LazyArguments': 'lazy',
+    'expand_response_files': 'response_files',
+    'ParseCache': 'cache',
+    'cached_get_args': 'cache',
+    'parse_cache': 'cache',
+    'LayeredArguments': 'layered',
+    'layered_args': 'layered',
+    'add_hook': 'instrumentation',
+    'remove_hook': 'instrumentation',
+    'clear_hooks': 'instrumentation',
+    'collect_stats': 'instrumentation',
+    'ParseStats': 'instrumentation',
+    'ParseEvent': 'instrumentation',
+    'Command': 'commands',
+    'CommandTable': 'commands',
+    'write_index': 'completion',
+    'completion_script': 'completion',
+    'save_parser': 'snapshot',
+    'load_parser': 'snapshot',
+    'cached_parser': 'snapshot',
+    'save_result': 'snapshot',
+    'load_result': 'snapshot',
+    'parse_bytes': 'binary',
+    'argv_context': 'context',
+    'current_argv': 'context',
+    'split_string': 'strings',
+    'parse_string': 'strings',
+    'parse_strings': 'strings',
+    'publish_arguments': 'shared',
+    'attach_arguments': 'shared',
+    'SharedArguments': 'shared',
+    'Record': 'record',
+    'record_type': 'record',
+    'parse_record': 'record',
+    'parse_records': 'record',
+    'ValidationError': 'validation',
+    'validate': 'validation',
+    'serve': 'server',
+    'client_command': 'server',
+    'IncrementalParser': 'incremental',
+    'process_manifest': 'batch',
+    'BatchStats': 'batch',
+}
+
+__all__ = [
+    'get_args', 'get_arg', 'get_params_sys_args', 'compile_keys', 'KeyIndex',
+    'Parser', 'Option', 'Arguments', 'ArgumentError', 'parse_many',
+] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # later lookups don't go through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""
+Parse and validate manifests with millions of stored command lines.
+
+    python -m friendly_arguments.batch --input jobs.jsonl --parser mytool.cli:PARSER \\
+        --output parsed.jsonl --workers 8
+
+Each manifest entry becomes one JSON line in the output, in input order:
+{"line": 7, "args": {...}} or {"line": 8, "error": "..."}. The exit status
+is 0 when every entry parsed, 1 when some failed, and 2 for usage errors.
+"""
+
+import json
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .parser import ArgumentError, Option, Parser
+from .strings import split_string
+
+_FORMATS = ('lines', 'jsonl', 'csv')
+
+_USAGE = """\
+usage: python -m friendly_arguments.batch [--input FILE] [--output FILE]
+           [--parser MODULE:ATTRIBUTE | --snapshot FILE] [--format lines|jsonl|csv]
+           [--field NAME] [--workers N] [--chunk-size N] [--progress SECONDS] [--quiet]
+
+  --input, -i       Manifest to read (default: stdin)
+  --output, -o      JSON lines file to write (default: stdout)
+  --parser, -p      Parser (or list of Options) to use, as module:attribute
+  --snapshot        Parser saved with save_parser(), instead of --parser
+  --format, -f      lines: one command line per line; jsonl: a command line
+                    string, a list of tokens, or an object holding one of
+                    those in --field; csv: a header row and a --field column
+                    (default: from the file extension, else lines)
+  --field           Field or column with the command line (default: args)
+  --workers, -w     Worker processes, 0 to parse in this process
+                    (default: the number of CPUs)
+  --chunk-size      Entries sent to a worker at a time (default: 1000)
+  --progress        Seconds between progress reports on stderr (default: 5)
+  --quiet, -q       No progress reports or summary
+"""
+
+_CLI = Parser([
+    Option('--input', '-i', default='-'),
+    Option('--output', '-o', default='-'),
+    Option('--parser', '-p'),
+    Option('--snapshot'),
+    Option('--format', '-f', choices=_FORMATS),
+    Option('--field', default='args'),
+    Option('--workers', '-w', type=int, min=0),
+    Option('--chunk-size', type=int, default=1000, min=1),
+    Option('--progress', type=float, default=5.0),
+    Option('--quiet', '-q', flag=True, default=False),
+    Option('--help', '-h', flag=True, default=False),
+])
+
+# Chunks submitted to the pool and not yet written, per worker
+_IN_FLIGHT = 2
+
+# Parser, defaults, format and field of the current process (see _init)
+_STATE: Optional[Tuple[Parser, Dict[str, Any], str, str]] = None
+
+
+class BatchStats:
+    """
+    Totals of a process_manifest() run.
+
+    Example:
+        stats = process_manifest('jobs.jsonl', 'parsed.jsonl', parser)
+        stats.as_dict()  # {'rows': 1000000, 'errors': 12, 'elapsed': 9.7, ...}
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the totals as a plain dict."""
+        return {
+            'rows': self.rows,
+            'errors': self.errors,
+            'elapsed': self.elapsed,
+            'rows_per_second': self.rows_per_second,
+        }
+
+    def __repr__(self) -> str:
+        return (f"BatchStats(rows={self.rows}, errors={self.errors}, "
+                f"rows_per_second={self.rows_per_second:.0f})")
+
+
+def _jsonable(value: Any) -> Any:
+    """JSON form of the values json can't write: arrays, enums, paths..."""
+    if isinstance(value, array):
+        return value.tolist()  # repeated int and float options
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _init(parser: Parser, defaults: Optional[Dict[str, Any]], format: str, field: str) -> None:
+    """Set up a worker (or this process) to parse chunks."""
+    global _STATE
+    if parser._lookup is None:
+        parser.compile()
+    _STATE = (parser, parser._base_defaults(defaults), format, field)
+
+
+def _tokens(entry: Any, format: str, field: str) -> Iterable[str]:
+    if format == 'jsonl':
+        entry = json.loads(entry)
+        if isinstance(entry, dict):
+            if field not in entry:
+                raise ArgumentError(f"Entry has no field {field!r}")
+            entry = entry[field]
+        if isinstance(entry, list):
+            return [str(token) for token in entry]
+        if not isinstance(entry, str):
+            raise ArgumentError(f"Expected a command line or a list of tokens, got {entry!r}")
+    elif entry is None:
+        raise ArgumentError(f"Row has no column {field!r}")
+    return split_string(entry)
+
+
+def _parse_chunk(entries: List[Tuple[int, Any]]) -> Tuple[str, int]:
+    """Parse (line number, entry) pairs; returns the output lines and the error count."""
+    parser, base, format, field = _STATE
+    parse_tokens = parser._parse_tokens
+    dumps = json.dumps
+    lines = []
+    errors = 0
+    for number, entry in entries:
+        args = dict(base)
+        try:
+            parse_tokens(iter(_tokens(entry, format, field)), args)
+            record = {'line': number, 'args': args}
+        except (ArgumentError, ValueError) as error:  # json errors are ValueErrors
+            errors += 1
+            record = {'line': number, 'error': str(error)}
+            if hasattr(error, 'errors'):
+                record['errors'] = error.errors
+        lines.append(dumps(record, default=_jsonable, ensure_ascii=False))
+    lines.append('')
+    return '\n'.join(lines), errors
+
+
+def _entries(file: IO[str], format: str, field: str) -> Iterator[Tuple[int, Any]]:
+    """(line number, entry) pairs of a manifest; blank lines are skipped."""
+    if format != 'csv':
+        for number, line in enumerate(file, 1):
+            if line.strip():
+                yield number, line.rstrip('\r\n')
+        return
+
+    import csv
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return
+    if field not in header:
+        raise ArgumentError(f"CSV header has no column {field!r}")
+    column = header.index(field)
+    for row in reader:
+        if row:
+            yield reader.line_num, row[column] if column < len(row) else None
+
+
+def _chunks(entries: Iterator[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    chunk = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _guess_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if extension == '.csv':
+        return 'csv'
+    return 'lines'
+
+
+def process_manifest(source: str, output: str, parser: Optional[Parser] = None,
+                     format: Optional[str] = None, field: str = 'args',
+                     workers: Optional[int] = None, chunk_size: int = 1000,
+                     defaults: Optional[Dict[str, Any]] = None,
+                     report: Optional[Callable[[BatchStats], None]] = None,
+                     report_every: float = 5.0) -> BatchStats:
+    """
+    Parse every command line of a manifest file into a JSON lines file.
+
+    The manifest is streamed in chunks to a ProcessPoolExecutor whose
+    workers receive the compiled parser once. At most two chunks per
+    worker are in flight: reading waits for the oldest chunk, whose
+    output is written before the next one is submitted, so memory stays
+    bounded whatever the manifest size, and the output keeps the input
+    order. Each entry is tokenized like shlex.split() (see split_string())
+    unless it's already a list of tokens, parsed and validated; failures
+    are written as error records and don't stop the run.
+
+    Example:
+        stats = process_manifest('jobs.jsonl', 'parsed.jsonl', parser, workers=8)
+        print(f"{stats.rows_per_second:,.0f} rows/s, {stats.errors} errors")
+
+    Args:
+        source: Manifest path, or '-' for stdin
+        output: Output path, or '-' for stdout
+        parser: Parser with the declared options (default: get_args() rules);
+                it must be picklable to be sent to the workers
+        format: 'lines', 'jsonl' or 'csv' (default: from the extension of
+                source, else 'lines')
+        field: JSON field or CSV column with the command line
+        workers: Worker processes (default: os.cpu_count()); 0 parses in
+                 this process
+        chunk_size: Entries per chunk
+        defaults: Optional extra defaults
+        report: Called with the running totals every report_every seconds
+        report_every: Seconds between report() calls
+
+    Returns:
+        BatchStats with the number of rows and errors and the elapsed time
+
+    Raises:
+        ArgumentError: On an unknown format or a CSV without the field column
+    """
+    if parser is None:
+        from .named import _DEFAULT_PARSER as parser
+    if parser._lookup is None:
+        parser.compile()
+    if format is None:
+        format = _guess_format(source)
+    if format not in _FORMATS:
+        raise ArgumentError(f"Unknown manifest format {format!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    stats = BatchStats()
+    next_report = stats.started + report_every
+
+    def write(text: str, errors: int, count: int) -> None:
+        nonlocal next_report
+        destination.write(text)
+        stats.rows += count
+        stats.errors += errors
+        now = time.perf_counter()
+        stats.elapsed = now - stats.started
+        if report is not None and now >= next_report:
+            report(stats)
+            next_report = now + report_every
+
+    source_file = sys.stdin if source == '-' else open(source, encoding='utf-8', newline='')
+    destination = sys.stdout if output == '-' else open(output, 'w', encoding='utf-8')
+    try:
+        chunks = _chunks(_entries(source_file, format, field), chunk_size)
+        if workers == 0:
+            _init(parser, defaults, format, field)
+            for chunk in chunks:
+                write(*_parse_chunk(chunk), len(chunk))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            pending: deque = deque()
+            with ProcessPoolExecutor(workers, initializer=_init,
+                                     initargs=(parser, defaults, format, field)) as executor:
+                for chunk in chunks:
+                    if len(pending) >= workers * _IN_FLIGHT:
+                        future, count = pending.popleft()
+                        write(*future.result(), count)
+                    pending.append((executor.submit(_parse_chunk, chunk), len(chunk)))
+                while pending:
+                    future, count = pending.popleft()
+                    write(*future.result(), count)
+    finally:
+        if source_file is not sys.stdin:
+            source_file.close()
+        if destination is not sys.stdout:
+            destination.close()
+        else:
+            destination.flush()
+    stats.elapsed = time.perf_counter() - stats.started
+    return stats
+
+
+def _print_stats(stats: BatchStats) -> None:
+    print(f"{stats.rows:,} rows, {stats.errors:,} errors, "
+          f"{stats.rows_per_second:,.0f} rows/s", file=sys.stderr)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        options = _CLI.parse(['friendly-arguments-batch'] + list(argv))
+        if options['--help']:
+            print(_USAGE)
+            return 0
+        if options.get('--parser') and options.get('--snapshot'):
+            raise ArgumentError("Use either --parser or --snapshot")
+
+        parser = None
+        if options.get('--parser'):
+            from .commands import _load
+            parser = _load(options['--parser'])
+            if not isinstance(parser, Parser):
+                parser = Parser(parser)
+        elif options.get('--snapshot'):
+            from .snapshot import load_parser
+            parser = load_parser(options['--snapshot'])
+            if parser is None:
+                raise ArgumentError(f"No usable parser snapshot at {options['--snapshot']!r}")
+
+        quiet = options['--quiet']
+        stats = process_manifest(
+            options['--input'], options['--output'], parser,
+            format=options.get('--format'), field=options['--field'],
+            workers=options.get('--workers'), chunk_size=options['--chunk-size'],
+            report=None if quiet else _print_stats, report_every=options['--progress'],
+        )
+    except (ArgumentError, ImportError, AttributeError, OSError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    if not quiet:
+        _print_stats(stats)
+    return 1 if stats.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import os
+import sys
+from typing import Any, Dict, Iterator, Optional, Sequence, Union
+
+from . import parser as parser_module
+from .parser import (Arguments, Option, Parser, _MISSING, _NUMBER_START, _collect,
+                     _current_argv, _is_number)
+
+# Second bytes of tokens that may be negative numbers
+_NUMBER_BYTES = frozenset(ord(char) for char in _NUMBER_START)
+
+# Byte values are whatever the OS passed; keys and typed values are decoded
+# the same way Python decodes sys.argv, so they round-trip with os.fsencode
+_ENCODING = sys.getfilesystemencoding()
+_ERRORS = sys.getfilesystemencodeerrors()
+
+Value = Union[bytes, memoryview]
+
+
+def parse_bytes(argv: Optional[Sequence[bytes]] = None, parser: Optional[Parser] = None,
+                defaults: Optional[Dict[str, Any]] = None, views: bool = False) -> Arguments:
+    """
+    Parse a command line given as bytes, without decoding the values.
+
+    Tokens are parsed exactly like Parser.parse() does, but only option
+    names are decoded (to str keys, as in every other result). Values are
+    never decoded and encoded back: a value given as its own token is the
+    original bytes object, and the value of '--key=value' is a slice taken
+    after the first '='. With views=True that slice is a memoryview of the
+    token, so even a huge embedded value (a base64 payload in --data=...)
+    is never copied, and every value is a memoryview for consistency.
+
+    Typed options are decoded like sys.argv (surrogateescape on POSIX)
+    and converted as usual.
+
+    Example:
+        # python tool.py --input $'caf\\xe9.txt' --data=<50 MB of base64>
+        args = parse_bytes(views=True)
+        open(bytes(args['--input']), 'rb')
+        payload = base64.b64decode(args['--data'])
+
+    Args:
+        argv: Argument vector of bytes including the program name
+              (default: sys.argv encoded back with os.fsencode)
+        parser: Parser with the declared options (default: get_args() rules)
+        defaults: Optional extra defaults
+        views: If True, values are memoryviews over the original tokens
+
+    Returns:
+        Arguments dictionary with str keys and bytes (or memoryview) values
+    """
+    if parser is None:
+        from .named import _DEFAULT_PARSER as parser
+    if parser._lookup is None:
+        parser.compile()
+    if argv is None:
+        argv = [os.fsencode(arg) for arg in _current_argv()]
+
+    args = Arguments(parser._base_defaults(defaults), canonical=parser._canonical)
+    tokens = iter(argv)
+    next(tokens, None)  # skip the program name
+    if parser_module._instrumentation is None:
+        _parse_tokens(parser, tokens, args, views)
+    else:
+        with parser_module._instrumentation.observe(parser, argv) as (timed, counted):
+            _parse_tokens(timed, counted(tokens), args, views)
+    return args
+
+
+def _decode(value: Value) -> str:
+    return str(value, _ENCODING, _ERRORS)
+
+
+def _is_value(parser: Parser, token: bytes) -> bool:
+    """Parser._is_value over bytes: negative numbers are checked on the bytes."""
+    return (token[:1] != b'-' or token == b'-' or (
+        token[1] in _NUMBER_BYTES and _decode(token) not in parser._lookup
+        and _is_number(token)))
+
+
+def _parse_tokens(parser: Parser, tokens: Iterator[bytes], args: Dict[str, Any],
+                  views: bool) -> None:
+    """Same state machine as Parser._parse_tokens, over bytes tokens."""
+    lookup = parser._lookup
+    short = parser._short
+    collected: Dict[str, Any] = {}
+    pending: Any = None  # Option, or undeclared name, waiting for a value
+    result = args
+    if parser._validator is not None:
+        args = {}  # the options given, checked by the validator
+
+    for token in tokens:
+        if b'=' in token and token[:1] == b'-':
+            # Only the name is decoded: a huge --data=... value is never copied
+            if pending is not None:
+                _store_flag(pending, args, collected)
+                pending = None
+            separator = token.find(b'=')
+            name = _decode(token[:separator])
+            value = memoryview(token)[separator + 1:] if views else token[separator + 1:]
+            option = lookup.get(name)
+            if option is not None:
+                _store(option, value, args, collected)
+                continue
+            # Combined letters before the '=': '-vn=5', or '-vn5=3' with '5=3'
+            items = parser._cluster(name) if name[1:2] in short else None
+            if items is None or items[-1][1] is True:
+                args[name] = value
+                continue
+            for option, attached in items:
+                if attached is _MISSING:
+                    attached = value
+                elif attached is not True:
+                    start = separator - len(os.fsencode(attached))
+                    attached = memoryview(token)[start:] if views else token[start:]
+                _store(option, attached, args, collected)
+            continue
+
+        if _is_value(parser, token):
+            if pending is None:
+                continue  # positional arguments are ignored
+            value = memoryview(token) if views else token
+            if type(pending) is str:
+                args[pending] = value
+            else:
+                _store(pending, value, args, collected)
+            pending = None
+            continue
+
+        if pending is not None:
+            _store_flag(pending, args, collected)
+            pending = None
+
+        key = _decode(token)  # a name: tokens with values were handled above
+        option = lookup.get(key)
+        if option is not None:
+            if not option.flag:
+                pending = option
+            else:
+                _store(option, True, args, collected)
+            continue
+
+        if token == b'--':
+            break
+
+        items = parser._cluster(key) if key[1] in short else None
+        if items is None:
+            pending = key
+            continue
+        for option, value in items:
+            if value is _MISSING:
+                pending = option
+            else:
+                if value is not True:
+                    # The attached value is the tail of the token
+                    size = len(os.fsencode(value))
+                    value = memoryview(token)[len(token) - size:] if views \
+                        else token[len(token) - size:]
+                _store(option, value, args, collected)
+
+    if pending is not None:
+        _store_flag(pending, args, collected)
+
+    for key, bucket in collected.items():
+        args[key] = tuple(bucket) if type(bucket) is list else bucket
+
+    if args is not result:
+        result.update(args)
+        parser._validator(result, args)
+
+
+def _store(option: Option, value: Any, args: Dict[str, Any], collected: Dict[str, Any]) -> None:
+    """Store one occurrence of a declared option: typed values are decoded first."""
+    if option.converter is not None and not (value is True and option.flag):
+        value = option.converter(value if value is True else _decode(value))
+    if option.action == 'store':
+        args[option.name] = value
+    else:
+        _collect(collected, option, value)
+
+
+def _store_flag(pending: Any, args: Dict[str, Any], collected: Dict[str, Any]) -> None:
+    if type(pending) is str:
+        args[pending] = True
+    else:
+        _store(pending, True, args, collected)
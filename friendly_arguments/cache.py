@@ -0,0 +1,176 @@
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from typing import Dict, Any, Optional, Sequence
+
+from . import parser as parser_module
+from .parser import Arguments, Parser, _current_argv
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ReadOnlyArguments(Arguments):
+    """
+    Arguments dictionary that refuses changes.
+
+    Cached results are shared by every caller, so they can't be modified in
+    place; use dict(args) to get a private, mutable copy. Mutable values
+    are frozen too (see _frozen): the compact arrays of repeated int and
+    float options become read-only memoryviews over them.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Cached arguments are read-only; use dict(args) to get a copy")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __reduce__(self):
+        # Pickle would rebuild the items through __setitem__; memoryviews
+        # can't be pickled, so the copy gets the arrays behind them
+        items = {key: value.obj if type(value) is memoryview else value
+                 for key, value in self.items()}
+        return (type(self), (items,), (None, {'canonical': self.canonical}))
+
+
+def _frozen(value: Any) -> Any:
+    """Read-only form of a mutable value, so a shared result can't change."""
+    if isinstance(value, array):
+        return memoryview(value).toreadonly()
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parse results.
+
+    Results are keyed on the argument vector (as a tuple), the parser and
+    the version of its specification, and the defaults, so a reassigned or
+    modified sys.argv, a new option or different defaults always parse
+    again instead of serving a stale result. Defaults with unhashable
+    values are parsed without caching.
+
+    Example:
+        cache = ParseCache(maxsize=8)
+        args = cache.get_args(defaults={'--port': '8080'})
+        cache.cache_info()  # CacheInfo(hits=0, misses=1, maxsize=8, currsize=1)
+
+    Args:
+        maxsize: Maximum number of results kept (default: 32)
+    """
+
+    def __init__(self, maxsize: int = 32):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: 'OrderedDict[tuple, ReadOnlyArguments]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_args(self, defaults: Optional[Dict[str, Any]] = None,
+                 argv: Optional[Sequence[str]] = None,
+                 parser: Optional[Parser] = None) -> ReadOnlyArguments:
+        """
+        Return the (shared, read-only) result of parsing `argv`.
+
+        Args:
+            defaults: Optional dictionary with default values
+            argv: Argument vector including the program name (default: sys.argv)
+            parser: Parser to use (default: no declared options, like get_args())
+
+        Returns:
+            ReadOnlyArguments dictionary
+        """
+        if parser is None:
+            from .named import _DEFAULT_PARSER as parser
+        if parser._lookup is None:
+            parser.compile()
+        argv = tuple(_current_argv() if argv is None else argv)
+
+        try:
+            # The types too: 1, 1.0 and True are equal keys with different results
+            key = (argv, parser, parser.generation,
+                   tuple((name, type(value), value) for name, value in defaults.items())
+                   if defaults else None)
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is not None:
+            with self._lock:
+                result = self._results.get(key)
+                if result is not None:
+                    self._results.move_to_end(key)
+                    self.hits += 1
+            if result is not None:
+                if parser_module._instrumentation is not None:
+                    parser_module._instrumentation.cache_hit(parser, argv)
+                return result
+
+        args = parser.parse(argv, defaults)
+        result = ReadOnlyArguments({key: _frozen(value) for key, value in args.items()},
+                                   canonical=args.canonical)
+
+        with self._lock:
+            self.misses += 1
+            if key is not None:
+                self._results[key] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        return result
+
+    def invalidate(self, parser: Optional[Parser] = None) -> None:
+        """Drop the cached results of one parser, or every result if None."""
+        with self._lock:
+            if parser is None:
+                self._results.clear()
+                return
+            for key in [key for key in self._results if key[1] is parser]:
+                del self._results[key]
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the hit/miss counters."""
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit/miss counters, like functools.lru_cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+
+# Process-wide cache shared by cached_get_args()
+parse_cache = ParseCache()
+
+
+def cached_get_args(defaults: Optional[Dict[str, Any]] = None,
+                    argv: Optional[Sequence[str]] = None,
+                    parser: Optional[Parser] = None) -> ReadOnlyArguments:
+    """
+    Memoized get_args(): parse the command line once per process.
+
+    Independent modules can all call cached_get_args() during start up and
+    share a single parse. The result is read-only; call
+    parse_cache.invalidate() to force a new parse.
+
+    Example:
+        args = cached_get_args(defaults={'--port': '8080'})
+        parse_cache.cache_info()  # hits and misses so far
+
+    Args:
+        defaults: Optional dictionary with default values
+        argv: Argument vector including the program name (default: sys.argv)
+        parser: Parser to use (default: no declared options)
+
+    Returns:
+        ReadOnlyArguments dictionary
+    """
+    return parse_cache.get_args(defaults, argv, parser)
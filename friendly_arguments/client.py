@@ -0,0 +1,129 @@
+"""
+Client of the warm server started by friendly_arguments.server.serve().
+
+The server keeps a program's modules imported; this client only forwards
+its command line, environment and working directory, and hands over its
+own stdin, stdout and stderr, so the program reads and writes them
+directly. It never imports friendly_arguments, so a call costs little
+more than an interpreter start:
+
+    python -S path/to/friendly_arguments/client.py SOCKET PROG ARG...
+
+PROG ARG... become the program's argv. The client exits with the
+program's exit code, or with 75 (EX_TEMPFAIL) when no server is listening
+or the server's sources changed: wrapper scripts then run the program
+normally (see server.client_command()).
+"""
+
+from __future__ import annotations
+
+import marshal
+import os
+import socket
+import struct
+import sys
+
+# Not evaluated at runtime: the client runs on every invocation
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Optional, Sequence
+
+PROTOCOL = 1
+
+# Request: protocol and payload size, sent along with the stdio file
+# descriptors, then the marshal data of (argv, environ, cwd)
+REQUEST = struct.Struct('<II')
+
+# Replies: STARTED with the pid of the process running the program, then
+# EXITED with its exit code. STALE (sources changed) is sent instead of both
+REPLY = struct.Struct('<Bi')
+STARTED = 0
+EXITED = 1
+STALE = 2
+
+# Exit code of the command line client when there's no usable server
+UNAVAILABLE = 75
+
+
+def _receive(connection: socket.socket, size: int) -> bytes:
+    data = b''
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def call(path: str, argv: Sequence[str], environ: Optional[Dict[str, str]] = None,
+         cwd: Optional[str] = None, stdio: Sequence[int] = (0, 1, 2)) -> Optional[int]:
+    """
+    Run a command line on the server listening at `path`.
+
+    Ctrl-C while waiting is forwarded to the program as SIGINT.
+
+    Args:
+        path: Socket path given to serve()
+        argv: Argument vector including the program name
+        environ: Environment of the program (default: os.environ)
+        cwd: Working directory of the program (default: the current one)
+        stdio: File descriptors used as the program's stdin, stdout and stderr
+
+    Returns:
+        The program's exit code, None if the program didn't start (no
+        usable server), or 1 if the connection dropped while it ran
+    """
+    payload = marshal.dumps((
+        list(argv),
+        dict(os.environ if environ is None else environ),
+        os.getcwd() if cwd is None else cwd,
+    ))
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            connection.connect(path)
+        except OSError:
+            return None
+        descriptors = struct.pack(f'{len(stdio)}i', *stdio)
+        try:
+            connection.sendmsg([REQUEST.pack(PROTOCOL, len(payload))],
+                               [(socket.SOL_SOCKET, socket.SCM_RIGHTS, descriptors)])
+            connection.sendall(payload)
+        except OSError:
+            pass  # a stale server may answer and close before reading
+
+        pid = None
+        while True:
+            try:
+                reply = _receive(connection, REPLY.size)
+            except KeyboardInterrupt:
+                if pid is not None:
+                    os.kill(pid, 2)  # SIGINT, and wait for the exit code
+                continue
+            except OSError:
+                reply = b''
+            if len(reply) < REPLY.size:
+                return None if pid is None else 1
+            status, value = REPLY.unpack(reply)
+            if status == STARTED:
+                pid = value
+            elif status == EXITED:
+                return value
+            else:
+                return None
+    finally:
+        connection.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("usage: client.py SOCKET PROG ARG...", file=sys.stderr)
+        return 2
+
+    code = call(argv[0], argv[1:])
+    return UNAVAILABLE if code is None else code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
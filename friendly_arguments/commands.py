@@ -0,0 +1,292 @@
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .parser import Arguments, ArgumentError, Option, Parser, _current_argv
+
+
+# Trie keys that can't clash with a character: the command ending exactly
+# at a node, and every distinct command below it
+_EXACT = ''
+_BELOW = None
+
+
+def _load(target: str) -> Any:
+    """Import 'package.module:attribute' and return the attribute."""
+    module_name, _, attribute = target.partition(':')
+    if not module_name or not attribute:
+        raise ArgumentError(f"Invalid target {target!r}, expected 'module:attribute'")
+
+    from importlib import import_module
+    value = import_module(module_name)
+    for name in attribute.split('.'):
+        value = getattr(value, name)
+    return value
+
+
+def _source_mtime(module_name: str) -> Optional[int]:
+    """Modification time of a module's file, found without importing it."""
+    from importlib.util import find_spec
+    try:
+        spec = find_spec(module_name)
+        return os.stat(spec.origin).st_mtime_ns
+    except (ImportError, AttributeError, TypeError, ValueError, OSError):
+        return None
+
+
+class Command:
+    """
+    A subcommand: its name, its target function and its own option spec.
+
+    Nothing is imported when a command is declared: the target module is
+    imported by load(), only for the command that actually runs.
+
+    Example:
+        Command('build', 'mytool.build:main', parser=Parser([Option('--jobs', '-j', type=int)]))
+        Command('serve', 'mytool.serve:main', 's', parser='mytool.serve:PARSER')
+
+    Args:
+        name: Command name typed on the command line
+        target: Function to run, as 'module:function'
+        *aliases: Other accepted names (e.g., a short form)
+        parser: Options of the command: a Parser, a list of Options, a
+                'module:attribute' string naming a Parser (imported with
+                the command), or None to parse like get_args()
+    """
+
+    __slots__ = ('name', 'target', 'aliases', '_parser', '_function')
+
+    def __init__(self, name: str, target: str, *aliases: str,
+                 parser: Union[Parser, Sequence[Option], str, None] = None):
+        if not name or name.startswith('-'):
+            raise ArgumentError(f"Invalid command name {name!r}")
+        if ':' not in target:
+            raise ArgumentError(f"Invalid target {target!r}, expected 'module:function'")
+        self.name = name
+        self.target = target
+        self.aliases = aliases
+        if parser is not None and not isinstance(parser, (Parser, str)):
+            parser = Parser(parser)
+        self._parser = parser
+        self._function: Optional[Callable[[Arguments], Any]] = None
+
+    @property
+    def names(self) -> tuple:
+        """All names of the command, canonical name first."""
+        return (self.name,) + self.aliases
+
+    @property
+    def loaded(self) -> bool:
+        """True once the target module was imported."""
+        return self._function is not None
+
+    def load(self) -> Callable[[Arguments], Any]:
+        """Import the target module (once) and return the command function."""
+        if self._function is None:
+            self._function = _load(self.target)
+        return self._function
+
+    @property
+    def parser(self) -> Optional[Parser]:
+        """Option spec of the command, importing it first if it's a target string."""
+        if isinstance(self._parser, str):
+            parser = _load(self._parser)
+            if not isinstance(parser, Parser):
+                raise ArgumentError(f"{self._parser!r} is not a Parser")
+            self._parser = parser
+        return self._parser
+
+    def __repr__(self) -> str:
+        return f"Command({self.name!r}, {self.target!r})"
+
+
+class CommandTable:
+    """
+    Precompiled dispatch table of subcommands.
+
+    Commands are registered by name with a 'module:function' target, so a
+    tool with hundreds of subcommands imports only the module of the one
+    being run. On the first lookup every name and alias is compiled into a
+    character trie; a command word is then resolved by walking its
+    characters once, which also finds unambiguous abbreviations ('sta' for
+    'status' when no other command starts with 'sta').
+
+    The command must be the first argument; the arguments after it are
+    parsed with the command's own options.
+
+    Example:
+        commands = CommandTable()
+        commands.add('build', 'mytool.build:main', parser=[Option('--jobs', '-j', type=int)])
+        commands.add('status', 'mytool.status:main', 'st')
+
+        # python tool.py build -j 4
+        commands.dispatch()  # imports mytool.build, calls main({'--jobs': 4})
+
+    Args:
+        commands: Optional initial Command declarations
+        abbreviations: If False, only full names and aliases are accepted
+    """
+
+    def __init__(self, commands: Iterable[Command] = (), abbreviations: bool = True):
+        self.commands: List[Command] = []
+        self.abbreviations = abbreviations
+        self._trie: Optional[Dict[Any, Any]] = None
+
+        for command in commands:
+            self.add_command(command)
+
+    def add_command(self, command: Command) -> Command:
+        """Add an already built Command to the table."""
+        self.commands.append(command)
+        self._trie = None
+        return command
+
+    def add(self, name: str, target: str, *aliases: str,
+            parser: Union[Parser, Sequence[Option], str, None] = None) -> Command:
+        """
+        Register a command.
+
+        Example:
+            commands.add('deploy', 'mytool.deploy:main', 'd', parser=DEPLOY_OPTIONS)
+
+        Args:
+            name: Command name
+            target: Function to run, as 'module:function'
+            *aliases: Other accepted names
+            parser: Options of the command (see Command)
+
+        Returns:
+            The created Command
+        """
+        return self.add_command(Command(name, target, *aliases, parser=parser))
+
+    def compile(self) -> 'CommandTable':
+        """
+        Build the trie of command names.
+
+        Called automatically before the first lookup and after commands are
+        added; calling it explicitly just moves the cost to a known moment.
+        """
+        trie: Dict[Any, Any] = {_BELOW: []}
+        seen: Dict[str, Command] = {}
+        for command in self.commands:
+            for name in command.names:
+                if name in seen:
+                    raise ArgumentError(f"Command name {name!r} is declared more than once")
+                seen[name] = command
+
+                node = trie
+                path = [trie]
+                for char in name:
+                    node = node.setdefault(char, {_BELOW: []})
+                    path.append(node)
+                node[_EXACT] = command
+
+                for node in path:
+                    below = node[_BELOW]
+                    # The names of a command are added one after the other
+                    if not below or below[-1] is not command:
+                        below.append(command)
+
+        self._trie = trie
+        return self
+
+    def resolve(self, word: str) -> Command:
+        """
+        Return the command named, aliased or abbreviated by `word`.
+
+        Raises:
+            ArgumentError: If no command matches, or an abbreviation matches
+                           more than one command
+        """
+        if self._trie is None:
+            self.compile()
+
+        if not word:
+            raise ArgumentError("No command given")
+
+        node = self._trie
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                raise ArgumentError(f"Unknown command {word!r}")
+
+        command = node.get(_EXACT)
+        if command is not None:
+            return command
+
+        candidates = node[_BELOW]
+        if not self.abbreviations or not candidates:
+            raise ArgumentError(f"Unknown command {word!r}")
+        if len(candidates) > 1:
+            names = ', '.join(sorted(candidate.name for candidate in candidates))
+            raise ArgumentError(f"Ambiguous command {word!r}: could be {names}")
+        return candidates[0]
+
+    def parse(self, argv: Optional[Sequence[str]] = None,
+              defaults: Optional[Dict[str, Any]] = None) -> Tuple[Command, Arguments]:
+        """
+        Resolve the command and parse its arguments, without running it.
+
+        Only the command's option spec is imported here, if it was given as
+        a 'module:attribute' string.
+
+        Args:
+            argv: Argument vector including the program name (default: sys.argv)
+            defaults: Optional extra defaults for the command's options
+
+        Returns:
+            (Command, Arguments) tuple
+        """
+        if argv is None:
+            argv = _current_argv()
+        if len(argv) < 2 or argv[1].startswith('-'):
+            raise ArgumentError("No command given")
+
+        command = self.resolve(argv[1])
+        parser = command.parser
+        if parser is None:
+            from .named import _DEFAULT_PARSER as parser
+        # The command word takes the place of the program name
+        return command, parser.parse(argv[1:], defaults)
+
+    def dispatch(self, argv: Optional[Sequence[str]] = None,
+                 defaults: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run the command named on the command line.
+
+        Args:
+            argv: Argument vector including the program name (default: sys.argv)
+            defaults: Optional extra defaults for the command's options
+
+        Returns:
+            Whatever the command function returns
+        """
+        command, args = self.parse(argv, defaults)
+        return command.load()(args)
+
+    def fingerprint(self) -> str:
+        """
+        Return a hash of the commands and of their option specs.
+
+        Specs given as 'module:attribute' strings are not imported: the
+        modification time of the module file stands for their contents.
+        """
+        from hashlib import sha256
+        digest = sha256()
+        for command in self.commands:
+            spec = command._parser
+            if isinstance(spec, Parser):
+                spec = spec.fingerprint()
+            elif isinstance(spec, str):
+                spec = (spec, _source_mtime(spec.partition(':')[0]))
+            digest.update(repr((command.names, command.target, spec)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def __contains__(self, name: object) -> bool:
+        return any(name in command.names for command in self.commands)
+
+    def __iter__(self) -> Iterator[Command]:
+        return iter(self.commands)
+
+    def __len__(self) -> int:
+        return len(self.commands)
@@ -0,0 +1,202 @@
+"""
+Completion helper called by the shell scripts of friendly_arguments.completion.
+
+It answers from a precomputed index file and never imports the program
+being completed, nor friendly_arguments itself: the shell scripts run this
+file directly, so each keystroke costs little more than an interpreter
+start:
+
+    python -S path/to/friendly_arguments/complete.py INDEX SHELL CWORD WORD...
+
+WORD... are the words of the command line (the program name first) and
+CWORD is the position of the word being completed. Candidates are printed
+one per line.
+"""
+
+from __future__ import annotations
+
+import sys
+
+# Not evaluated at runtime: the helper runs on every keystroke
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional, Sequence
+
+# First line of every index file: magic, format version and spec hash.
+# The other lines are tab separated records:
+#     O <command or empty> <option name> <0 | 1 | C choice...>
+#     C <command name or alias> <command>
+INDEX_MAGIC = 'friendly-arguments-completion'
+INDEX_FORMAT = 1
+
+# Kinds of option in an index: no value, a free value, or a list of choices
+FLAG = 0
+VALUE = 1
+
+
+def format_index(index: Dict[str, Any]) -> str:
+    """Serialize an index built by build_index() into its record lines."""
+    specs = [('', index.get('options', {}))] + sorted(index.get('specs', {}).items())
+    lines = []
+    for alias, command in sorted(index.get('commands', {}).items()):
+        lines.append(f'C\t{alias}\t{command}')
+    for command, options in specs:
+        for name, kind in sorted(options.items()):
+            if isinstance(kind, list):
+                # Values that can't be typed in a shell word are left out
+                kind = '\t'.join(['C'] + [value for value in kind
+                                           if '\t' not in value and '\n' not in value])
+            lines.append(f'O\t{command}\t{name}\t{kind}')
+    return '\n'.join(lines) + '\n'
+
+
+def read_index(path: str) -> Optional[Dict[str, Any]]:
+    """Return the index stored at `path`, or None if it's missing or invalid."""
+    try:
+        with open(path, encoding='utf-8') as file:
+            header = file.readline().split()
+            if header[:2] != [INDEX_MAGIC, str(INDEX_FORMAT)]:
+                return None
+            lines = file.read().splitlines()
+    except (OSError, ValueError):
+        return None
+
+    options: Dict[str, Any] = {}
+    commands: Dict[str, str] = {}
+    specs: Dict[str, Dict[str, Any]] = {}
+    for line in lines:
+        fields = line.split('\t')
+        if fields[0] == 'C' and len(fields) == 3:
+            commands[fields[1]] = fields[2]
+            specs.setdefault(fields[2], {})
+        elif fields[0] == 'O' and len(fields) >= 4:
+            if fields[3] == 'C':
+                kind = fields[4:]
+            elif fields[3] in ('0', '1'):
+                kind = int(fields[3])
+            else:
+                return None
+            target = specs.setdefault(fields[1], {}) if fields[1] else options
+            target[fields[2]] = kind
+        else:
+            return None
+
+    if commands:
+        return {'commands': commands, 'specs': specs}
+    return {'options': options}
+
+
+def _resolve_command(commands: Dict[str, str], word: str) -> Optional[str]:
+    """Canonical command for a name, alias or unambiguous abbreviation."""
+    if word in commands:
+        return commands[word]
+    matches = {name for alias, name in commands.items() if alias.startswith(word)}
+    return matches.pop() if len(matches) == 1 else None
+
+
+def _values(kind: Any, prefix: str) -> List[str]:
+    if isinstance(kind, list):
+        return [value for value in kind if value.startswith(prefix)]
+    return []
+
+
+def complete(index: Dict[str, Any], words: Sequence[str], cword: int) -> List[str]:
+    """
+    Return the completions of words[cword].
+
+    Args:
+        index: Index built by friendly_arguments.completion.build_index()
+        words: Command line words, program name first
+        cword: Position of the word being completed
+
+    Returns:
+        Sorted list of candidates
+    """
+    words = list(words[:cword + 1])
+    words += [''] * (cword + 1 - len(words))
+    current = words[cword]
+
+    commands = index.get('commands')
+    options = index.get('options', {})
+    command_found = commands is None
+    expecting = None
+
+    for word in words[1:cword]:
+        if expecting is not None:
+            expecting = None
+        elif word.startswith('-'):
+            if '=' not in word and options.get(word, FLAG) != FLAG:
+                expecting = word
+        elif not command_found:
+            name = _resolve_command(commands, word)
+            if name is not None:
+                options = index['specs'].get(name, {})
+                command_found = True
+
+    if expecting is not None and not current.startswith('-'):
+        return _values(options[expecting], current)
+
+    if current.startswith('-'):
+        if '=' in current:
+            key, _, prefix = current.partition('=')
+            return [f'{key}={value}' for value in _values(options.get(key), prefix)]
+        return sorted(name for name in options if name.startswith(current))
+
+    if not command_found:
+        return sorted(name for name in commands if name.startswith(current))
+    return []
+
+
+def _join_equals(words: List[str], cword: int):
+    """
+    Undo bash's split of '--key=value' into '--key', '=', 'value'.
+
+    Only the words up to the current one matter. Returns (words, cword,
+    split), where split is True when the current word was part of such a
+    split, so bash expects only the value part back.
+    """
+    words = words[:cword + 1]
+    joined: List[str] = []
+    split = False
+    position = 0
+    while position < len(words):
+        word = words[position]
+        split = (word == '=' and bool(joined) and joined[-1].startswith('-')
+                 and '=' not in joined[-1])
+        if split:
+            joined[-1] += '='
+            following = position + 1
+            if following < len(words) and words[following] and not words[following].startswith('-'):
+                joined[-1] += words[following]
+                position = following
+        else:
+            joined.append(word)
+        position += 1
+    return joined, len(joined) - 1, split
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 3:
+        print("usage: complete.py INDEX SHELL CWORD WORD...",
+              file=sys.stderr)
+        return 2
+
+    path, shell, cword, words = argv[0], argv[1], int(argv[2]), list(argv[3:])
+    index = read_index(path)
+    if index is None:
+        return 1
+
+    split = False
+    if shell == 'bash':
+        words, cword, split = _join_equals(words, cword)
+
+    for candidate in complete(index, words, cword):
+        if split:
+            candidate = candidate.partition('=')[2]
+        print(candidate)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
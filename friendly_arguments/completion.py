@@ -0,0 +1,187 @@
+import os
+import re
+import shlex
+import sys
+from typing import Any, Dict, Optional, Union
+
+from .complete import FLAG, INDEX_FORMAT, INDEX_MAGIC, VALUE, format_index
+from .parser import ArgumentError, Option, Parser
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .commands import CommandTable
+
+
+SHELLS = ('bash', 'zsh', 'fish')
+
+# The helper runs as a plain script with -S: neither site-packages nor
+# friendly_arguments itself are imported on each keystroke
+_HELPER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'complete.py')
+
+_BASH_SCRIPT = '''\
+# bash completion for {prog} (generated by friendly_arguments)
+_friendly_arguments_{ident}() {{
+    local IFS=$'\\n'
+    COMPREPLY=($({python} -S {helper} {index} bash "$COMP_CWORD" "${{COMP_WORDS[@]}}" 2>/dev/null))
+}}
+complete -o default -F _friendly_arguments_{ident} {prog}
+'''
+
+_ZSH_SCRIPT = '''\
+#compdef {prog}
+# zsh completion for {prog} (generated by friendly_arguments)
+_friendly_arguments_{ident}() {{
+    local -a candidates
+    candidates=(${{(f)"$({python} -S {helper} {index} zsh $((CURRENT - 1)) "${{words[@]}}" 2>/dev/null)"}})
+    if (( ${{#candidates}} )); then
+        compadd -Q -- "${{candidates[@]}}"
+    else
+        _files
+    fi
+}}
+compdef _friendly_arguments_{ident} {prog}
+'''
+
+_FISH_SCRIPT = '''\
+# fish completion for {prog} (generated by friendly_arguments)
+function __friendly_arguments_{ident}
+    set -l current (commandline -ct)
+    set -l words (commandline -opc) "$current"
+    {python} -S {helper} {index} fish (math (count $words) - 1) $words 2>/dev/null
+end
+complete -c {prog} -a '(__friendly_arguments_{ident})'
+'''
+
+_SCRIPTS = {'bash': _BASH_SCRIPT, 'zsh': _ZSH_SCRIPT, 'fish': _FISH_SCRIPT}
+
+
+def _option_kind(option: Option) -> Any:
+    """FLAG, VALUE or the list of accepted values of an option."""
+    if option.flag:
+        return FLAG
+    if option.type is bool:
+        return ['false', 'true']
+    if option.type is not None:
+        from .converters import choices_for
+        choices = choices_for(option.type)
+        if choices:
+            return list(choices)
+    return VALUE
+
+
+def _options(parser: Optional[Parser]) -> Dict[str, Any]:
+    if parser is None:
+        return {}
+    return {name: _option_kind(option) for option in parser.options for name in option.names}
+
+
+def build_index(spec: Union[Parser, 'CommandTable']) -> Dict[str, Any]:
+    """
+    Return the completion index of a Parser or a CommandTable.
+
+    The index maps every option name and alias to FLAG (0), VALUE (1) or
+    the list of its accepted values (Enum members, true/false for bool),
+    and, for a CommandTable, every command name and alias to its command.
+    Building the index of a CommandTable imports the option specs given as
+    'module:attribute' strings.
+    """
+    if isinstance(spec, Parser):
+        return {'options': _options(spec)}
+
+    return {
+        'commands': {name: command.name for command in spec for name in command.names},
+        'specs': {command.name: _options(command.parser) for command in spec},
+    }
+
+
+def default_index_path(prog: str) -> str:
+    """Index location for a program: $XDG_CACHE_HOME/friendly_arguments/completion/."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'friendly_arguments', 'completion', f'{prog}.index')
+
+
+def _stored_hash(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding='utf-8') as file:
+            header = file.readline().split()
+    except (OSError, ValueError):
+        return None
+    if header[:2] != [INDEX_MAGIC, str(INDEX_FORMAT)] or len(header) < 3:
+        return None
+    return header[2]
+
+
+def write_index(spec: Union[Parser, 'CommandTable'], prog: str,
+                path: Optional[str] = None, force: bool = False) -> str:
+    """
+    Write the completion index of a spec, unless it's already up to date.
+
+    The first line of the file holds the spec's fingerprint(), so calling
+    this on every run of the program costs one hash and one line read, and
+    the index is rewritten only after the options or commands change.
+
+    Example:
+        parser = Parser([...])
+        write_index(parser, 'mytool')  # keeps the index current
+        args = parser.parse()
+
+    Args:
+        spec: Parser or CommandTable of the program
+        prog: Program name, as typed in the shell
+        path: Index file (default: default_index_path(prog))
+        force: Rewrite the index even if the fingerprint didn't change
+
+    Returns:
+        Path of the index file
+    """
+    if path is None:
+        path = default_index_path(prog)
+    fingerprint = spec.fingerprint()
+    if not force and _stored_hash(path) == fingerprint:
+        return path
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as file:
+        file.write(f'{INDEX_MAGIC} {INDEX_FORMAT} {fingerprint}\n')
+        file.write(format_index(build_index(spec)))
+    # Completions running meanwhile see the old or the new index, never half
+    os.replace(temporary, path)
+    return path
+
+
+def completion_script(shell: str, prog: str, index_path: Optional[str] = None,
+                      python: Optional[str] = None) -> str:
+    """
+    Return the bash, zsh or fish script that completes `prog`.
+
+    The script runs the friendly_arguments/complete.py helper, which
+    answers from the index file without importing the program. Keep the
+    index current with write_index().
+
+    Example:
+        # mytool --completion bash >> ~/.bashrc
+        if args.get('--completion'):
+            print(completion_script(args['--completion'], 'mytool'))
+
+    Args:
+        shell: 'bash', 'zsh' or 'fish'
+        prog: Program name, as typed in the shell
+        index_path: Index file (default: default_index_path(prog))
+        python: Interpreter that runs the helper (default: sys.executable)
+
+    Returns:
+        Script source
+    """
+    template = _SCRIPTS.get(shell)
+    if template is None:
+        raise ArgumentError(f"Unsupported shell {shell!r}, expected one of {SHELLS}")
+
+    return template.format(
+        prog=shlex.quote(prog),
+        ident=re.sub(r'\W', '_', prog),
+        index=shlex.quote(os.path.abspath(index_path or default_index_path(prog))),
+        python=shlex.quote(python or sys.executable),
+        helper=shlex.quote(_HELPER),
+    )
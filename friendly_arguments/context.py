@@ -0,0 +1,94 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from . import parser as parser_module
+
+# Argument vector of the current thread or asyncio task; None means sys.argv
+_ARGV: ContextVar[Optional[Tuple[str, ...]]] = ContextVar('friendly_arguments.argv', default=None)
+
+# Reset tokens of the blocks entered in this context, innermost first, as
+# nested pairs (token, outer): a block instance can be shared by many tasks
+_RESETS: ContextVar[Tuple[Any, ...]] = ContextVar('friendly_arguments.argv_resets', default=())
+
+# From now on every parse without an explicit argv looks at the context first
+parser_module._argv_var = _ARGV
+
+# inspect.CO_COROUTINE, without importing inspect
+_CO_COROUTINE = 0x80
+
+
+def current_argv() -> Sequence[str]:
+    """Return the argument vector get_args() would parse here: the context's, or sys.argv."""
+    return parser_module._current_argv()
+
+
+class argv_context:
+    """
+    Make get_args(), get_arg() and every parser read `argv` instead of sys.argv.
+
+    The vector is stored in a ContextVar, so it's local to the thread or
+    asyncio task that entered the block: concurrent requests each parse
+    their own command line without a lock, and sys.argv is never touched.
+    Blocks can be nested; leaving one restores the previous vector. One
+    instance can be entered by many threads and tasks at once.
+
+    asyncio tasks inherit the vector of the code that created them. New
+    threads and thread pool workers start without it: enter the block in
+    the worker, or submit `contextvars.copy_context().run`.
+
+    Example:
+        async def handle(line):
+            with argv_context(['bot'] + shlex.split(line)):
+                args = get_args()      # this request's arguments only
+                ...
+
+        @argv_context(['job', '--dry-run'])
+        def job():
+            return get_args()          # {'--dry-run': True}
+
+    Args:
+        argv: Argument vector including the program name
+    """
+
+    __slots__ = ('argv',)
+
+    def __init__(self, argv: Sequence[str]):
+        # A private copy: lazy results read the vector after the block starts
+        self.argv = tuple(argv)
+
+    def __enter__(self) -> Tuple[str, ...]:
+        # The token is kept in the context, not on the instance
+        _RESETS.set((_ARGV.set(self.argv), _RESETS.get()))
+        return self.argv
+
+    def __exit__(self, *exc_info) -> None:
+        token, outer = _RESETS.get()
+        _RESETS.set(outer)
+        _ARGV.reset(token)
+
+    def __call__(self, function: Callable) -> Callable:
+        # Each call sets its own token, so a decorated function can run in
+        # many threads and tasks at once
+        from functools import wraps
+        argv = self.argv
+
+        if function.__code__.co_flags & _CO_COROUTINE:
+            @wraps(function)
+            async def wrapper(*args, **kwargs):
+                token = _ARGV.set(argv)
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    _ARGV.reset(token)
+        else:
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                token = _ARGV.set(argv)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    _ARGV.reset(token)
+        return wrapper
+
+    def __repr__(self) -> str:
+        return f"argv_context({list(self.argv)!r})"
@@ -0,0 +1,164 @@
+from array import array
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+from .parser import ArgumentError
+
+
+# Accepted spellings for type=bool, compared in lower case
+_TRUE = frozenset(('1', 'true', 't', 'yes', 'y', 'on'))
+_FALSE = frozenset(('0', 'false', 'f', 'no', 'n', 'off'))
+
+# array.array type codes used for numeric lists
+_ARRAY_TYPECODES = {int: 'q', float: 'd'}
+
+
+class ListOf:
+    """
+    Type for comma-separated options, e.g. '--ports=80,443'.
+
+    Numeric lists (int or float items) are returned as a compact
+    array.array; other item types are returned as a tuple.
+
+    Example:
+        Option('--ports', type=ListOf(int))        # array('q', [80, 443])
+        Option('--tags', type=ListOf(str, sep=':'))  # ('a', 'b')
+
+    Args:
+        item_type: Type of each item (default: str)
+        sep: Separator between items (default: ',')
+    """
+
+    __slots__ = ('item_type', 'sep')
+
+    def __init__(self, item_type: Any = str, sep: str = ','):
+        if not sep:
+            raise ArgumentError("List separator can't be empty")
+        self.item_type = item_type
+        self.sep = sep
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, ListOf)
+                and (self.item_type, self.sep) == (other.item_type, other.sep))
+
+    def __hash__(self) -> int:
+        return hash((ListOf, self.item_type, self.sep))
+
+    def __repr__(self) -> str:
+        return f"ListOf({_type_name(self.item_type)}, sep={self.sep!r})"
+
+
+def _to_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(value)
+
+
+def _enum_converter(enum_type: type) -> Callable[[str], Enum]:
+    # Members are accepted by name (also in lower case) or by their value
+    table = {}
+    for member in enum_type:
+        table.setdefault(str(member.value), member)
+        table.setdefault(member.name.lower(), member)
+        table[member.name] = member
+
+    def convert(value: str) -> Enum:
+        try:
+            return table[value]
+        except KeyError:
+            member = table.get(value.lower())
+            if member is None:
+                raise ValueError(value) from None
+            return member
+
+    return convert
+
+
+def _list_converter(list_type: ListOf) -> Callable[[str], Any]:
+    item = converter_for(list_type.item_type)
+    sep = list_type.sep
+    typecode = _ARRAY_TYPECODES.get(list_type.item_type)
+
+    if typecode is not None:
+        def convert(value: str) -> array:
+            if not value.strip():
+                return array(typecode)
+            return array(typecode, [item(part) for part in value.split(sep)])
+    else:
+        def convert(value: str) -> Tuple[Any, ...]:
+            if not value.strip():
+                return ()
+            return tuple(item(part.strip()) for part in value.split(sep))
+
+    return convert
+
+
+@lru_cache(maxsize=None)
+def converter_for(value_type: Any) -> Callable[[str], Any]:
+    """
+    Return the precompiled function that converts a string to `value_type`.
+
+    Supported types are int, float, bool ('yes'/'no', 'true'/'false',
+    '1'/'0', 'on'/'off'), Enum subclasses (by member name or value),
+    ListOf(...) and any other callable taking one string, such as
+    pathlib.Path. Converters are built once per type and shared.
+
+    Example:
+        converter_for(int)('8080')  # 8080
+
+    Args:
+        value_type: Declared type of an option
+
+    Returns:
+        Function taking the raw string and returning the converted value
+    """
+    if value_type is bool:
+        return _to_bool
+    if isinstance(value_type, ListOf):
+        return _list_converter(value_type)
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        return _enum_converter(value_type)
+    if not callable(value_type):
+        raise ArgumentError(f"Unsupported option type: {value_type!r}")
+    return value_type
+
+
+def bind_converter(name: str, value_type: Any) -> Callable[[Any], Any]:
+    """
+    Return a converter for option `name` that raises readable ArgumentErrors.
+
+    A value of True (an option given without a value) is kept for bool
+    options and rejected for every other type.
+    """
+    convert = converter_for(value_type)
+
+    def convert_option(value: Any) -> Any:
+        if value is True:
+            if value_type is bool:
+                return True
+            raise ArgumentError(f"Option {name} expects a value of type {_type_name(value_type)}")
+        try:
+            return convert(value)
+        except (ValueError, TypeError, OverflowError) as error:
+            raise ArgumentError(
+                f"Invalid value for {name}: {value!r} is not a valid {_type_name(value_type)}"
+            ) from error
+
+    return convert_option
+
+
+def choices_for(value_type: Any) -> Optional[Tuple[str, ...]]:
+    """Return the accepted spellings of an Enum type, or None for other types."""
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        return tuple(member.name for member in value_type)
+    return None
+
+
+def _type_name(value_type: Any) -> str:
+    if isinstance(value_type, ListOf):
+        return f"list of {_type_name(value_type.item_type)}"
+    return getattr(value_type, '__name__', repr(value_type))
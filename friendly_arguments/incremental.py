@@ -0,0 +1,314 @@
+from itertools import compress, count
+from operator import ne
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .parser import Arguments, ArgumentError, Option, Parser, _MISSING
+
+# Undo log entry value of an occurrence appended to a repeated option
+_APPENDED = object()
+
+
+class IncrementalParser:
+    """
+    Parser state kept between edits of a command line, for interactive use.
+
+    The tokens are parsed one at a time into a running state, and every
+    change a token makes is recorded in an undo log. Appending a token
+    parses only that token; removing or editing the last tokens undoes
+    their changes and parses the new ones, so push(), pop(),
+    replace_last() and truncate() cost O(changed tokens) however long
+    the line is. update() finds the changed tokens itself, with one
+    comparison of the whole line. The state always equals a full
+    parse of the current tokens (Parser.parse() with the program name in
+    front), without the final validation.
+
+    Errors don't interrupt the state: a token whose value can't be
+    converted is recorded in `errors` and leaves the result as if it was
+    missing. `expecting` tells which option is waiting for its value,
+    which is not an error while the line is being typed.
+
+    Example:
+        shell = IncrementalParser(parser)
+        shell.update(['--name', 'Ana', '--port'])
+        shell.expecting        # '--port'
+        shell.update(['--name', 'Ana', '--port', '80'])   # parses '80' only
+        shell.replace_last('81')                           # same, no comparison
+        shell.result           # {'--name': 'Ana', '--port': 81}
+
+    Args:
+        parser: Parser with the declared options (default: get_args() rules)
+        defaults: Optional extra defaults
+    """
+
+    def __init__(self, parser: Optional[Parser] = None,
+                 defaults: Optional[Dict[str, Any]] = None):
+        if parser is None:
+            from .named import _DEFAULT_PARSER as parser
+        self.parser = parser
+        self.defaults = defaults
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every token."""
+        parser = self.parser
+        if parser._lookup is None:
+            parser.compile()
+        self._generation = parser.generation
+        self._base = parser._base_defaults(self.defaults)
+        self._tokens: List[str] = []
+        self._args: Dict[str, Any] = {}
+        self._collected: Dict[str, Any] = {}
+        self._pending: Any = None  # Option, or undeclared name, waiting for a value
+        self._ended = False  # after '--'
+        self._undo: List[Tuple[Dict[str, Any], str, Any]] = []
+        # Per token: undo log position, pending option and '--' state before it
+        self._frames: List[Tuple[int, Any, bool]] = []
+        self._errors: Dict[int, List[str]] = {}  # per token position
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """Tokens parsed so far, without the program name."""
+        return tuple(self._tokens)
+
+    @property
+    def expecting(self) -> Optional[str]:
+        """Canonical name of the option waiting for a value, or None."""
+        pending = self._pending
+        if pending is None or type(pending) is str:
+            return pending
+        return pending.name
+
+    @property
+    def result(self) -> Arguments:
+        """
+        The parse result of the current tokens, as a new Arguments.
+
+        An option still waiting for its value counts as a flag, as it
+        would at the end of a command line.
+        """
+        return self._build()[0]
+
+    @property
+    def errors(self) -> List[str]:
+        """Messages of the invalid tokens, then the validation errors of the result."""
+        errors = [message for position in sorted(self._errors)
+                  for message in self._errors[position]]
+        if self.parser._validator is not None:
+            try:
+                self.parser._validator(*self._build())
+            except ArgumentError as error:
+                errors.extend(getattr(error, 'errors', None) or [str(error)])
+        return errors
+
+    def _build(self) -> Tuple[Arguments, Set[str]]:
+        """The result, and the canonical names given in the tokens."""
+        position = len(self._undo)
+        try:
+            if self._pending is not None:
+                try:
+                    self._store(self._pending, True)
+                except ArgumentError:
+                    pass
+            args = Arguments(self._base, canonical=self.parser._canonical)
+            args.update(self._args)
+            for key, bucket in self._collected.items():
+                # Copies: the buckets keep growing with the next tokens
+                args[key] = tuple(bucket) if type(bucket) is list else (
+                    bucket if type(bucket) is int else bucket[:])
+            given = set(self._args)
+            given.update(self._collected)
+        finally:
+            self._rollback(position)
+        return args, given
+
+    def push(self, token: str) -> None:
+        """Parse one more token at the end of the line."""
+        if self._changed():
+            self.update(self._tokens)  # the options changed: parse again
+        self._frames.append((len(self._undo), self._pending, self._ended))
+        self._tokens.append(token)
+        try:
+            self._step(token)
+        except ArgumentError as error:
+            self._error(str(error))
+
+    def pop(self) -> str:
+        """Remove the last token and undo its changes."""
+        token = self._tokens.pop()
+        position, self._pending, self._ended = self._frames.pop()
+        self._errors.pop(len(self._tokens), None)
+        self._rollback(position)
+        return token
+
+    def update(self, tokens: Sequence[str]) -> None:
+        """
+        Make the state match a new list of tokens.
+
+        The tokens shared with the previous call, from the start, are kept;
+        only the ones after them are undone and parsed again. Finding the
+        shared tokens still compares the whole line, in C and without
+        copies of it (a list is used as is); when the edit is known,
+        replace_last(), push() and truncate() skip that comparison. The
+        result is only built when `result` is read.
+
+        Args:
+            tokens: Every token of the line, without the program name
+        """
+        if self._changed():
+            self.reset()
+        if type(tokens) is not list:
+            tokens = list(tokens)
+        common = self._shared(tokens)
+        self.truncate(common)
+        for token in tokens[common:]:
+            self.push(token)
+
+    def replace_last(self, token: str) -> str:
+        """
+        Replace the last token, as typing in it does; returns the old one.
+
+        Costs the same as pop() and push(), whatever the length of the line.
+        """
+        old = self.pop()
+        self.push(token)
+        return old
+
+    def truncate(self, length: int) -> None:
+        """Keep only the first `length` tokens, undoing the others."""
+        while len(self._tokens) > length:
+            self.pop()
+
+    def _shared(self, tokens: List[str]) -> int:
+        """Number of leading tokens equal to the current ones."""
+        current = self._tokens
+        size = min(len(current), len(tokens))
+        # Usually the line grew or only its last token was edited. Each guess
+        # is checked with one list comparison in C: the current tokens after
+        # it are swapped for the new ones meanwhile, which costs O(changed)
+        for shared in (size, size - 1) if size else ():
+            tail = current[shared:]
+            del current[shared:]
+            current += tokens[shared:]
+            same = current == tokens
+            del current[shared:]
+            current += tail
+            if same:
+                return shared
+        return next(compress(count(), map(ne, current, tokens)), size)
+
+    def _error(self, message: str) -> None:
+        """Record an error of the last token, undone when it's popped."""
+        self._errors.setdefault(len(self._tokens) - 1, []).append(message)
+
+    def _changed(self) -> bool:
+        parser = self.parser
+        return parser._lookup is None or parser.generation != self._generation
+
+    # Changes go through these, which record how to undo them
+
+    def _rollback(self, position: int) -> None:
+        """Undo the changes logged after `position`, newest first."""
+        undo = self._undo
+        while len(undo) > position:
+            target, key, old = undo.pop()
+            if old is _APPENDED:
+                bucket = target[key]
+                bucket.pop()
+                if not bucket:
+                    del target[key]
+            elif old is _MISSING:
+                del target[key]
+            else:
+                target[key] = old
+
+    def _set(self, target: Dict[str, Any], key: str, value: Any) -> None:
+        self._undo.append((target, key, target.get(key, _MISSING)))
+        target[key] = value
+
+    def _store(self, pending: Any, value: Any) -> None:
+        """Store a value (or True) of a declared option or of an undeclared name."""
+        if type(pending) is str:
+            self._set(self._args, pending, value)
+            return
+        option: Option = pending
+        if option.converter is not None and not (value is True and option.flag):
+            value = option.converter(value)
+        if option.action == 'store':
+            self._set(self._args, option.name, value)
+        elif option.action == 'count':
+            if value is not True and type(value) is not int:
+                raise ArgumentError(f"Option {option.name} doesn't take a value")
+            self._set(self._collected, option.name, self._collected.get(option.name, 0) + value)
+        else:
+            collected = self._collected
+            bucket = collected.get(option.name)
+            if bucket is None:
+                bucket = collected[option.name] = option.container()
+            try:
+                bucket.append(value)
+            except (TypeError, OverflowError) as error:
+                if not bucket:
+                    del collected[option.name]
+                raise ArgumentError(f"Invalid value for {option.name}: {value!r}") from error
+            self._undo.append((collected, option.name, _APPENDED))
+
+    def _step(self, token: str) -> None:
+        """Parse one token, exactly like one iteration of Parser._parse_tokens()."""
+        pending, self._pending = self._pending, None
+        if self._ended:
+            return
+        parser = self.parser
+
+        if parser._is_value(token):
+            if pending is not None:
+                self._store(pending, token)
+            return  # positional arguments are ignored
+        if pending is not None:
+            try:
+                self._store(pending, True)
+            except ArgumentError as error:
+                self._error(str(error))  # the option is invalid, not this token
+
+        if '=' in token:
+            # A declared name before letters: '-name=bob' isn't -n ame=bob
+            key, value = token.split('=', 1)
+            option = parser._lookup.get(key)
+            if option is not None:
+                self._store(option, value)
+                return
+            items = parser._cluster(token) if token[1] in parser._short else None
+            if items is None:
+                self._store(key, value)
+            else:
+                for option, value in items:
+                    self._store(option, value)
+            return
+
+        option = parser._lookup.get(token)
+        if option is not None:
+            if option.flag:
+                self._store(option, True)
+            else:
+                self._pending = option
+            return
+
+        if token == '--':
+            self._ended = True
+            return
+
+        option = parser._short.get(token[1])
+        if option is not None and not option.flag:
+            self._store(option, token[2:])  # attached short value: -n5
+            return
+        items = parser._cluster(token) if option is not None else None
+        if items is None:
+            self._pending = token
+        else:
+            for option, value in items:
+                if value is _MISSING:
+                    self._pending = option
+                else:
+                    self._store(option, value)
+
+    def __repr__(self) -> str:
+        return f"IncrementalParser(tokens={len(self._tokens)}, expecting={self.expecting!r})"
@@ -0,0 +1,320 @@
+import copy
+import threading
+import weakref
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+from . import parser as parser_module
+from .parser import Arguments, ArgumentError, Parser
+
+
+# Hook events and the arguments their callbacks receive
+_EVENTS = (
+    'pre_parse',   # callback(parser, argv)
+    'token',       # callback(token)
+    'post_parse',  # callback(event: ParseEvent)
+)
+
+
+class ParseEvent:
+    """
+    Measurements of a single parse, passed to 'post_parse' hooks.
+
+    Attributes:
+        parser: Parser that handled the command line
+        argv: Argument vector that was parsed (the command line string
+              for parse_string() and parse_strings())
+        tokens: Number of tokens read, after response file expansion
+                (0 for cache hits)
+        duration: Wall time of the parse in seconds
+        conversions: Number of values converted by typed options
+        conversion_time: Seconds spent in those conversions
+        cache_hit: True if the result came from a ParseCache
+        error: Exception raised by the parse, or None
+    """
+
+    __slots__ = ('parser', 'argv', 'tokens', 'duration', 'conversions',
+                 'conversion_time', 'cache_hit', 'error')
+
+    def __init__(self, parser: Parser, argv: Sequence[str], tokens: int = 0,
+                 duration: float = 0.0, conversions: int = 0, conversion_time: float = 0.0,
+                 cache_hit: bool = False, error: Optional[BaseException] = None):
+        self.parser = parser
+        self.argv = argv
+        self.tokens = tokens
+        self.duration = duration
+        self.conversions = conversions
+        self.conversion_time = conversion_time
+        self.cache_hit = cache_hit
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (f"ParseEvent(tokens={self.tokens}, duration={self.duration:.6f}, "
+                f"conversions={self.conversions}, cache_hit={self.cache_hit})")
+
+
+class ParseStats:
+    """
+    Running totals of every parse, usable as a 'post_parse' hook.
+
+    Example:
+        stats = ParseStats()
+        add_hook('post_parse', stats)
+        args = get_args()
+        stats.as_dict()  # {'parses': 1, 'tokens': 3, 'parse_time': 1.2e-05, ...}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, event: ParseEvent) -> None:
+        with self._lock:
+            if event.cache_hit:
+                self.cache_hits += 1
+                return
+            self.parses += 1
+            self.tokens += event.tokens
+            self.parse_time += event.duration
+            self.conversions += event.conversions
+            self.conversion_time += event.conversion_time
+            if event.error is not None:
+                self.errors += 1
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        self.parses = 0
+        self.tokens = 0
+        self.parse_time = 0.0
+        self.conversions = 0
+        self.conversion_time = 0.0
+        self.cache_hits = 0
+        self.errors = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dict, ready for a metrics client."""
+        return {
+            'parses': self.parses,
+            'tokens': self.tokens,
+            'parse_time': self.parse_time,
+            'conversions': self.conversions,
+            'conversion_time': self.conversion_time,
+            'cache_hits': self.cache_hits,
+            'errors': self.errors,
+        }
+
+    def __repr__(self) -> str:
+        counters = ', '.join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"ParseStats({counters})"
+
+
+class _ConversionTimer:
+    """Accumulated time of the converters of one instrumented parser copy."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self.calls = 0
+
+    def wrap(self, convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def timed(value: Any) -> Any:
+            start = perf_counter()
+            try:
+                return convert(value)
+            finally:
+                self.elapsed += perf_counter() - start
+                self.calls += 1
+        return timed
+
+
+class _Instrumentation:
+    """Registered hooks; installed in parser._instrumentation while not empty."""
+
+    def __init__(self):
+        self.hooks: Dict[str, tuple] = {event: () for event in _EVENTS}
+        self._lock = threading.Lock()
+        # Copy of each typed parser whose converters are timed, per generation
+        self._timed = weakref.WeakKeyDictionary()
+
+    def add(self, event: str, callback: Callable) -> None:
+        if event not in self.hooks:
+            raise ArgumentError(f"Unknown hook event {event!r}, expected one of {_EVENTS}")
+        with self._lock:
+            # Tuples are replaced, never changed, so running parses aren't affected
+            self.hooks[event] += (callback,)
+            parser_module._instrumentation = self
+
+    def remove(self, event: str, callback: Callable) -> None:
+        with self._lock:
+            hooks = list(self.hooks.get(event, ()))
+            if callback not in hooks:
+                raise ValueError(f"{callback!r} is not registered for {event!r}")
+            hooks.remove(callback)
+            self.hooks[event] = tuple(hooks)
+            if not any(self.hooks.values()):
+                parser_module._instrumentation = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self.hooks = {event: () for event in _EVENTS}
+            parser_module._instrumentation = None
+
+    def _timed_parser(self, parser: Parser):
+        """Return (parser copy with timed converters, its timer), or (parser, None)."""
+        if not any(option.converter is not None for option in parser.options):
+            return parser, None
+
+        cached = self._timed.get(parser)
+        if cached is None or cached[0] != parser.generation:
+            timed = Parser([copy.copy(option) for option in parser.options])
+            timed._exclusive = list(parser._exclusive)
+            timed.compile()
+            timer = _ConversionTimer()
+            for option in timed.options:
+                if option.converter is not None:
+                    option.converter = timer.wrap(option.converter)
+            cached = self._timed[parser] = (parser.generation, timed, timer)
+        return cached[1], cached[2]
+
+    @contextmanager
+    def observe(self, parser: Parser, argv: Any) -> Iterator[tuple]:
+        """
+        Report the parse made inside a with block, for any entry point.
+
+        Yields (timed parser, counted): the block parses with the timed
+        copy of `parser` and passes its tokens through counted(tokens).
+        """
+        hooks = self.hooks
+        for callback in hooks['pre_parse']:
+            callback(parser, argv)
+
+        timed, timer = self._timed_parser(parser)
+        conversions, conversion_time = (timer.calls, timer.elapsed) if timer else (0, 0.0)
+        count = [0]
+        token_hooks = hooks['token']
+        event = ParseEvent(parser, argv)
+
+        start = perf_counter()
+        try:
+            yield timed, lambda tokens: _counted(tokens, count, token_hooks)
+        except BaseException as error:
+            event.error = error
+            raise
+        finally:
+            event.duration = perf_counter() - start
+            event.tokens = count[0]
+            if timer is not None:
+                # Parses of the same parser in other threads may add to these
+                event.conversions = timer.calls - conversions
+                event.conversion_time = timer.elapsed - conversion_time
+            for callback in hooks['post_parse']:
+                callback(event)
+
+    def parse(self, parser: Parser, argv: Sequence[str], defaults: Optional[Dict[str, Any]],
+              response_files: bool) -> Arguments:
+        """Instrumented version of Parser.parse(), called once hooks exist."""
+        with self.observe(parser, argv) as (timed, counted):
+            args = Arguments(parser._base_defaults(defaults), canonical=parser._canonical)
+            tokens = iter(argv)
+            next(tokens, None)  # skip the program name
+            if response_files:
+                from .response_files import expand_response_files
+                tokens = expand_response_files(tokens)
+            timed._parse_tokens(counted(tokens), args)
+        return args
+
+    def parse_tokens(self, parser: Parser, argv: Any, tokens: Iterator[str],
+                     args: Dict[str, Any]) -> None:
+        """Instrumented parser._parse_tokens(tokens, args) of one argv."""
+        with self.observe(parser, argv) as (timed, counted):
+            timed._parse_tokens(counted(tokens), args)
+
+    def cache_hit(self, parser: Parser, argv: Sequence[str]) -> None:
+        """Report a result served by a ParseCache without parsing."""
+        event = ParseEvent(parser, argv, cache_hit=True)
+        for callback in self.hooks['post_parse']:
+            callback(event)
+
+
+def _counted(tokens: Iterator[str], count: list, hooks: tuple) -> Iterator[str]:
+    for token in tokens:
+        count[0] += 1
+        for callback in hooks:
+            callback(token)
+        yield token
+
+
+_registry = _Instrumentation()
+
+
+def add_hook(event: str, callback: Callable) -> None:
+    """
+    Register a callback around the parses of the command line.
+
+    Each of these reports one parse (one per argv or line for the batch
+    functions): Parser.parse() and get_args(), parse_record(), parse_many()
+    and parse_records(), parse_bytes(), parse_string() and parse_strings()
+    (argv is the string), layered_args() (including its environment and
+    config layers) and ParseCache hits. parse_lazy() and get_args(lazy=True)
+    parse on lookup, IncrementalParser on each edit and process_manifest()
+    in its workers, so they report nothing; process_manifest() has its own
+    BatchStats.
+
+    While no hook is registered the parser runs exactly as without this
+    module: each entry point checks a single module attribute per call and
+    the token loop is untouched. Once a hook exists, tokens are counted
+    through a generator and the converters of typed options are timed.
+
+    Events:
+        'pre_parse':  callback(parser, argv), before parsing starts
+        'token':      callback(token), for every token read (bytes
+                      in parse_bytes())
+        'post_parse': callback(event), with a ParseEvent, also for
+                      ParseCache hits and for parses that raised
+
+    Example:
+        def report(event):
+            metrics.timing('cli.parse', event.duration)
+
+        add_hook('post_parse', report)
+
+    Args:
+        event: 'pre_parse', 'token' or 'post_parse'
+        callback: Function to call
+    """
+    _registry.add(event, callback)
+
+
+def remove_hook(event: str, callback: Callable) -> None:
+    """Unregister a callback added with add_hook()."""
+    _registry.remove(event, callback)
+
+
+def clear_hooks() -> None:
+    """Unregister every hook, restoring the uninstrumented parser."""
+    _registry.clear()
+
+
+@contextmanager
+def collect_stats(stats: Optional[ParseStats] = None) -> Iterator[ParseStats]:
+    """
+    Collect ParseStats for the parses made inside a with block.
+
+    Example:
+        with collect_stats() as stats:
+            main()
+        print(stats.parse_time, stats.tokens, stats.cache_hits)
+
+    Args:
+        stats: Existing ParseStats to add to (default: a new one)
+
+    Returns:
+        Context manager yielding the ParseStats
+    """
+    if stats is None:
+        stats = ParseStats()
+    add_hook('post_parse', stats)
+    try:
+        yield stats
+    finally:
+        remove_hook('post_parse', stats)
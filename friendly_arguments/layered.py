@@ -0,0 +1,323 @@
+import os
+import threading
+from collections import ChainMap
+from collections.abc import Mapping
+from contextlib import nullcontext
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Optional, Sequence, Tuple
+
+from . import parser as parser_module
+from .parser import Arguments, ArgumentError, Option, Parser, _collect, _current_argv
+
+
+def option_key(name: str) -> str:
+    """
+    Normalize a config or environment name to an option key.
+
+    Example:
+        option_key('log_level')    # '--log-level'
+        option_key('--log-level')  # '--log-level'
+    """
+    if name.startswith('-'):
+        return name
+    return '--' + name.lower().replace('_', '-')
+
+
+def environment_name(prefix: str, key: str) -> str:
+    """
+    Return the environment variable that holds an option.
+
+    Example:
+        environment_name('APP_', '--log-level')  # 'APP_LOG_LEVEL'
+    """
+    return prefix + key.lstrip('-').replace('-', '_').upper()
+
+
+class EnvironmentLayer(Mapping):
+    """
+    Live, read-only view of the environment variables with a prefix.
+
+    Keys are option names: with prefix 'APP_', '--log-level' reads
+    APP_LOG_LEVEL. Nothing is copied, so changes to os.environ are seen
+    on the next lookup.
+
+    Args:
+        prefix: Prefix of the environment variables (e.g., 'APP_')
+        environ: Mapping to read from (default: os.environ)
+    """
+
+    def __init__(self, prefix: str, environ: Optional[Mapping] = None):
+        self.prefix = prefix
+        self.environ = os.environ if environ is None else environ
+
+    def __getitem__(self, key: str) -> str:
+        return self.environ[environment_name(self.prefix, key)]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and environment_name(self.prefix, key) in self.environ
+
+    def __iter__(self) -> Iterator[str]:
+        prefix = self.prefix
+        for name in list(self.environ):
+            if name.startswith(prefix) and len(name) > len(prefix):
+                yield option_key(name[len(prefix):])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class ConfigCache:
+    """
+    Cache of parsed config files, re-read only when they change.
+
+    Each lookup costs one os.stat(); the file is parsed again only when its
+    modification time or size differ from the cached copy.
+
+    Supported formats, by extension: .json, .toml (Python 3.11+ or the
+    tomli package) and .ini/.cfg/.conf.
+    """
+
+    def __init__(self):
+        self.reads = 0
+        self._files: Dict[Tuple[str, Optional[str]], Tuple[int, int, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str, section: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the options of a config file, keyed by option names.
+
+        Args:
+            path: Config file path
+            section: Section (INI) or table (JSON/TOML) to read; by default
+                     the top level, or every INI section in file order
+
+        Returns:
+            Dictionary of options (shared, don't modify it)
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError as error:
+            raise ArgumentError(f"Can't read config file {path!r}: {error.strerror}") from error
+
+        key = (path, section)
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+
+        options = _read_config(path, section)
+        with self._lock:
+            self._files[key] = (stat.st_mtime_ns, stat.st_size, options)
+            self.reads += 1
+        return options
+
+    def clear(self) -> None:
+        """Forget every cached file and reset the read counter."""
+        with self._lock:
+            self._files.clear()
+            self.reads = 0
+
+
+# Process-wide cache used by layered_args()
+config_cache = ConfigCache()
+
+
+def _read_config(path: str, section: Optional[str]) -> Dict[str, Any]:
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        if extension == '.json':
+            import json
+            with open(path, 'rb') as file:
+                data = json.load(file)
+        elif extension == '.toml':
+            data = _read_toml(path)
+        elif extension in ('.ini', '.cfg', '.conf'):
+            return _read_ini(path, section)
+        else:
+            raise ArgumentError(f"Unsupported config file format: {path!r}")
+    except ValueError as error:
+        if isinstance(error, ArgumentError):
+            raise
+        raise ArgumentError(f"Invalid config file {path!r}: {error}") from error
+
+    if section is not None:
+        data = data.get(section, {}) if isinstance(data, dict) else None
+    if not isinstance(data, dict):
+        raise ArgumentError(f"Config file {path!r} must contain a table of options")
+    return {option_key(name): value for name, value in data.items()}
+
+
+def _read_toml(path: str) -> Any:
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ArgumentError("Reading TOML files needs Python 3.11+ or the tomli package") from None
+    with open(path, 'rb') as file:
+        return tomllib.load(file)
+
+
+def _read_ini(path: str, section: Optional[str]) -> Dict[str, Any]:
+    import configparser
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = str  # keep the case of the keys
+    try:
+        with open(path, encoding='utf-8') as file:
+            parser.read_file(file)
+    except configparser.Error as error:
+        raise ArgumentError(f"Invalid config file {path!r}: {error}") from error
+
+    sections = [section] if section is not None else parser.sections()
+    options: Dict[str, Any] = {}
+    for name in sections:
+        if parser.has_section(name):
+            options.update((option_key(key), value) for key, value in parser.items(name))
+    return options
+
+
+class _TypedLayer(Mapping):
+    """
+    Give the values of another layer the form they have on the command line.
+
+    Text values go through the parser's converters. Values of repeated
+    options are collected like their occurrences in argv: an append option
+    gets the same container ('a' becomes ('a',), a list one item per
+    element), and a count option adds up True or ints and refuses text.
+    """
+
+    def __init__(self, layer: Mapping, parser: Parser):
+        self.layer = layer
+        self.lookup = parser._lookup
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.layer[key]
+        option = self.lookup.get(key)
+        if option is None:
+            return value
+        if option.action == 'store':
+            return self._convert(option, value)
+
+        collected: Dict[str, Any] = {}
+        for item in value if isinstance(value, (list, tuple)) else (value,):
+            _collect(collected, option, self._convert(option, item))
+        bucket = collected.get(option.name)
+        if bucket is None:  # an empty list
+            return 0 if option.action == 'count' else ()
+        return tuple(bucket) if type(bucket) is list else bucket
+
+    @staticmethod
+    def _convert(option: Option, value: Any) -> Any:
+        if option.converter is not None and isinstance(value, str):
+            return option.converter(value)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.layer
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.layer)
+
+    def __len__(self) -> int:
+        return len(self.layer)
+
+
+class LayeredArguments(ChainMap):
+    """
+    ChainMap of argument sources, from the highest priority to the lowest.
+
+    Layers are never copied or merged: each lookup walks them in order.
+
+    Attributes:
+        names: Name of each layer, parallel to `maps`
+        canonical: Alias table of the parser, used by lookup() and get_arg()
+    """
+
+    def __init__(self, *maps: Mapping, names: Sequence[str] = (),
+                 canonical: Optional[Dict[str, str]] = None):
+        super().__init__(*maps)
+        self.names = tuple(names)
+        self.canonical = canonical if canonical is not None else {}
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Get a value by canonical name or by any declared alias."""
+        return self.get(self.canonical.get(key, key), default)
+
+    def source(self, key: str) -> Optional[str]:
+        """Return the name of the layer that provides `key`, or None."""
+        key = self.canonical.get(key, key)
+        for name, layer in zip(self.names, self.maps):
+            if key in layer:
+                return name
+        return None
+
+
+def layered_args(argv: Optional[Sequence[str]] = None, parser: Optional[Parser] = None,
+                 env_prefix: Optional[str] = None, config: Optional[str] = None,
+                 defaults: Optional[Dict[str, Any]] = None, section: Optional[str] = None,
+                 environ: Optional[Mapping] = None) -> LayeredArguments:
+    """
+    Resolve options from argv, environment variables, a config file and defaults.
+
+    Sources are overlaid without copying, in this priority order:
+    command line > environment variables > config file > defaults.
+    Config files are cached and only parsed again when their mtime or size
+    change, so calling layered_args() often is cheap. Text values from the
+    environment and INI files go through the parser's type converters.
+
+    Example:
+        # APP_PORT=9000 python server.py --host 0.0.0.0
+        args = layered_args(parser=parser, env_prefix='APP_', config='server.toml')
+        args['--port']         # 9000 (from the environment)
+        args.source('--port')  # 'env'
+
+    Args:
+        argv: Argument vector including the program name (default: sys.argv)
+        parser: Parser to use (default: no declared options)
+        env_prefix: Prefix of the environment variables; None disables them
+        config: Optional config file path (.json, .toml, .ini)
+        defaults: Optional extra defaults
+        section: Section or table of the config file to read
+        environ: Environment mapping (default: os.environ)
+
+    Returns:
+        LayeredArguments mapping
+    """
+    if parser is None:
+        parser = Parser()
+    if parser._lookup is None:
+        parser.compile()
+
+    if argv is None:
+        argv = _current_argv()
+    instrumentation = parser_module._instrumentation
+    # Without hooks, the parser itself and no token counting
+    observed = (nullcontext((parser, iter)) if instrumentation is None
+                else instrumentation.observe(parser, argv))
+
+    with observed as (timed, counted):
+        # Only options given on the command line: defaults are the last layer
+        given = Arguments(canonical=parser._canonical)
+        tokens = iter(argv)
+        next(tokens, None)  # skip the program name
+        timed._parse_tokens(counted(tokens), given, validate=False)
+
+        maps = [given]
+        names = ['argv']
+        if env_prefix is not None:
+            maps.append(_TypedLayer(EnvironmentLayer(env_prefix, environ), parser))
+            names.append('env')
+        if config is not None:
+            maps.append(_TypedLayer(config_cache.load(config, section), parser))
+            names.append('config')
+        maps.append(MappingProxyType(parser._base_defaults(defaults)))
+        names.append('defaults')
+
+        result = LayeredArguments(*maps, names=names, canonical=parser._canonical)
+        if parser._validator is not None:
+            # Constraints apply to the resolved values, whatever layer gave them
+            # except the defaults
+            parser._validator(result, ChainMap(*maps[:-1]))
+    return result
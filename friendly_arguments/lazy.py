@@ -0,0 +1,209 @@
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+from .parser import Arguments, Parser, _MISSING
+
+
+class LazyArguments(Mapping):
+    """
+    Read-only mapping that parses the command line on demand.
+
+    Since the last occurrence of an option wins, the argument vector is
+    scanned backwards: the first time a key shows up in that scan its value
+    is already final, so a lookup stops as soon as the key is found and
+    everything scanned so far is memoized for the next lookups. Only missing
+    keys, iteration and len() need the whole vector.
+
+    Options with an 'append' or 'count' action depend on every occurrence,
+    so looking one of them up finishes the scan.
+
+    The result is always equal to what Parser.parse() returns for the same
+    input, including the key order. The argument vector must not change
+    while the mapping is in use.
+
+    Example:
+        # python script.py --input a.txt ... thousands of arguments ... --help
+        args = get_args(lazy=True)
+        if args.get('--help'):  # only the last few tokens are scanned
+            print_help()
+
+    Args:
+        parser: Compiled parser used to resolve declared options
+        argv: Argument vector including the program name
+        defaults: Defaults keyed by canonical names, used for missing keys
+    """
+
+    __slots__ = ('canonical', '_parser', '_argv', '_defaults', '_position',
+                 '_found', '_first', '_data')
+
+    def __init__(self, parser: Parser, argv: Sequence[str],
+                 defaults: Optional[Dict[str, Any]] = None):
+        if parser._lookup is None:
+            parser.compile()
+        self.canonical = parser._canonical
+        self._parser = parser
+        self._argv = argv
+        self._defaults = parser._base_defaults(defaults)
+        # Next index to scan, going backwards; tokens after '--' are positional
+        try:
+            self._position = argv.index('--', 1) - 1
+        except ValueError:
+            self._position = len(argv) - 1
+        self._found: Dict[str, Any] = {}
+        self._first: Dict[str, Tuple[int, int]] = {}
+        self._data: Optional[Arguments] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        if key in self._parser._accumulating:
+            return self.materialize()[key]
+
+        value = self._found.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._scan(key)
+            if value is _MISSING:
+                return self._data[key]
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"LazyArguments(<{self._position} tokens not scanned>)"
+        return f"LazyArguments({dict(self._data)!r})"
+
+    @property
+    def complete(self) -> bool:
+        """True once the whole argument vector has been scanned."""
+        return self._data is not None
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Get a value by canonical name or by any declared alias."""
+        return self.get(self.canonical.get(key, key), default)
+
+    def materialize(self) -> Arguments:
+        """Finish the scan and return the full Arguments dictionary."""
+        if self._data is None:
+            # The forward loop is faster than finishing the backward scan, and
+            # its result is the same no matter what was memoized already.
+            self._parse_forward()
+        return self._data
+
+    def _scan(self, key: Optional[str]) -> Any:
+        """
+        Scan backwards until `key` is found or the vector is exhausted.
+
+        Returns the value of `key`, or _MISSING after finishing the scan.
+        """
+        argv = self._argv
+        is_value = self._parser._is_value
+        position = self._position
+
+        while position > 0:
+            token = argv[position]
+
+            if is_value(token):
+                # A value belongs to the previous token when that one is an
+                # option still waiting for its value (see Parser._parse_tokens):
+                # this only depends on the two tokens, so the pairing is the
+                # same in both directions. Otherwise it's a positional argument.
+                previous = argv[position - 1] if position > 1 else None
+                if previous is None or is_value(previous):
+                    position -= 1
+                    continue
+                items = self._items(previous)
+                target, value = items[-1]
+                if value is not _MISSING:
+                    position -= 1
+                    continue
+                items[-1] = (target, token)
+                position -= 2
+            else:
+                items = self._items(token)
+                position -= 1
+
+            # Later occurrences win, so the items of a token are recorded
+            # from the last one
+            match = _MISSING
+            for sub in range(len(items) - 1, -1, -1):
+                name, value = self._resolve(*items[sub])
+                if self._record(name, value, (position + 1, sub)) and name == key:
+                    match = value
+            if match is not _MISSING:
+                self._position = position
+                return match
+
+        self._position = 0
+        self._finish()
+        return _MISSING
+
+    def _items(self, token: str) -> List[Tuple[Any, Any]]:
+        """
+        Split an option token into (option or undeclared name, value) pairs.
+
+        The value of the last pair is _MISSING when it takes the next token.
+        """
+        parser = self._parser
+        option = parser._lookup.get(token)
+        if option is not None:
+            return [(option, True if option.flag else _MISSING)]
+        if '=' in token:
+            # A declared name before letters: '-name=bob' isn't -n ame=bob
+            name, value = token.split('=', 1)
+            option = parser._lookup.get(name)
+            if option is not None:
+                return [(option, value)]
+        items = parser._cluster(token) if token[1] in parser._short else None
+        if items is not None:
+            return items
+        if '=' in token:
+            return [(name, value)]
+        return [(token, _MISSING)]
+
+    @staticmethod
+    def _resolve(target: Any, value: Any) -> Tuple[str, Any]:
+        """Return the key and the final value of a pair from _items()."""
+        if value is _MISSING:
+            value = True  # not followed by a value
+        if type(target) is str:
+            return target, value
+        if target.converter is not None and not (value is True and target.flag):
+            value = target.converter(value)
+        return target.name, value
+
+    def _record(self, name: str, value: Any, index: Tuple[int, int]) -> bool:
+        """Remember an occurrence; True if it's the final value of `name`."""
+        if name in self._parser._accumulating:
+            return False  # collected by the forward pass in _finish()
+        self._first[name] = index
+        if name in self._found:
+            return False
+        self._found[name] = value
+        return True
+
+    def _parse_forward(self) -> None:
+        data = Arguments(self._defaults, canonical=self.canonical)
+        tokens = iter(self._argv)
+        next(tokens, None)  # skip the program name
+        self._parser._parse_tokens(tokens, data)
+        self._data = data
+        self._position = 0
+
+    def _finish(self) -> None:
+        """Build the full result with the same key order as Parser.parse()."""
+        if self._parser._accumulating:
+            self._parse_forward()
+            return
+
+        data = Arguments(self._defaults, canonical=self.canonical)
+        found = self._found
+        for name in sorted(found, key=self._first.__getitem__):
+            data[name] = found[name]
+        if self._parser._validator is not None:
+            self._parser._validator(data, found)
+        self._data = data
@@ -1,15 +1,30 @@
-import sys
-from typing import Dict, Any, Optional
+from __future__ import annotations
 
+from .parser import ArgumentError, Parser, _current_argv
 
-def get_args(defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+# Annotations are never evaluated at runtime: importing typing would cost
+# more than the rest of the package (see benchmarks/bench_import.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Any, Iterable, Mapping, Optional, Sequence, Tuple, Union
+
+
+# Parser without declared options, used by get_args()
+_DEFAULT_PARSER = Parser()
+
+
+def get_args(defaults: Optional[Dict[str, Any]] = None,
+             argv: Optional[Sequence[str]] = None,
+             response_files: bool = False,
+             lazy: bool = False) -> Mapping[str, Any]:
     """
     Parse command line arguments in a simple and flexible way.
     
     Supports multiple syntaxes:
     - --arg=value or -a=value
-    - --arg value or -a value
+    - --arg value or -a value (negative numbers are values: --offset -5)
     - --flag (returns True for boolean flags)
+    - -- (everything after it is positional, and ignored)
     
     Example usage:
         # python script.py --name João --age 25 --verbose
@@ -22,36 +37,40 @@ def get_args(defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         args = get_args(defaults={'--name': 'Anonymous', '--age': '18'})
         print(args['--name'])  # 'Anonymous' if not provided
     
+    Example with an explicit argument vector:
+        args = get_args(argv=['script.py', '--name', 'Ana'])
+    
+    Example with response files (one argument per line):
+        # python script.py @args.txt --verbose
+        args = get_args(response_files=True)
+    
+    Example with lazy parsing (only scans as far as each lookup needs):
+        args = get_args(lazy=True)
+        if args.get('--help'):
+            ...
+    
+    For declared options, aliases and flags, use a Parser, which
+    get_args() is a thin wrapper over.
+    
     Args:
         defaults: Optional dictionary with default values
+        argv: Argument vector to parse, including the program name
+              (default: sys.argv, or the vector of the enclosing
+              argv_context block)
+        response_files: If True, expand '@file' tokens (default: False)
+        lazy: If True, return a read-only LazyArguments mapping that parses
+              on demand instead of a dictionary (default: False)
     
     Returns:
-        Dictionary with parsed arguments
+        Dictionary with parsed arguments (or a LazyArguments mapping)
     """
-    args = defaults.copy() if defaults else {}
-    i = 1
-    
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        
-        # Handle --arg=value or -a=value
-        if '=' in arg:
-            key, value = arg.split('=', 1)
-            args[key] = value
-        
-        # Handle --arg or -a
-        elif arg.startswith('-'):
-            # Check if next item exists and is not another argument
-            if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith('-'):
-                args[arg] = sys.argv[i + 1]
-                i += 1
-            else:
-                # Boolean flag
-                args[arg] = True
-        
-        i += 1
-    
-    return args
+    if argv is None:
+        argv = _current_argv()
+    if lazy:
+        if response_files:
+            raise ArgumentError("Lazy parsing can't be combined with response files")
+        return _DEFAULT_PARSER.parse_lazy(argv, defaults)
+    return _DEFAULT_PARSER.parse(argv, defaults, response_files)
 
 
 def get_arg(args: dict, *keys, default=None):
@@ -59,6 +78,9 @@ def get_arg(args: dict, *keys, default=None):
     Get an argument value by searching multiple possible key names.
     Useful for supporting both long and short argument names.
     
+    When `args` comes from Parser.parse(), each key is resolved through the
+    parser's alias table, so any declared alias finds the canonical value.
+    
     Example:
         args = get_args()
         # Search for --name or -n, return 'Anonymous' if not found
@@ -75,14 +97,121 @@ def get_arg(args: dict, *keys, default=None):
     Returns:
         The value of the first matching key, or default if not found
     """
+    canonical = getattr(args, 'canonical', None)
     for key in keys:
+        if canonical:
+            key = canonical.get(key, key)
         if key in args:
             return args[key]
     return default
 
 
+class KeyIndex:
+    """
+    Precompiled lookup table for the keys of get_params_sys_args().
+    
+    Matching an argument against the index costs time proportional to the
+    length of the argument instead of the number of keys. Keys in the usual
+    form '--name=' are resolved by an exact lookup on the text up to and
+    including the first '='. Any other key shape falls back to a character
+    trie, so the results are always the same as checking every key with
+    str.startswith() in order (the first matching key wins).
+    
+    Example:
+        index = KeyIndex(['--text=', '--name='])
+        index.match('--text=hello')  # '--text='
+        index.match('--other=1')     # None
+    
+    Args:
+        keys: Expected keys, in priority order
+    """
+    
+    __slots__ = ('keys', '_exact', '_trie')
+    
+    def __init__(self, keys: Iterable[str]):
+        self.keys: Tuple[str, ...] = tuple(keys)
+        self._exact: Dict[str, str] = {}
+        self._trie: Optional[dict] = None
+        
+        if all(key.endswith('=') and key.find('=') == len(key) - 1 for key in self.keys):
+            for key in self.keys:
+                self._exact.setdefault(key, key)
+            return
+        
+        # Each trie node maps a character to the next node. The empty string
+        # marks the end of a key and stores the position of the first key
+        # ending there, which is what decides the winner between prefixes.
+        self._trie = {}
+        for position, key in enumerate(self.keys):
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node.setdefault('', position)
+    
+    def match(self, arg: str) -> Optional[str]:
+        """
+        Return the first key that prefixes `arg`, or None if no key matches.
+        """
+        if self._trie is None:
+            separator = arg.find('=')
+            if separator < 0:
+                return None
+            return self._exact.get(arg[:separator + 1])
+        
+        node = self._trie
+        best = node.get('')
+        for char in arg:
+            node = node.get(char)
+            if node is None:
+                break
+            position = node.get('')
+            if position is not None and (best is None or position < best):
+                best = position
+        
+        return None if best is None else self.keys[best]
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def __repr__(self) -> str:
+        return f"KeyIndex({list(self.keys)!r})"
+
+
+# Compiled indexes by key list, oldest first (see compile_keys)
+_KEY_INDEXES: Dict[Tuple[str, ...], KeyIndex] = {}
+_KEY_INDEXES_SIZE = 32
+
+
+def compile_keys(keys: Iterable[str]) -> KeyIndex:
+    """
+    Build (or reuse) the KeyIndex for a list of keys.
+    
+    Indexes are cached per distinct key list, so calling get_params_sys_args()
+    repeatedly with the same keys only compiles them once.
+    
+    Example:
+        index = compile_keys(['--text=', '--name='])
+        args = get_params_sys_args(index)
+    
+    Args:
+        keys: Expected keys, in priority order
+    
+    Returns:
+        The compiled KeyIndex
+    """
+    if isinstance(keys, KeyIndex):
+        return keys
+    keys = tuple(keys)
+    index = _KEY_INDEXES.get(keys)
+    if index is None:
+        if len(_KEY_INDEXES) >= _KEY_INDEXES_SIZE:
+            del _KEY_INDEXES[next(iter(_KEY_INDEXES))]
+        index = _KEY_INDEXES[keys] = KeyIndex(keys)
+    return index
+
+
 # Backward compatibility: keep the old function name
-def get_params_sys_args(keys: list, silent: bool = True) -> Dict[str, str]:
+def get_params_sys_args(keys: Union[list, KeyIndex], silent: bool = True) -> Dict[str, str]:
     """
     Legacy function for backward compatibility.
     
@@ -96,21 +225,23 @@ def get_params_sys_args(keys: list, silent: bool = True) -> Dict[str, str]:
     
     Args:
         keys: List of expected keys with '=' suffix (e.g., ['--text=', '--name='])
+              or a KeyIndex built by compile_keys()
         silent: If True, doesn't print values (default: True)
     
     Returns:
         Dictionary with found arguments
     """
     args_dict = {}
-    
-    for i in range(1, len(sys.argv)):
-        for key in keys:
-            if sys.argv[i].startswith(key):
-                value = sys.argv[i][len(key):]
-                args_dict[key] = value
-                
-                if not silent:
-                    print(f"The {key} value is: {value}")
-                break
-    
-    return args_dict
\ No newline at end of file
+    match = compile_keys(keys).match
+    argv = _current_argv()
+    
+    for i in range(1, len(argv)):
+        key = match(argv[i])
+        if key is not None:
+            value = argv[i][len(key):]
+            args_dict[key] = value
+            
+            if not silent:
+                print(f"The {key} value is: {value}")
+    
+    return args_dict
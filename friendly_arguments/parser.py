@@ -0,0 +1,746 @@
+from __future__ import annotations
+
+import sys
+
+# Annotations are never evaluated at runtime: importing typing would cost
+# more than the rest of the package (see benchmarks/bench_import.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+    from .lazy import LazyArguments
+    from .record import Record
+
+
+class ArgumentError(ValueError):
+    """Raised when an option declaration or a command line value is invalid."""
+
+
+class _Missing:
+    """Marker for "no value", since None is a perfectly valid default."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return '<missing>'
+
+    def __reduce__(self) -> str:
+        # Pickled by name, so unpickled options still compare `is _MISSING`
+        return '_MISSING'
+
+
+_MISSING = _Missing()
+
+# Marker for the end of the token stream
+_END = object()
+
+# Accepted values for Option(action=...)
+_ACTIONS = ('store', 'append', 'count')
+
+# Second characters of tokens that may be negative numbers: '-5', '-.5'
+_NUMBER_START = frozenset('0123456789.')
+
+# Set by friendly_arguments.instrumentation while hooks are registered.
+# parse() checks it once per call, so without hooks nothing else changes.
+_instrumentation = None
+
+# ContextVar set by friendly_arguments.context once it's imported; until
+# then every default argument vector is simply sys.argv
+_argv_var = None
+
+
+def _current_argv() -> Sequence[str]:
+    """Argument vector used when none is given: the context's, or sys.argv."""
+    if _argv_var is not None:
+        argv = _argv_var.get()
+        if argv is not None:
+            return argv
+    return sys.argv
+
+
+class Option:
+    """
+    Declaration of a single command line option.
+
+    The first name is the canonical one: parsed values are always stored
+    under it, no matter which alias was used on the command line.
+
+    Example:
+        Option('--name', '-n', default='Anonymous')
+        Option('--verbose', '-v', flag=True, default=False)
+        Option('--port', '-p', type=int, default=8080)
+        Option('--include', '-I', action='append')   # ('a', 'b')
+        Option('--verbose', '-v', action='count')    # -vvv -> 3
+
+    Args:
+        name: Canonical option name (e.g., '--name')
+        *aliases: Other names accepted for the same option (e.g., '-n')
+        default: Value used when the option is not given (never converted)
+        flag: If True, the option never consumes the next token as a value
+        type: Optional value type (int, float, bool, Enum, ListOf(...) or
+              any callable taking a string, see converter_for)
+        action: 'store' keeps the last value (default), 'append' collects
+                every value in command line order into a tuple (an
+                array.array for int and float types), 'count' counts the
+                occurrences of a flag, including repeated short forms (-vvv)
+        required: If True, parsing fails when the option is missing
+        choices: Accepted (converted) values; for 'append' options and
+                 ListOf types, each item is checked
+        min: Smallest accepted (converted) value, or item
+        max: Largest accepted (converted) value, or item
+
+    Constraint violations are collected over the whole command line and
+    raised together, see friendly_arguments.validation.ValidationError.
+    """
+
+    __slots__ = ('name', 'aliases', 'default', 'flag', 'type', 'action',
+                 'required', 'choices', 'min', 'max', 'converter', 'container')
+
+    def __init__(self, name: str, *aliases: str, default: Any = _MISSING, flag: bool = False,
+                 type: Any = None, action: str = 'store', required: bool = False,
+                 choices: Optional[Iterable[Any]] = None, min: Any = None, max: Any = None):
+        if not name:
+            raise ArgumentError("Option name can't be empty")
+        if action not in _ACTIONS:
+            raise ArgumentError(f"Unknown action {action!r} for option {name}")
+        self.name = name
+        self.aliases = aliases
+        self.default = default
+        self.flag = flag or action == 'count'
+        self.type = type
+        self.action = action
+        self.required = required
+        self.choices = tuple(choices) if choices is not None else None
+        self.min = min
+        self.max = max
+        # Compiled by Parser.compile() from `type` and `action`
+        self.converter: Optional[Callable[[Any], Any]] = None
+        self.container: Optional[Callable[[], Any]] = None
+
+    @property
+    def names(self) -> tuple:
+        """All names of the option, canonical name first."""
+        return (self.name,) + self.aliases
+
+    @property
+    def has_default(self) -> bool:
+        return self.default is not _MISSING
+
+    @property
+    def has_constraints(self) -> bool:
+        return (self.required or self.choices is not None
+                or self.min is not None or self.max is not None)
+
+    def __repr__(self) -> str:
+        names = ', '.join(repr(name) for name in self.names)
+        return f"Option({names})"
+
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        # Converters are closures that can't be pickled; Parser binds them
+        # again when it's unpickled (or on the next compile)
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state['converter'] = None
+        return None, state
+
+
+class Arguments(dict):
+    """
+    Dictionary of parsed arguments keyed by canonical option names.
+
+    It behaves exactly like the dict returned by get_args(), and also keeps
+    the parser's alias table so get_arg() and lookup() can resolve any alias
+    with a single dictionary access.
+
+    Example:
+        args = parser.parse()
+        args['--name']         # canonical key
+        args.lookup('-n')      # same value, resolved through the alias table
+    """
+
+    __slots__ = ('canonical',)
+
+    def __init__(self, *args, canonical: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.canonical = canonical if canonical is not None else {}
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Get a value by canonical name or by any declared alias."""
+        return self.get(self.canonical.get(key, key), default)
+
+
+class Parser:
+    """
+    Reusable, precompiled command line specification.
+
+    Options are declared once with their aliases, defaults and flag-vs-value
+    behaviour. On the first parse the declarations are compiled into a
+    single alias table, so every token is resolved to its canonical key with
+    one dictionary lookup and results never need repeated alias scans.
+
+    Values of typed options are converted once, during the parse pass, by
+    converters compiled together with the alias table. Tokens that don't
+    match a declared option are parsed exactly like get_args() does, keyed
+    by the name used on the command line.
+
+    Example:
+        parser = Parser([
+            Option('--name', '-n', default='Anonymous'),
+            Option('--verbose', '-v', flag=True, default=False),
+        ])
+
+        # python script.py -n João -v
+        args = parser.parse()
+        print(args['--name'])     # 'João'
+        print(args['--verbose'])  # True
+
+    Args:
+        options: Optional initial Option declarations
+    """
+
+    def __init__(self, options: Iterable[Option] = ()):
+        self.options: List[Option] = []
+        self._lookup: Optional[Dict[str, Option]] = None
+        self._canonical: Dict[str, str] = {}
+        self._defaults: Dict[str, Any] = {}
+        self._accumulating: frozenset = frozenset()
+        self._short: Dict[str, Option] = {}
+        # Groups of mutually exclusive option names, see add_exclusive()
+        self._exclusive: List[Tuple[str, ...]] = []
+        # Compiled by friendly_arguments.validation; None without constraints
+        self._validator: Optional[Callable[[Dict[str, Any], Any], None]] = None
+        # Incremented by every compile(), so caches can tell specs apart
+        self.generation = 0
+
+        for option in options:
+            self.add(option)
+
+    def add(self, option: Option) -> Option:
+        """Add an already built Option to the parser."""
+        self.options.append(option)
+        self._lookup = None
+        return option
+
+    def add_option(self, name: str, *aliases: str, **kwargs) -> Option:
+        """
+        Declare a new option.
+
+        Example:
+            parser.add_option('--port', '-p', default='8080')
+
+        Args:
+            name: Canonical option name
+            *aliases: Other accepted names
+            **kwargs: Same keyword arguments accepted by Option
+
+        Returns:
+            The created Option
+        """
+        return self.add(Option(name, *aliases, **kwargs))
+
+    def add_exclusive(self, *names: str) -> None:
+        """
+        Declare options that can't be given together.
+
+        Example:
+            parser.add_exclusive('--json', '--yaml', '--csv')
+
+        Args:
+            *names: Names (or aliases) of at least two declared options
+        """
+        if len(names) < 2:
+            raise ArgumentError("An exclusive group needs at least two options")
+        self._exclusive.append(names)
+        self._lookup = None
+
+    def compile(self) -> Parser:
+        """
+        Build the alias table, the value converters and the default values.
+
+        Called automatically before the first parse and after the options
+        change; calling it explicitly just moves the cost to a known moment.
+        """
+        lookup: Dict[str, Option] = {}
+        for option in self.options:
+            for name in option.names:
+                if name in lookup:
+                    raise ArgumentError(f"Option name {name!r} is declared more than once")
+                lookup[name] = option
+
+        self._bind_converters()
+
+        for option in self.options:
+            if option.action == 'append':
+                option.container = _container_for(option.type)
+
+        # Single letter options, which can be combined: -abc, -vvv, -n5
+        self._short = {
+            name[1]: option
+            for option in self.options
+            for name in option.names if len(name) == 2 and name[0] == '-' and name[1] != '-'
+        }
+        self._accumulating = frozenset(
+            option.name for option in self.options if option.action != 'store'
+        )
+        self._canonical = {name: option.name for name, option in lookup.items()}
+        self._defaults = {
+            option.name: option.default for option in self.options if option.has_default
+        }
+        self._lookup = lookup
+        self._bind_validator()
+        self.generation += 1
+        return self
+
+    def _bind_converters(self) -> None:
+        if any(option.type is not None for option in self.options):
+            from .converters import bind_converter
+            for option in self.options:
+                if option.type is not None:
+                    option.converter = bind_converter(option.name, option.type)
+
+    def _bind_validator(self) -> None:
+        self._validator = None
+        if self._exclusive or any(option.has_constraints for option in self.options):
+            from .validation import compile_validator
+            self._validator = compile_validator(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The alias table is rebuilt from _canonical, which is cheaper than
+        # unpickling a dictionary of Option references
+        state = dict(self.__dict__)
+        state['_validator'] = None
+        if self._lookup is not None:
+            state['_lookup'] = True
+            state['_short'] = {char: option.name for char, option in self._short.items()}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Unpickled parsers stay compiled: only the converters are rebound
+        self.__dict__.update(state)
+        if self._lookup is not None:
+            options = {option.name: option for option in self.options}
+            self._lookup = {name: options[canonical] for name, canonical in self._canonical.items()}
+            self._short = {char: options[name] for char, name in self._short.items()}
+            self._bind_converters()
+            self._bind_validator()
+
+    def fingerprint(self) -> str:
+        """
+        Return a hash of the declared options.
+
+        The hash covers names, aliases, flags, actions, types (including
+        Enum members), the repr of the defaults and the constraints,
+        including exclusive groups. It changes only when the
+        specification does, so it can key files derived from it, such as
+        completion indexes.
+        """
+        from hashlib import sha256
+        digest = sha256()
+        for option in self.options:
+            value_type = option.type
+            if value_type is not None:
+                from .converters import choices_for
+                value_type = (getattr(value_type, '__module__', None),
+                              getattr(value_type, '__qualname__', repr(value_type)),
+                              choices_for(value_type))
+            default = repr(option.default) if option.has_default else None
+            spec = (option.names, option.flag, option.action, value_type, default)
+            if option.has_constraints:
+                spec += (option.required, option.choices, option.min, option.max)
+            digest.update(repr(spec).encode('utf-8', 'surrogateescape'))
+        if self._exclusive:
+            digest.update(repr(self._exclusive).encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+
+    def canonical(self, key: str) -> str:
+        """Return the canonical name for `key` (or `key` itself if undeclared)."""
+        if self._lookup is None:
+            self.compile()
+        return self._canonical.get(key, key)
+
+    def parse(self, argv: Optional[Sequence[str]] = None,
+              defaults: Optional[Dict[str, Any]] = None,
+              response_files: bool = False) -> Arguments:
+        """
+        Parse a command line.
+
+        Args:
+            argv: Argument vector including the program name (default: sys.argv)
+            defaults: Optional extra defaults, taking precedence over the
+                      defaults declared in the options
+            response_files: If True, '@file' tokens are replaced by the
+                            arguments in that file (see expand_response_files)
+
+        Returns:
+            Arguments dictionary keyed by canonical option names
+        """
+        if self._lookup is None:
+            self.compile()
+        if argv is None:
+            argv = _current_argv()
+        if _instrumentation is not None:
+            return _instrumentation.parse(self, argv, defaults, response_files)
+
+        args = Arguments(self._base_defaults(defaults), canonical=self._canonical)
+        tokens = iter(argv)
+        next(tokens, None)  # skip the program name
+        if response_files:
+            from .response_files import expand_response_files
+            tokens = expand_response_files(tokens)
+        self._parse_tokens(tokens, args)
+        return args
+
+    def parse_lazy(self, argv: Optional[Sequence[str]] = None,
+                   defaults: Optional[Dict[str, Any]] = None) -> LazyArguments:
+        """
+        Return a mapping that parses the command line only as far as needed.
+
+        Lookups scan the argument vector from the end and stop at the key's
+        last occurrence; iteration and len() finish the scan. The result is
+        always equal to parse(argv, defaults). Constraints are checked when
+        the scan finishes, since they depend on the whole command line.
+
+        Args:
+            argv: Argument vector including the program name (default: sys.argv)
+            defaults: Optional extra defaults
+
+        Returns:
+            LazyArguments mapping
+        """
+        from .lazy import LazyArguments
+        return LazyArguments(self, _current_argv() if argv is None else argv, defaults)
+
+    def parse_bytes(self, argv: Optional[Sequence[bytes]] = None,
+                    defaults: Optional[Dict[str, Any]] = None,
+                    views: bool = False) -> Arguments:
+        """
+        Parse a command line given as bytes, keeping the values as bytes.
+
+        See friendly_arguments.binary.parse_bytes.
+
+        Args:
+            argv: Argument vector of bytes including the program name
+                  (default: sys.argv encoded back with os.fsencode)
+            defaults: Optional extra defaults
+            views: If True, values are memoryviews over the original tokens
+
+        Returns:
+            Arguments dictionary with str keys and bytes (or memoryview) values
+        """
+        from .binary import parse_bytes
+        return parse_bytes(argv, self, defaults, views)
+
+    def parse_record(self, argv: Optional[Sequence[str]] = None,
+                     defaults: Optional[Dict[str, Any]] = None) -> Record:
+        """
+        Parse a command line into a compact record with attribute access.
+
+        See friendly_arguments.record.record_type.
+
+        Args:
+            argv: Argument vector including the program name (default: sys.argv)
+            defaults: Optional extra defaults
+
+        Returns:
+            Record with the parsed values, also usable as a read-only mapping
+        """
+        from .record import parse_record
+        return parse_record(argv, self, defaults)
+
+    def _base_defaults(self, defaults: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge declared and call defaults, keyed by canonical names."""
+        if not defaults:
+            return self._defaults
+        canonical = self._canonical
+        base = dict(self._defaults)
+        for key, value in defaults.items():
+            base[canonical.get(key, key)] = value
+        return base
+
+    def _is_value(self, token: str) -> bool:
+        """True for tokens that are values, never options (see _parse_tokens)."""
+        return (token[:1] != '-' or token == '-' or (
+            token[1] in _NUMBER_START and token not in self._lookup and _is_number(token)))
+
+    def _cluster(self, token: str) -> Optional[List[Tuple[Option, Any]]]:
+        """
+        Split combined short options: '-abc', '-vvv', '-n5', '-vn5', '-vn=5'.
+
+        Returns (option, value) pairs in command line order, with True for
+        flags and _MISSING for a last option that takes the next token as
+        its value; or None if the token isn't made of declared letters.
+        """
+        short = self._short
+        if token[2:3] == '=':
+            return None  # '-n=5' is the usual name=value form
+        items = []
+        for position in range(1, len(token)):
+            option = short.get(token[position])
+            if option is None:
+                return None
+            if not option.flag:
+                value = token[position + 1:]
+                if not value:
+                    value = _MISSING
+                elif value[0] == '=':
+                    value = value[1:]
+                items.append((option, value))
+                break
+            items.append((option, True))
+        return items
+
+    def _parse_tokens(self, tokens: Iterator[str], args: Dict[str, Any],
+                      validate: bool = True) -> None:
+        """
+        Parse the tokens into `args`, overwriting earlier values, then validate it.
+
+        A single pass with one piece of state: the option waiting for its
+        value. Each token is classified once, from the first characters
+        and the precompiled tables:
+
+            name=value a '-' token with '=': the declared name before the
+                       '=' if any, else combined letters ('-vn=5'), else
+                       an undeclared name
+            value      doesn't start with '-', is '-', or is a negative
+                       number that isn't a declared name ('-5', '-1.5e3')
+            '--'       end of options: the remaining tokens are positional
+            option     a declared name (exact lookup), combined declared
+                       letters ('-abc', '-n5'), or any other '-' token,
+                       kept as an undeclared option
+
+        A value goes to the waiting option, or is a positional argument
+        (ignored); an option token first turns a waiting option into a
+        boolean flag.
+
+        With constraints, the tokens are parsed into a separate dict first:
+        its keys are the options given, which the validator checks even when
+        a value equals the default.
+        """
+        lookup = self._lookup
+        short = self._short
+        collected: Dict[str, Any] = {}
+        pending: Any = None  # Option, or undeclared name, waiting for a value
+        result = args
+        if validate and self._validator is not None:
+            args = {}
+
+        for token in tokens:
+            if '=' in token and token[0] == '-':
+                # name=value is decided first: it's the common long form, and
+                # a declared name wins over letters ('-name=bob' isn't -n ame=bob)
+                if pending is not None:
+                    _store_flag(pending, args, collected)
+                    pending = None
+                key, value = token.split('=', 1)
+                option = lookup.get(key)
+                if option is not None:
+                    if option.converter is not None:
+                        value = option.converter(value)
+                    if option.action == 'store':
+                        args[option.name] = value
+                    else:
+                        _collect(collected, option, value)
+                    continue
+                items = self._cluster(token) if token[1] in short else None
+                if items is None:
+                    args[key] = value
+                else:
+                    for option, value in items:  # '-vn=5': the value is never missing
+                        _store(option, value, args, collected)
+                continue
+
+            if token[:1] != '-' or token == '-' or (
+                    token[1] in _NUMBER_START and token not in lookup and _is_number(token)):
+                if pending is None:
+                    continue  # positional arguments are ignored
+                if type(pending) is str:
+                    args[pending] = token
+                else:
+                    value = token if pending.converter is None else pending.converter(token)
+                    if pending.action == 'store':
+                        args[pending.name] = value
+                    else:
+                        _collect(collected, pending, value)
+                pending = None
+                continue
+
+            if pending is not None:
+                _store_flag(pending, args, collected)
+                pending = None
+
+            option = lookup.get(token)
+            if option is not None:
+                if not option.flag:
+                    pending = option
+                elif option.action == 'store':
+                    args[option.name] = True
+                else:
+                    _collect(collected, option, True)
+                continue
+
+            if token == '--':
+                break
+
+            option = short.get(token[1])
+            if option is not None and not option.flag:
+                # Attached short value: -n5
+                _store(option, token[2:], args, collected)
+                continue
+            items = self._cluster(token) if option is not None else None
+            if items is None:
+                pending = token
+            else:
+                for option, value in items:
+                    if value is _MISSING:
+                        pending = option
+                    else:
+                        _store(option, value, args, collected)
+
+        if pending is not None:
+            _store_flag(pending, args, collected)
+
+        # Repeated options are frozen once, after every occurrence was seen
+        for key, bucket in collected.items():
+            args[key] = tuple(bucket) if type(bucket) is list else bucket
+
+        if args is not result:
+            result.update(args)
+            self._validator(result, args)
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _store(option: Option, value: Any, args: Dict[str, Any], collected: Dict[str, Any]) -> None:
+    """Store one occurrence of a declared option; flags get True."""
+    if option.converter is not None and not (value is True and option.flag):
+        value = option.converter(value)
+    if option.action == 'store':
+        args[option.name] = value
+    else:
+        _collect(collected, option, value)
+
+
+def _store_flag(pending: Any, args: Dict[str, Any], collected: Dict[str, Any]) -> None:
+    """Store an option given without a value, as True."""
+    if type(pending) is str:
+        args[pending] = True
+    else:
+        _store(pending, True, args, collected)
+
+
+def _container_for(value_type: Any) -> Callable[[], Any]:
+    """Return the factory of the growable container used by append options."""
+    if value_type is int or value_type is float:
+        from array import array
+        from functools import partial
+        return partial(array, 'q' if value_type is int else 'd')
+    return list
+
+
+def _collect(collected: Dict[str, Any], option: Option, value: Any) -> None:
+    """Add one occurrence of an append or count option."""
+    if option.action == 'count':
+        if value is not True and type(value) is not int:
+            raise ArgumentError(f"Option {option.name} doesn't take a value")
+        collected[option.name] = collected.get(option.name, 0) + value
+        return
+
+    bucket = collected.get(option.name)
+    if bucket is None:
+        bucket = collected[option.name] = option.container()
+    try:
+        bucket.append(value)
+    except (TypeError, OverflowError) as error:
+        raise ArgumentError(f"Invalid value for {option.name}: {value!r}") from error
+
+
+def parse_many(argvs: Iterable[Sequence[str]], parser: Optional[Parser] = None,
+               defaults: Optional[Dict[str, Any]] = None,
+               columnar: bool = False):
+    """
+    Parse many argument vectors with one compiled parser.
+
+    The defaults are merged and canonicalized once for the whole batch. In
+    columnar mode no dictionary is built per record at all: the result is a
+    single dict with one list per key, where position i holds the value of
+    the i-th argv (its default, or None when the key is missing).
+
+    Example:
+        parser = Parser([Option('--name', '-n', default='Anonymous')])
+        rows = parse_many([['job', '-n', 'a'], ['job']], parser)
+        # [{'--name': 'a'}, {'--name': 'Anonymous'}]
+
+        columns = parse_many([['job', '-n', 'a'], ['job']], parser, columnar=True)
+        # {'--name': ['a', 'Anonymous']}
+
+    Args:
+        argvs: Argument vectors, each including the program name
+        parser: Compiled specification (default: no declared options)
+        defaults: Optional extra defaults applied to every record
+        columnar: If True, return one list per key instead of one dict per argv
+
+    Returns:
+        List of Arguments, or a dict of lists in columnar mode
+    """
+    if parser is None:
+        parser = Parser()
+    if parser._lookup is None:
+        parser.compile()
+
+    base = parser._base_defaults(defaults)
+    canonical = parser._canonical
+    parse_tokens = parser._parse_tokens
+
+    instrumentation = _instrumentation
+
+    if not columnar:
+        results = []
+        for argv in argvs:
+            args = Arguments(base, canonical=canonical)
+            tokens = iter(argv)
+            next(tokens, None)  # skip the program name
+            if instrumentation is None:
+                parse_tokens(tokens, args)
+            else:
+                instrumentation.parse_tokens(parser, argv, tokens, args)
+            results.append(args)
+        return results
+
+    columns: Dict[str, list] = {option.name: [] for option in parser.options}
+    for key in base:
+        columns.setdefault(key, [])
+    fill = [(key, column, base.get(key)) for key, column in columns.items()]
+
+    scratch: Dict[str, Any] = {}
+    # Constraints see the same values as in row mode, defaults included
+    prefill = base if parser._validator is not None else None
+    count = 0
+    for argv in argvs:
+        if prefill is not None:
+            scratch.update(prefill)
+        tokens = iter(argv)
+        next(tokens, None)  # skip the program name
+        if instrumentation is None:
+            parse_tokens(tokens, scratch)
+        else:
+            instrumentation.parse_tokens(parser, argv, tokens, scratch)
+
+        for key, column, default in fill:
+            column.append(scratch.pop(key, default))
+
+        if scratch:
+            # Keys seen for the first time get a column padded with None
+            for key, value in scratch.items():
+                column = [None] * count
+                column.append(value)
+                columns[key] = column
+                fill.append((key, column, None))
+            scratch.clear()
+
+        count += 1
+
+    return columns
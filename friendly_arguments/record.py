@@ -0,0 +1,242 @@
+import keyword
+import weakref
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from . import parser as parser_module
+from .parser import ArgumentError, Parser
+
+# Record classes generated so far, one per parser (dropped with the parser)
+_TYPES: 'weakref.WeakKeyDictionary[Parser, type]' = weakref.WeakKeyDictionary()
+
+
+def _identifier(name: str) -> str:
+    """Attribute name for an option name: '--dry-run' -> 'dry_run'."""
+    identifier = name.lstrip('-').replace('-', '_')
+    if identifier[:1].isdigit():
+        identifier = '_' + identifier
+    if keyword.iskeyword(identifier) or identifier in _RESERVED:
+        identifier += '_'
+    if not identifier.isidentifier():
+        raise ArgumentError(f"Option {name!r} can't be mapped to an attribute name")
+    return identifier
+
+
+class Record(Mapping):
+    """
+    Base class of the compact parse results built by record_type().
+
+    Each declared option is a slot of the generated class, so a record has
+    no per-instance dictionary: it costs a fixed few bytes per option
+    instead of a dict sized for its keys. Values are read as attributes
+    named after the option (`args.dry_run` for '--dry-run'), or through
+    the Mapping protocol with the canonical names, exactly like the dict
+    returned by get_args(). Options that were not given and have no default
+    read as None as attributes, and are absent from the mapping.
+
+    Tokens that don't match a declared option are kept in a small extra
+    dictionary, created only for the records that have them. Keys iterate
+    in declaration order, followed by the undeclared ones.
+    """
+
+    __slots__ = ('_extra',)
+
+    # Set on each generated class
+    _fields: Tuple[str, ...] = ()
+    _members: Dict[str, Any] = {}
+    canonical: Dict[str, str] = {}
+
+    def __init__(self, args: Optional[Mapping] = None):
+        extra = None
+        if args:
+            members = self._members
+            for key, value in args.items():
+                member = members.get(key)
+                if member is not None:
+                    member.__set__(self, value)
+                else:
+                    if extra is None:
+                        extra = {}
+                    extra[key] = value
+        self._extra = extra
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots and unknown names
+        if name in self._fields:
+            return None
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __getitem__(self, key: str) -> Any:
+        member = self._members.get(key)
+        if member is not None:
+            try:
+                return member.__get__(self)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        for key, member in self._members.items():
+            try:
+                member.__get__(self)
+            except AttributeError:
+                continue
+            yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Get a value by canonical name or by any declared alias."""
+        return self.get(self.canonical.get(key, key), default)
+
+    def __reduce__(self):
+        # Generated classes can't be imported by name: rebuild from the parser
+        return _rebuild, (self._parser(), dict(self))
+
+    def __repr__(self) -> str:
+        fields = []
+        for identifier, member in zip(self._fields, self._members.values()):
+            try:
+                fields.append(f"{identifier}={member.__get__(self)!r}")
+            except AttributeError:
+                pass
+        if self._extra is not None:
+            fields.append(f"extra={self._extra!r}")
+        return f"{type(self).__name__}({', '.join(fields)})"
+
+
+_RESERVED = frozenset(dir(Record)) | {'_parser'}
+
+
+def _rebuild(parser: Parser, args: Dict[str, Any]) -> Record:
+    return record_type(parser)(args)
+
+
+def record_type(parser: Parser, name: str = 'Record') -> type:
+    """
+    Return the record class for a parser's specification.
+
+    The class is generated once per parser (and again only after its
+    options change), with one __slots__ entry per declared option. Option
+    names become identifiers by dropping the leading dashes and replacing
+    the others with underscores; names that are not valid identifiers get
+    a prefix or suffix underscore ('--2fa' -> '_2fa', '--class' ->
+    'class_', '--items' -> 'items_').
+
+    Example:
+        Job = record_type(parser)
+        job = Job(parser.parse(argv))
+        job.dry_run, job['--dry-run']   # same value
+
+    Args:
+        parser: Parser with the declared options
+        name: Class name used in repr() (default: 'Record')
+
+    Returns:
+        Subclass of Record
+
+    Raises:
+        ArgumentError: If two options map to the same attribute name
+    """
+    if parser._lookup is None:
+        parser.compile()
+    cls = _TYPES.get(parser)
+    if cls is not None and cls._generation == parser.generation and cls.__name__ == name:
+        return cls
+
+    fields: Dict[str, str] = {}
+    for option in parser.options:
+        identifier = _identifier(option.name)
+        if identifier in fields:
+            raise ArgumentError(
+                f"Options {fields[identifier]!r} and {option.name!r} map to the same "
+                f"attribute {identifier!r}"
+            )
+        fields[identifier] = option.name
+
+    cls = type(name, (Record,), {
+        '__slots__': tuple(fields),
+        '__module__': __name__,
+        '_fields': tuple(fields),
+        '_generation': parser.generation,
+        '_parser': weakref.ref(parser),
+        'canonical': parser._canonical,
+    })
+    cls._members = {key: cls.__dict__[identifier] for identifier, key in fields.items()}
+    _TYPES[parser] = cls
+    return cls
+
+
+def parse_record(argv: Optional[Sequence[str]] = None, parser: Optional[Parser] = None,
+                 defaults: Optional[Dict[str, Any]] = None) -> Record:
+    """
+    Parse a command line into a record of the parser's record_type().
+
+    Example:
+        args = parse_record(parser=parser)
+        if args.verbose:
+            print(args.name)
+
+    Args:
+        argv: Argument vector including the program name (default: sys.argv)
+        parser: Parser with the declared options (default: get_args() rules)
+        defaults: Optional extra defaults
+
+    Returns:
+        Record with the parsed values
+    """
+    if parser is None:
+        from .named import _DEFAULT_PARSER as parser
+    return record_type(parser)(parser.parse(argv, defaults))
+
+
+def parse_records(argvs: Iterable[Sequence[str]], parser: Optional[Parser] = None,
+                  defaults: Optional[Dict[str, Any]] = None) -> Iterator[Record]:
+    """
+    Parse many argument vectors into records, like parse_many().
+
+    Every argv is parsed into the same scratch dictionary, so no
+    dictionary is kept (or allocated) per record.
+
+    Example:
+        jobs = list(parse_records(argvs, parser))   # millions of records
+
+    Args:
+        argvs: Argument vectors, each including the program name
+        parser: Parser with the declared options (default: get_args() rules)
+        defaults: Optional extra defaults applied to every record
+
+    Returns:
+        Generator of records, in input order
+    """
+    if parser is None:
+        from .named import _DEFAULT_PARSER as parser
+    cls = record_type(parser)
+
+    base = parser._base_defaults(defaults)
+    parse_tokens = parser._parse_tokens
+    instrumentation = parser_module._instrumentation
+    scratch: Dict[str, Any] = {}
+
+    for argv in argvs:
+        scratch.update(base)
+        tokens = iter(argv)
+        next(tokens, None)  # skip the program name
+        if instrumentation is None:
+            parse_tokens(tokens, scratch)
+        else:
+            instrumentation.parse_tokens(parser, argv, tokens, scratch)
+        yield cls(scratch)
+        scratch.clear()
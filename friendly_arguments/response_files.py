@@ -0,0 +1,97 @@
+import mmap
+import os
+from typing import Iterable, Iterator, Optional, Set
+
+from .parser import ArgumentError
+
+
+def expand_response_files(tokens: Iterable[str], prefix: str = '@') -> Iterator[str]:
+    """
+    Expand '@file' tokens into the arguments stored in that file.
+
+    Response files hold one argument per line, like argparse's
+    fromfile_prefix_chars. They are read through mmap and split lazily, so
+    even a manifest of hundreds of megabytes is never loaded into memory as
+    a list: only the token being parsed exists as a Python string.
+
+    Files may include other files with the same prefix. Relative paths in a
+    file are resolved from that file's directory, and a file that includes
+    itself (directly or not) raises ArgumentError.
+
+    Example:
+        # args.txt contains the lines '--name' and 'João'
+        list(expand_response_files(['--verbose', '@args.txt']))
+        # ['--verbose', '--name', 'João']
+
+    Args:
+        tokens: Arguments to expand (without the program name)
+        prefix: Prefix that marks a response file (default: '@')
+
+    Returns:
+        Generator of the expanded arguments
+    """
+    return _expand(tokens, prefix, None, set())
+
+
+def _expand(tokens: Iterable[str], prefix: str, base_dir: Optional[str],
+            active: Set[str]) -> Iterator[str]:
+    for token in tokens:
+        if len(token) > len(prefix) and token.startswith(prefix):
+            path = token[len(prefix):]
+            if base_dir is not None:
+                path = os.path.join(base_dir, path)
+            yield from _expand_file(path, prefix, active)
+        else:
+            yield token
+
+
+def _expand_file(path: str, prefix: str, active: Set[str]) -> Iterator[str]:
+    real_path = os.path.realpath(path)
+    if real_path in active:
+        raise ArgumentError(f"Response file {path!r} includes itself")
+
+    active.add(real_path)
+    try:
+        yield from _expand(_read_lines(path), prefix, os.path.dirname(real_path), active)
+    finally:
+        active.discard(real_path)
+
+
+# Size of the window decoded at once; bounds memory independently of file size
+_CHUNK_SIZE = 1 << 18
+
+
+def _read_lines(path: str) -> Iterator[str]:
+    """Yield the lines of a file from a read-only memory map, one window at a time."""
+    try:
+        file = open(path, 'rb')
+    except OSError as error:
+        raise ArgumentError(f"Can't read response file {path!r}: {error.strerror}") from error
+
+    with file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return  # empty files can't be mapped
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # A final line break doesn't start another argument
+            stop = size - 1 if mapped[size - 1] == 0x0A else size
+            start = 0
+            while True:
+                limit = start + _CHUNK_SIZE
+                if limit >= stop:
+                    end = stop
+                else:
+                    # Cut the window at its last line break so no line is split
+                    end = mapped.rfind(b'\n', start, limit)
+                    if end < 0:
+                        end = mapped.find(b'\n', limit, stop)
+                        if end < 0:
+                            end = stop
+
+                for line in os.fsdecode(mapped[start:end]).split('\n'):
+                    yield line[:-1] if line.endswith('\r') else line
+
+                if end >= stop:
+                    break
+                start = end + 1
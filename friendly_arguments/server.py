@@ -0,0 +1,256 @@
+import io
+import marshal
+import os
+import shlex
+import socket
+import struct
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from . import client
+from .parser import ArgumentError, Parser
+
+# Seconds between idle checks while no request arrives
+_TICK = 1.0
+
+_CLIENT = os.path.abspath(client.__file__)
+
+
+def _source_files(watch: Iterable[str]) -> List[str]:
+    """Files of every imported module, plus the watched ones."""
+    files = set(os.path.abspath(path) for path in watch)
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if isinstance(path, str):
+            files.add(os.path.abspath(path))
+    return sorted(files)
+
+
+def _mtimes(files: Iterable[str]) -> Dict[str, Optional[int]]:
+    mtimes: Dict[str, Optional[int]] = {}
+    for path in files:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def _exit_code(value: Any) -> int:
+    """Exit status for a return value or SystemExit code, like sys.exit()."""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    print(value, file=sys.stderr)
+    return 1
+
+
+def _receive_request(connection: socket.socket) -> Tuple[List[str], Dict[str, str], str, List[int]]:
+    """Read a request; returns (argv, environ, cwd, stdio descriptors)."""
+    descriptors: List[int] = []
+    header, ancillary, _, _ = connection.recvmsg(
+        client.REQUEST.size, socket.CMSG_SPACE(3 * struct.calcsize('i')))
+    for level, kind, data in ancillary:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            data = data[:len(data) - len(data) % 4]
+            descriptors.extend(struct.unpack(f'{len(data) // 4}i', data))
+    header += client._receive(connection, client.REQUEST.size - len(header))
+
+    protocol, size = client.REQUEST.unpack(header)
+    if protocol != client.PROTOCOL or len(descriptors) != 3:
+        raise ArgumentError(f"Unsupported request (protocol {protocol})")
+    argv, environ, cwd = marshal.loads(client._receive(connection, size))
+    return argv, environ, cwd, descriptors
+
+
+def _reopen_stdio() -> None:
+    """Rebuild sys.stdin/stdout/stderr over descriptors 0, 1 and 2."""
+    for name, fd, mode in (('stdin', 0, 'r'), ('stdout', 1, 'w'), ('stderr', 2, 'w')):
+        current = getattr(sys, name)
+        encoding = getattr(current, 'encoding', None)
+        errors = getattr(current, 'errors', None)
+        # Line buffered like the interpreter's own streams on a terminal
+        buffering = 1 if mode == 'w' and (name == 'stderr' or os.isatty(fd)) else -1
+        stream = io.open(fd, mode, buffering, encoding=encoding, errors=errors, closefd=False)
+        setattr(sys, name, stream)
+
+
+def _run(connection: socket.socket, main: Callable[[Mapping], Any], parser: Parser) -> None:
+    """Serve one request in a forked process; never returns."""
+    code = 1
+    try:
+        argv, environ, cwd, descriptors = _receive_request(connection)
+        for target, fd in enumerate(descriptors):
+            os.dup2(fd, target)
+            os.close(fd)
+        connection.sendall(client.REPLY.pack(client.STARTED, os.getpid()))
+
+        try:
+            _reopen_stdio()
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(environ)
+            sys.argv = list(argv)
+            code = _exit_code(main(parser.parse(argv)))
+        except SystemExit as exit:
+            code = _exit_code(exit.code)
+        except ArgumentError as error:
+            print(f"error: {error}", file=sys.stderr)
+            code = 2
+        except KeyboardInterrupt:
+            code = 130
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except (AttributeError, OSError, ValueError):
+                    pass
+        connection.sendall(client.REPLY.pack(client.EXITED, code))
+    finally:
+        os._exit(code & 0xFF)
+
+
+def _reap(children: Set[int]) -> None:
+    """Collect the exit status of finished request processes."""
+    for pid in list(children):
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0] == 0:
+                continue
+        except ChildProcessError:
+            pass
+        children.discard(pid)
+
+
+def _listen(path: str) -> socket.socket:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        pass  # nothing listening: a leftover socket file can go
+    else:
+        raise ArgumentError(f"A server is already listening on {path!r}")
+    finally:
+        probe.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Only the owner may connect: requests run code as the server's user
+    umask = os.umask(0o077)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(umask)
+    listener.listen(64)
+    return listener
+
+
+def serve(main: Callable[[Mapping], Any], path: str, parser: Optional[Parser] = None,
+          idle_timeout: float = 600.0, watch: Iterable[str] = ()) -> None:
+    """
+    Keep the program loaded and run its command lines sent by client.py.
+
+    Import everything the program needs first, then call serve(): each
+    request forks the warm process, so the program starts with its modules
+    already imported. The forked process takes the client's stdin, stdout
+    and stderr, argv, environment and working directory, parses the argv
+    (with the parser, or like get_args()), calls main() with the result
+    and sends its exit status back, like sys.exit(main(args)) would.
+    ArgumentError exits with status 2.
+
+    The server stops after idle_timeout seconds without requests, and as
+    soon as a request finds that a source file changed (any imported
+    module's file or a watched path): that request is answered as
+    unavailable, so the client falls back to a normal run that loads the
+    new code. The socket is only accessible by the server's user.
+    Requires a POSIX system (fork and Unix sockets).
+
+    Example:
+        # mytool/server.py, started in the background by the wrapper
+        from mytool.cli import main, PARSER
+        serve(main, '/tmp/mytool.sock', PARSER)
+
+    Args:
+        main: Program entry point, called with the parsed arguments
+        path: Path of the Unix socket to listen on
+        parser: Parser for the command lines (default: get_args() rules)
+        idle_timeout: Seconds without requests before the server exits
+        watch: Extra files whose changes stop the server (e.g. configs)
+
+    Raises:
+        ArgumentError: If another server is listening on `path`
+    """
+    if parser is None:
+        from .named import _DEFAULT_PARSER as parser
+    if parser._lookup is None:
+        parser.compile()
+    mtimes = _mtimes(_source_files(watch))
+
+    listener = _listen(path)
+    identity = os.stat(path).st_ino
+    listener.settimeout(min(_TICK, idle_timeout))
+    deadline = time.monotonic() + idle_timeout
+    children: Set[int] = set()
+    try:
+        while True:
+            _reap(children)
+            try:
+                connection, _ = listener.accept()
+            except socket.timeout:
+                if time.monotonic() >= deadline:
+                    return
+                continue
+
+            try:
+                if _mtimes(mtimes) != mtimes:
+                    connection.sendall(client.REPLY.pack(client.STALE, 0))
+                    return
+                for stream in (sys.stdout, sys.stderr):
+                    if stream is not None:
+                        stream.flush()  # or the forked process writes it again
+                pid = os.fork()
+                if pid == 0:
+                    listener.close()
+                    _run(connection, main, parser)
+                children.add(pid)
+            finally:
+                connection.close()
+            deadline = time.monotonic() + idle_timeout
+    finally:
+        listener.close()
+        try:
+            if os.stat(path).st_ino == identity:
+                os.unlink(path)
+        except OSError:
+            pass
+        _reap(children)
+
+
+def client_command(path: str, python: Optional[str] = None) -> str:
+    """
+    Return the shell command that runs a command line on a server.
+
+    Append the program name and its arguments. The command exits with the
+    program's status, or 75 when the server isn't available, in which case
+    a wrapper script runs the program normally (and may start the server).
+
+    Example:
+        client_command('/tmp/mytool.sock')
+        # '/usr/bin/python3 -S .../friendly_arguments/client.py /tmp/mytool.sock'
+
+    Args:
+        path: Socket path given to serve()
+        python: Interpreter that runs the client (default: sys.executable)
+
+    Returns:
+        Shell command line
+    """
+    return ' '.join(shlex.quote(word) for word in (python or sys.executable, '-S', _CLIENT, path))
@@ -0,0 +1,302 @@
+import marshal
+import os
+import pickle
+import struct
+from array import array
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .parser import ArgumentError
+
+# Block layout (little endian):
+#     header     magic, number of keys, offset and size of the alias table
+#     directory  one entry per key: key offset and size, value kind,
+#                array typecode, value offset and size
+#     data       keys, values and the alias table, each 8-byte aligned
+_MAGIC = b'FRARGS\x00\x01'
+_HEADER = struct.Struct('<8sQQQ')
+_ENTRY = struct.Struct('<QIccxxQQ')
+
+# Value kinds: UTF-8 text, raw bytes, numeric array, marshal or pickle data
+_TEXT = b'S'
+_BYTES = b'Y'
+_ARRAY = b'A'
+_MARSHAL = b'M'
+_PICKLE = b'P'
+
+_NO_TYPECODE = b'\x00'
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _encode_value(value: Any) -> Tuple[bytes, bytes, Any]:
+    """Return (kind, typecode, buffer) for a value."""
+    value_type = type(value)
+    if value_type is str:
+        return _TEXT, _NO_TYPECODE, value.encode('utf-8', 'surrogatepass')
+    if value_type is bytes:
+        return _BYTES, _NO_TYPECODE, value
+    if value_type is array and value.typecode in 'bBhHiIlLqQfd':
+        # Written as is, and read back by workers as a memoryview
+        return _ARRAY, value.typecode.encode('ascii'), memoryview(value).cast('B')
+    try:
+        return _MARSHAL, _NO_TYPECODE, marshal.dumps(value)
+    except ValueError:
+        pass
+    try:
+        return _PICKLE, _NO_TYPECODE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        raise ArgumentError(f"Value {value!r} can't be shared: {error}") from error
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block without letting a private resource tracker unlink it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+
+    # Before 3.13 attaching also registers the block with the resource
+    # tracker. Pool workers share the publisher's tracker, which keeps the
+    # block until the publisher unlinks it; an unrelated process starts its
+    # own tracker here, which would unlink the block when that process exits.
+    if os.name != 'posix':
+        return shared_memory.SharedMemory(name=name)  # never tracked
+    from multiprocessing import resource_tracker
+    tracker = getattr(resource_tracker, '_resource_tracker', None)
+    private = getattr(tracker, '_fd', 0) is None
+    block = shared_memory.SharedMemory(name=name)
+    if private:
+        resource_tracker.unregister(block._name, 'shared_memory')
+    return block
+
+
+class SharedArguments(Mapping):
+    """
+    Read-only parse result stored in a multiprocessing.shared_memory block.
+
+    The result is encoded once by publish_arguments(); every process that
+    attaches maps the same block instead of receiving a copy. Attaching
+    only reads the key directory: each value is decoded on its first
+    lookup in that process, and numeric arrays (the values of repeated int
+    and float options) are never decoded at all, but returned as read-only
+    memoryviews over the shared block.
+
+    Pickling a SharedArguments (e.g. as a Pool initializer argument) only
+    sends the block name; the receiving process attaches by itself.
+
+    Example:
+        shared = publish_arguments(args)
+        with shared, Pool(64, initializer=init, initargs=(shared,)) as pool:
+            pool.map(work, items)
+
+        def init(arguments):
+            global ARGS
+            ARGS = arguments              # attached, nothing decoded yet
+
+    Args:
+        block: The shared memory block
+        owner: True for the publishing process, which unlinks the block
+    """
+
+    def __init__(self, block: shared_memory.SharedMemory, owner: bool = False):
+        self._block = block
+        self._owner = owner
+        self._view: Optional[memoryview] = block.buf.toreadonly()
+        self._values: Dict[str, Any] = {}
+        self._canonical: Optional[Dict[str, str]] = None
+
+        magic, count, self._canonical_offset, self._canonical_size = \
+            _HEADER.unpack_from(self._view, 0)
+        if magic != _MAGIC:
+            self._view.release()
+            raise ArgumentError(f"Shared memory block {block.name!r} holds no arguments")
+
+        view = self._view
+        directory: Dict[str, Tuple[bytes, bytes, int, int]] = {}
+        for position in range(_HEADER.size, _HEADER.size + count * _ENTRY.size, _ENTRY.size):
+            key_offset, key_size, kind, typecode, offset, size = _ENTRY.unpack_from(view, position)
+            key = str(view[key_offset:key_offset + key_size], 'utf-8', 'surrogatepass')
+            directory[key] = (kind, typecode, offset, size)
+        self._directory = directory
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block, for attach_arguments()."""
+        return self._block.name
+
+    @property
+    def canonical(self) -> Dict[str, str]:
+        """Alias table of the parser that produced the result."""
+        if self._canonical is None:
+            start = self._canonical_offset
+            self._canonical = marshal.loads(self._view[start:start + self._canonical_size])
+        return self._canonical
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Get a value by canonical name or by any declared alias."""
+        return self.get(self.canonical.get(key, key), default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        kind, typecode, offset, size = self._directory[key]
+        data = self._view[offset:offset + size]
+        if kind == _ARRAY:
+            value = data.cast(typecode.decode('ascii'))
+        elif kind == _TEXT:
+            value = str(data, 'utf-8', 'surrogatepass')
+        elif kind == _BYTES:
+            value = bytes(data)
+        elif kind == _MARSHAL:
+            value = marshal.loads(data)
+        else:
+            value = pickle.loads(data)
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._directory
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._directory)
+
+    def __len__(self) -> int:
+        return len(self._directory)
+
+    def __reduce__(self):
+        return attach_arguments, (self.name,)
+
+    def __repr__(self) -> str:
+        return f"SharedArguments({self.name!r}, keys={len(self)})"
+
+    def close(self) -> None:
+        """
+        Detach from the block; the publisher also unlinks it.
+
+        Array values obtained from this mapping must be released first
+        (memoryview.release() or del), since they point into the block.
+        """
+        if self._view is None:
+            return
+        self._detach()
+        if self._owner:
+            self._block.unlink()
+
+    def _detach(self) -> None:
+        self._values.clear()
+        self._view.release()
+        self._view = None
+        self._block.close()
+
+    def __del__(self) -> None:
+        # Release the views before SharedMemory.__del__ closes the mapping,
+        # e.g. for a mapping kept in a global of a worker that exits
+        if getattr(self, '_view', None) is not None:
+            try:
+                self._detach()
+            except BufferError:
+                pass  # an array value is still referenced elsewhere
+
+    def __enter__(self) -> 'SharedArguments':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def publish_arguments(args: Mapping, name: Optional[str] = None) -> SharedArguments:
+    """
+    Store a parse result in a new shared memory block.
+
+    Keys and values are written once, in a compact binary form: text as
+    UTF-8, int/float arrays as their raw items, other values with marshal
+    (or pickle for types like Enum and Path). Workers attach to the block
+    by name with attach_arguments(), or receive the returned object, which
+    pickles as just the name.
+
+    The publishing process owns the block: close() (or leaving a with
+    block) unlinks it, so keep it open until the workers are done.
+
+    Example:
+        args = parser.parse()          # --ids with a million values
+        with publish_arguments(args) as shared:
+            with ProcessPoolExecutor(64, initializer=init, initargs=(shared.name,)):
+                ...
+
+    Args:
+        args: Parse result (Arguments, LazyArguments or any mapping with str keys)
+        name: Optional block name (default: a random one)
+
+    Returns:
+        SharedArguments of the publishing process
+
+    Raises:
+        ArgumentError: If a value can't be encoded
+    """
+    items = []
+    for key, value in dict(args).items():
+        items.append((key.encode('utf-8', 'surrogatepass'),) + _encode_value(value))
+    canonical = marshal.dumps(dict(getattr(args, 'canonical', None) or {}))
+
+    # Lay out the data area after the header and the directory
+    offset = _align(_HEADER.size + len(items) * _ENTRY.size)
+    layout = []
+    for key, kind, typecode, buffer in items:
+        key_offset = offset
+        value_offset = _align(key_offset + len(key))
+        offset = _align(value_offset + len(buffer))
+        layout.append((key_offset, value_offset))
+    canonical_offset = offset
+    size = canonical_offset + len(canonical)
+
+    block = shared_memory.SharedMemory(name=name, create=True, size=size)
+    try:
+        buffer_view = block.buf
+        _HEADER.pack_into(buffer_view, 0, _MAGIC, len(items), canonical_offset, len(canonical))
+        position = _HEADER.size
+        for (key, kind, typecode, buffer), (key_offset, value_offset) in zip(items, layout):
+            _ENTRY.pack_into(buffer_view, position, key_offset, len(key), kind, typecode,
+                             value_offset, len(buffer))
+            position += _ENTRY.size
+            buffer_view[key_offset:key_offset + len(key)] = key
+            buffer_view[value_offset:value_offset + len(buffer)] = buffer
+        buffer_view[canonical_offset:size] = canonical
+        del buffer_view
+        return SharedArguments(block, owner=True)
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+
+
+def attach_arguments(name: str) -> SharedArguments:
+    """
+    Attach to arguments published by another process.
+
+    Nothing is copied or decoded up front: values are decoded on their
+    first lookup, and numeric arrays are read in place.
+
+    Args:
+        name: SharedArguments.name of the published block
+
+    Returns:
+        Read-only SharedArguments mapping
+
+    Raises:
+        ArgumentError: If no block with arguments has that name
+    """
+    try:
+        block = _attach_untracked(name)
+    except FileNotFoundError:
+        raise ArgumentError(f"No shared arguments named {name!r}") from None
+    try:
+        return SharedArguments(block)
+    except BaseException:
+        block.close()
+        raise
@@ -0,0 +1,211 @@
+import hashlib
+import marshal
+import os
+import pickle
+import sys
+from collections.abc import Mapping
+from typing import Any, Callable, Optional
+
+from . import __version__
+from .parser import Arguments, ArgumentError, Parser
+
+
+# Header line of every snapshot file:
+#     magic format package-version python-version kind key-hash payload-sha256
+_MAGIC = 'friendly-arguments-snapshot'
+_FORMAT = '2'
+
+# Payload kinds: a pickled Parser, or a result as marshal or pickle data
+_PARSER = 'parser'
+_RESULT_MARSHAL = 'result-marshal'
+_RESULT_PICKLE = 'result-pickle'
+
+
+def _tag() -> list:
+    """Fields that must match for a snapshot to be loaded at all."""
+    return [_MAGIC, _FORMAT, __version__, '%d.%d' % sys.version_info[:2]]
+
+
+def _key_hash(key: Any) -> str:
+    return hashlib.sha256(repr(key).encode('utf-8', 'surrogateescape')).hexdigest()[:32]
+
+
+def _write(path: str, kind: str, payload: bytes, key: Any) -> None:
+    header = ' '.join(_tag() + [kind, _key_hash(key), hashlib.sha256(payload).hexdigest()])
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(header.encode('ascii') + b'\n')
+        file.write(payload)
+    # Processes starting meanwhile read the old or the new snapshot, never half
+    os.replace(temporary, path)
+
+
+def _read(path: str, kinds: tuple, key: Any):
+    """Return (kind, payload) if the snapshot exists, matches and is intact."""
+    try:
+        with open(path, 'rb') as file:
+            header = file.readline().decode('ascii', 'replace').split()
+            payload = file.read()
+    except OSError:
+        return None, None
+
+    tag = _tag()
+    if (len(header) != len(tag) + 3 or header[:len(tag)] != tag
+            or header[-3] not in kinds or header[-2] != _key_hash(key)
+            or header[-1] != hashlib.sha256(payload).hexdigest()):
+        return None, None
+    return header[-3], payload
+
+
+def save_parser(parser: Parser, path: str, key: Any = None) -> None:
+    """
+    Write a compiled parser to a snapshot file.
+
+    The snapshot keeps the compiled alias table, defaults and option
+    declarations; loading it skips building the Options and compiling them.
+    Only the type converters are bound again on load (they are shared per
+    type, so that's one cached lookup per typed option).
+
+    Snapshots are pickle data: keep them in a directory only the user can
+    write, like any other cache of executable state.
+
+    Args:
+        parser: Parser to save (compiled first if needed)
+        path: Snapshot file
+        key: Any value with a stable repr that identifies the spec version;
+             load_parser() ignores snapshots written with another key
+
+    Raises:
+        ArgumentError: If the spec holds values that can't be pickled (e.g.
+                       a lambda used as an option type)
+    """
+    if parser._lookup is None:
+        parser.compile()
+    try:
+        payload = pickle.dumps(parser, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        raise ArgumentError(f"Parser can't be saved to a snapshot: {error}") from error
+    _write(path, _PARSER, payload, key)
+
+
+def load_parser(path: str, key: Any = None) -> Optional[Parser]:
+    """
+    Load a parser saved by save_parser().
+
+    Returns None when the file is missing, was written by another version
+    of friendly_arguments or Python, with another key, or is corrupt.
+    """
+    kind, payload = _read(path, (_PARSER,), key)
+    if payload is None:
+        return None
+    try:
+        parser = pickle.loads(payload)
+    except Exception:
+        return None  # e.g. an option type that no longer exists
+    return parser if isinstance(parser, Parser) else None
+
+
+def _source_key(build: Callable[[], Parser]) -> Any:
+    """Default key of cached_parser(): the file that defines `build`, and its version."""
+    code = getattr(build, '__code__', None)
+    filename = code.co_filename if code is not None else None
+    try:
+        stat = os.stat(filename)
+    except (OSError, TypeError):
+        return (getattr(build, '__qualname__', repr(build)), None)
+    return (build.__qualname__, filename, stat.st_mtime_ns, stat.st_size)
+
+
+def cached_parser(path: str, build: Callable[[], Parser], key: Any = None) -> Parser:
+    """
+    Return the parser built by `build`, from a snapshot when it's current.
+
+    On a cold start `build()` runs and its compiled result is saved to
+    `path`; on the next starts the snapshot is loaded instead. By default
+    the snapshot is tied to the file that defines `build` (its path,
+    modification time and size), so editing the spec invalidates it.
+
+    Example:
+        def build_parser():
+            return Parser([Option(f'--option{i}') for i in range(500)])
+
+        parser = cached_parser('/tmp/mytool.spec', build_parser)
+
+    Args:
+        path: Snapshot file
+        build: Function that builds the Parser
+        key: Explicit spec version (default: derived from build's source file)
+
+    Returns:
+        Compiled Parser
+    """
+    if key is None:
+        key = _source_key(build)
+
+    parser = load_parser(path, key)
+    if parser is not None:
+        return parser
+
+    parser = build().compile()
+    try:
+        save_parser(parser, path, key)
+    except (ArgumentError, OSError):
+        pass  # the spec still works, it's just built again next time
+    return parser
+
+
+def save_result(args: Mapping, path: str, key: Any = None) -> None:
+    """
+    Write a parsed result to a snapshot file, e.g. for child processes.
+
+    Results holding only str, bool, int, float, tuple, list and None
+    values are stored with marshal, which loads fastest; others (arrays,
+    Enums, paths...) are pickled.
+
+    Example:
+        save_result(args, snapshot_path)
+        subprocess.run([worker, '--arguments-from', snapshot_path])
+
+        # in the worker
+        args = load_result(snapshot_path)
+
+    Args:
+        args: Parse result (Arguments, LazyArguments or any mapping)
+        path: Snapshot file
+        key: Optional value that load_result() must be given back
+    """
+    canonical = getattr(args, 'canonical', None) or {}
+    items = dict(args)
+    try:
+        payload = marshal.dumps((items, canonical))
+        kind = _RESULT_MARSHAL
+    except ValueError:
+        try:
+            payload = pickle.dumps((items, canonical), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            raise ArgumentError(f"Result can't be saved to a snapshot: {error}") from error
+        kind = _RESULT_PICKLE
+    _write(path, kind, payload, key)
+
+
+def load_result(path: str, key: Any = None) -> Optional[Arguments]:
+    """
+    Load a result saved by save_result().
+
+    Returns:
+        Arguments (with the parser's alias table), or None when the file is
+        missing, stale or corrupt
+    """
+    kind, payload = _read(path, (_RESULT_MARSHAL, _RESULT_PICKLE), key)
+    if payload is None:
+        return None
+    try:
+        if kind == _RESULT_MARSHAL:
+            items, canonical = marshal.loads(payload)
+        else:
+            items, canonical = pickle.loads(payload)
+    except Exception:
+        return None
+    return Arguments(items, canonical=canonical)
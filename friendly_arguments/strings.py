@@ -0,0 +1,207 @@
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from . import parser as parser_module
+from .parser import Arguments, ArgumentError, Parser
+
+# Whitespace that separates shlex words
+_SPACE = ' \t\r\n'
+
+# One word: unquoted runs, quoted strings and escaped characters, glued
+# together. Unterminated quotes and a final backslash never match.
+_WORD = r'''(?:[^ \t\r\n'"\\]+|'[^']*'|"(?:[^"\\]|\\.)*"|\\.)+'''
+
+# Splitting on words (kept by the group) leaves the gaps between them,
+# which hold only whitespace unless some quote or backslash is unterminated
+_WORDS = re.compile('(' + _WORD + ')', re.DOTALL)
+_NEXT_WORD = re.compile(r'[ \t\r\n]*' + _WORD, re.DOTALL)
+
+# Quoted words, and the pieces of words that mix several kinds of quoting
+_DOUBLE_QUOTED = re.compile(r'''"((?:[^"\\]|\\.)*)"''', re.DOTALL)
+_PIECE = re.compile(r'''[^'"\\]+|'([^']*)'|"((?:[^"\\]|\\.)*)"|\\(.)''', re.DOTALL)
+_ESCAPED = re.compile(r'\\(.)', re.DOTALL)
+
+# Inside double quotes, shlex only unescapes a quote or a backslash
+_DOUBLE_QUOTED_ESCAPE = re.compile(r'\\(["\\])')
+
+# Characters that rule out the str.split() fast path: quoting, escapes,
+# and whitespace that str.split() separates on but shlex doesn't
+_SPECIAL = re.compile(r'''['"\\\x0b\x0c\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]''')
+
+
+def _unescape(text: str) -> str:
+    """Unescape a run outside quotes, where a backslash escapes any character."""
+    if '\\\\' in text:
+        return _ESCAPED.sub(r'\1', text)
+    return text.replace('\\', '')  # every backslash escapes a non-backslash
+
+
+def _unescape_double(text: str) -> str:
+    """Unescape the inside of double quotes."""
+    if '\\' not in text:
+        return text
+    if '\\\\' in text:
+        return _DOUBLE_QUOTED_ESCAPE.sub(r'\1', text)
+    return text.replace('\\"', '"')
+
+
+def _unquote_piece(match) -> str:
+    single, double, escaped = match.groups()
+    if single is not None:
+        return single
+    if double is not None:
+        return _unescape_double(double)
+    if escaped is not None:
+        return escaped
+    return match.group()
+
+
+def _unquote(word: str) -> str:
+    """Remove the quoting of a word matched by _WORD."""
+    # The usual shapes skip the piece by piece substitution: 'text',
+    # "text" and unquoted text with escapes (a\ b)
+    first = word[0]
+    if first == "'" and word.find("'", 1) == len(word) - 1:
+        return word[1:-1]
+    if first == '"':
+        quoted = _DOUBLE_QUOTED.fullmatch(word)
+        if quoted is not None:
+            return _unescape_double(quoted.group(1))
+    elif "'" not in word and '"' not in word:
+        return _unescape(word)
+    return _PIECE.sub(_unquote_piece, word)
+
+
+def _split_quoted(cmdline: str) -> List[str]:
+    parts = _WORDS.split(cmdline)
+    if ''.join(parts[0::2]).strip(_SPACE):
+        _raise_unterminated(cmdline)
+    return [_unquote(word) if "'" in word or '"' in word or '\\' in word else word
+            for word in parts[1::2]]
+
+
+def _raise_unterminated(cmdline: str) -> None:
+    """Raise shlex's error for a line with an unterminated word."""
+    position = 0
+    while True:
+        found = _NEXT_WORD.match(cmdline, position)
+        if found is None:
+            rest = cmdline[position:].lstrip(_SPACE)
+            break
+        position = found.end()
+        if position < len(cmdline) and cmdline[position] not in _SPACE:
+            rest = cmdline[position:]  # the word stopped at an open quote or backslash
+            break
+
+    # An open double quote runs to the end of the line, where shlex is still
+    # expecting the character after an odd run of backslashes
+    if rest[0] == '\\' or (rest[0] == '"' and (len(rest) - len(rest.rstrip('\\'))) % 2):
+        raise ArgumentError("No escaped character")
+    raise ArgumentError("No closing quotation")
+
+
+def split_string(cmdline: str) -> Iterator[str]:
+    """
+    Split a command line into words, like shlex.split() does.
+
+    Quoting and escapes follow POSIX shlex: single quotes keep everything
+    literally, double quotes only unescape \\" and \\\\, a backslash outside
+    quotes escapes any character, and adjacent quoted parts form one word
+    ('a"b c"' is 'ab c'). Comments are not recognized, as in shlex.split().
+
+    Lines without quotes or backslashes are split by str.split(); the others
+    are split by one regular expression pass, and only the quoted words are
+    unquoted. Both run in C, instead of shlex's character by character state
+    machine.
+
+    Example:
+        list(split_string('--name "João Silva" --tag=a\\ b'))
+        # ['--name', 'João Silva', '--tag=a b']
+
+    Raises:
+        ArgumentError: On an unterminated quote or a final backslash (the
+                       cases where shlex.split() raises ValueError)
+
+    Returns:
+        Iterator over the words
+    """
+    if _SPECIAL.search(cmdline) is None:
+        return iter(cmdline.split())
+    return iter(_split_quoted(cmdline))
+
+
+def parse_string(cmdline: str, parser: Optional[Parser] = None,
+                 defaults: Optional[Dict[str, Any]] = None) -> Arguments:
+    """
+    Parse a command line received as a single string.
+
+    The words are fed to the parser as they are split, with the same
+    results as Parser.parse() on shlex.split(cmdline).
+
+    Example:
+        # received over a socket
+        args = parse_string('--env prod --message "deploy v2" -v', parser)
+        args['--message']  # 'deploy v2'
+
+    Args:
+        cmdline: Arguments to parse, without the program name
+        parser: Parser with the declared options (default: get_args() rules)
+        defaults: Optional extra defaults
+
+    Returns:
+        Arguments dictionary keyed by canonical option names
+    """
+    if parser is None:
+        from .named import _DEFAULT_PARSER as parser
+    if parser._lookup is None:
+        parser.compile()
+
+    args = Arguments(parser._base_defaults(defaults), canonical=parser._canonical)
+    if parser_module._instrumentation is None:
+        parser._parse_tokens(split_string(cmdline), args)
+    else:
+        parser_module._instrumentation.parse_tokens(parser, cmdline, split_string(cmdline), args)
+    return args
+
+
+def parse_strings(cmdlines: Iterable[str], parser: Optional[Parser] = None,
+                  defaults: Optional[Dict[str, Any]] = None) -> Iterator[Arguments]:
+    """
+    Parse many command line strings with one compiled parser.
+
+    Like parse_many(), the defaults are merged once for the whole batch.
+    Results are produced one at a time, so lines can be consumed as they
+    arrive (e.g., from a socket or a file).
+
+    Example:
+        with open('commands.txt') as lines:
+            for args in parse_strings(lines, parser):
+                run(args)
+
+    Args:
+        cmdlines: Command line strings, without program names
+        parser: Parser with the declared options (default: get_args() rules)
+        defaults: Optional extra defaults
+
+    Returns:
+        Generator of Arguments dictionaries, in input order
+    """
+    if parser is None:
+        from .named import _DEFAULT_PARSER as parser
+    if parser._lookup is None:
+        parser.compile()
+
+    base = parser._base_defaults(defaults)
+    canonical = parser._canonical
+    parse_tokens = parser._parse_tokens
+    special = _SPECIAL.search
+    instrumentation = parser_module._instrumentation
+
+    for cmdline in cmdlines:
+        args = Arguments(base, canonical=canonical)
+        words = cmdline.split() if special(cmdline) is None else _split_quoted(cmdline)
+        if instrumentation is None:
+            parse_tokens(iter(words), args)
+        else:
+            instrumentation.parse_tokens(parser, cmdline, iter(words), args)
+        yield args
@@ -0,0 +1,238 @@
+from enum import Enum
+from typing import Any, Callable, Container, List, Mapping, Optional, Sequence, Tuple
+
+from .converters import ListOf
+from .parser import ArgumentError, Option, Parser
+
+# A compiled check takes one (converted) value and returns an error or None
+Check = Callable[[Any], Optional[str]]
+
+# A compiled validator takes a parse result and the canonical names given in it
+Validator = Callable[[Mapping, Optional[Container[str]]], None]
+
+
+class ValidationError(ArgumentError):
+    """
+    Raised once per parse with every constraint violation found.
+
+    Example:
+        try:
+            args = parser.parse()
+        except ValidationError as error:
+            for message in error.errors:
+                print(message)
+
+    Args:
+        errors: One message per violation
+    """
+
+    def __init__(self, errors: Sequence[str]):
+        self.errors = list(errors)
+        if len(self.errors) == 1:
+            message = self.errors[0]
+        else:
+            message = f"{len(self.errors)} invalid arguments:\n" + '\n'.join(
+                f"  - {error}" for error in self.errors
+            )
+        super().__init__(message)
+
+    def __reduce__(self):
+        return type(self), (self.errors,)
+
+
+def _show(value: Any) -> str:
+    # Enum members read better by name
+    return value.name if isinstance(value, Enum) else repr(value)
+
+
+def _range_error(name: str, value: Any, minimum: Any, maximum: Any) -> Optional[str]:
+    try:
+        if minimum is not None and value < minimum:
+            return f"Option {name} must be at least {minimum!r} (got {value!r})"
+        if maximum is not None and value > maximum:
+            return f"Option {name} must be at most {maximum!r} (got {value!r})"
+    except TypeError:
+        return f"Option {name} must be a number (got {value!r})"
+    return None
+
+
+def _choices_error(name: str, value: Any, choices: Tuple[Any, ...]) -> str:
+    shown = ', '.join(_show(choice) for choice in choices)
+    return f"Option {name} must be one of {shown} (got {_show(value)})"
+
+
+def _items_check(option: Option) -> Check:
+    """Compile the checks of an option whose value is a sequence of items."""
+    name = option.name
+    choices = option.choices
+    accepted = frozenset(choices) if choices is not None else None
+    minimum = option.min
+    maximum = option.max
+    nested = option.action == 'append' and isinstance(option.type, ListOf)
+
+    def check_items(values: Any) -> Optional[str]:
+        if values is True:
+            values = (True,)  # an append option given without a value
+        for value in (item for group in values for item in group) if nested else values:
+            if accepted is not None and value not in accepted:
+                return _choices_error(name, value, choices)
+            error = _range_error(name, value, minimum, maximum)
+            if error is not None:
+                return error
+        return None
+
+    return check_items
+
+
+def compile_validator(parser: Parser) -> Optional[Validator]:
+    """
+    Compile the constraints of a parser into a single validation function.
+
+    Constraints are declared on the options (required, choices, min, max)
+    and with Parser.add_exclusive(). The returned function checks a parse
+    result in one pass over the constrained options only, collects every
+    violation and raises a single ValidationError. Only the options that
+    were given are checked, and only they count for mutual exclusion:
+    the parsers pass the canonical names they stored, so an explicit
+    value equal to the default is checked too. Without those names
+    (a result built elsewhere), an option counts as given when its value
+    differs from the declared default.
+
+    Parser.compile() calls this when some constraint is declared; without
+    constraints it returns None and parsing doesn't validate at all.
+
+    Args:
+        parser: Parser with the declared options and exclusive groups
+
+    Returns:
+        Function taking a parse result and the given names (or None), or
+        None when there's nothing to check
+    """
+    # One flat list per kind of rule, so the common checks run inline
+    required: List[str] = []
+    choices: List[Tuple[str, frozenset, Tuple[Any, ...]]] = []
+    bounded: List[Tuple[str, Any, Any]] = []
+    lower: List[Tuple[str, Any]] = []
+    upper: List[Tuple[str, Any]] = []
+    items: List[Tuple[str, Check]] = []
+    for option in parser.options:
+        name, minimum, maximum = option.name, option.min, option.max
+        if option.required:
+            required.append(name)
+        if option.choices is None and minimum is None and maximum is None:
+            continue
+        if option.action == 'append' or isinstance(option.type, ListOf):
+            items.append((name, _items_check(option)))
+            continue
+        if option.choices is not None:
+            choices.append((name, frozenset(option.choices), option.choices))
+        if minimum is not None and maximum is not None:
+            bounded.append((name, minimum, maximum))
+        elif minimum is not None:
+            lower.append((name, minimum))
+        elif maximum is not None:
+            upper.append((name, maximum))
+
+    options = {option.name: option for option in parser.options}
+    canonical = parser._canonical
+    exclusive: List[Tuple[str, ...]] = []
+    for group in parser._exclusive:
+        names = []
+        for name in group:
+            key = canonical.get(name)
+            if key is None:
+                raise ArgumentError(f"Exclusive option {name!r} is not declared")
+            names.append(key)
+        exclusive.append(tuple(names))
+    defaults = {name: option.default for name, option in options.items()}
+
+    if not (required or choices or bounded or lower or upper or items or exclusive):
+        return None
+
+    # Errors are reported in declaration order, exclusive groups last
+    order = {name: position for position, name in enumerate(options)}
+    last = len(order)
+
+    def validate(args: Mapping, given: Optional[Container[str]] = None) -> None:
+        errors: List[Tuple[str, str]] = []
+        get = args.get
+        if given is None:
+            given = {key for key, value in args.items()
+                     if key not in defaults or value != defaults[key]}
+
+        for key in required:
+            if key not in args:
+                errors.append((key, f"Option {key} is required"))
+
+        for key, accepted, declared in choices:
+            if key in given:
+                value = get(key)
+                if value not in accepted:
+                    errors.append((key, _choices_error(key, value, declared)))
+
+        for key, minimum, maximum in bounded:
+            if key in given:
+                value = get(key)
+                try:
+                    if minimum <= value <= maximum:
+                        continue
+                except TypeError:
+                    pass
+                errors.append((key, _range_error(key, value, minimum, maximum)))
+
+        for key, minimum in lower:
+            if key in given:
+                value = get(key)
+                try:
+                    if value >= minimum:
+                        continue
+                except TypeError:
+                    pass
+                errors.append((key, _range_error(key, value, minimum, None)))
+
+        for key, maximum in upper:
+            if key in given:
+                value = get(key)
+                try:
+                    if value <= maximum:
+                        continue
+                except TypeError:
+                    pass
+                errors.append((key, _range_error(key, value, None, maximum)))
+
+        for key, check in items:
+            if key in given:
+                error = check(get(key))
+                if error is not None:
+                    errors.append((key, error))
+
+        for group in exclusive:
+            used = [key for key in group if key in given]
+            if len(used) > 1:
+                errors.append(('', f"Options {' and '.join(used)} can't be used together"))
+
+        if errors:
+            # Stable sort: the errors of one option keep their order
+            errors.sort(key=lambda error: order.get(error[0], last))
+            raise ValidationError([message for _, message in errors])
+
+    return validate
+
+
+def validate(args: Mapping, parser: Parser, given: Optional[Container[str]] = None) -> None:
+    """
+    Check an already built result (e.g. a merged or edited one) against a parser.
+
+    Args:
+        args: Result keyed by canonical names
+        parser: Parser with the constraints
+        given: Canonical names of the options the user gave (default: the
+               ones whose value differs from the declared default)
+
+    Raises:
+        ValidationError: With every violation found
+    """
+    if parser._lookup is None:
+        parser.compile()
+    if parser._validator is not None:
+        parser._validator(args, given)
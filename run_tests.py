@@ -6,11 +6,32 @@ Uso:
     python3 run_tests.py              # Executar todos os testes
     python3 run_tests.py -v           # Modo verbose
     python3 run_tests.py --help       # Mostrar ajuda
+    python3 run_tests.py --bench      # Executar a suíte de benchmarks
 """
 
+import os
 import sys
 import unittest
 
+
+def check_import_budget():
+    """Verifica se `import friendly_arguments` respeita o limite de tempo"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+    from bench_import import BUDGET_MS, measure_import_time
+    
+    best = min(measure_import_time(runs=5)) / 1000
+    ok = best <= BUDGET_MS
+    status = "✅" if ok else "❌"
+    print(f"{status} Tempo de importação: {best:.2f} ms (limite: {BUDGET_MS:.2f} ms)")
+    return ok
+
+def run_benchmarks():
+    """Executa benchmarks/bench_suite.py com as opções restantes"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+    from bench_suite import main as bench_main
+    
+    return bench_main([arg for arg in sys.argv[1:] if arg != '--bench'])
+
 def main():
     """Executa os testes unitários"""
     
@@ -23,8 +44,17 @@ def main():
         print("\nOpções:")
         print("  -v, --verbose    Modo verbose (mostra cada teste)")
         print("  -h, --help       Mostra esta mensagem")
+        print("  --skip-import-budget  Não verifica o tempo de importação")
+        print("  --bench          Executa a suíte de benchmarks em vez dos testes")
+        print("    --quick            Só workloads de até 10 mil tokens")
+        print("    --no-memory        Não mede o pico de memória")
+        print("    --tolerance=0.25   Queda máxima aceita em relação ao baseline")
+        print("    --update-baseline  Grava os resultados em benchmarks/baseline.json")
         return 0
     
+    if '--bench' in sys.argv:
+        return run_benchmarks()
+    
     # Descobrir e executar testes
     loader = unittest.TestLoader()
     start_dir = 'tests'
@@ -50,10 +80,14 @@ def main():
     if result.skipped:
         print(f"⏭️  Pulados: {len(result.skipped)}")
     
+    import_ok = True
+    if '--skip-import-budget' not in sys.argv:
+        import_ok = check_import_budget()
+    
     print("=" * 70)
     
     # Retornar código de saída apropriado
-    return 0 if result.wasSuccessful() else 1
+    return 0 if result.wasSuccessful() and import_ok else 1
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -26,6 +26,11 @@ setup(
     author_email=email,
     url=url,
     install_requires=[],
+    entry_points={
+        'console_scripts': [
+            'friendly-arguments-batch = friendly_arguments.batch:main',
+        ],
+    },
     license='MIT',
     keywords=['dev', 'scripts', 'args', 'tools'],
     classifiers=[
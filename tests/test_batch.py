@@ -0,0 +1,179 @@
+"""
+Testes unitários para o módulo friendly_arguments.batch
+"""
+
+import enum
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from friendly_arguments.batch import BatchStats, main, process_manifest
+from friendly_arguments.parser import Parser, Option, ArgumentError
+from friendly_arguments.snapshot import save_parser
+
+
+class Queue(enum.Enum):
+    FAST = 'fast'
+    SLOW = 'slow'
+
+
+PARSER = Parser([
+    Option('--name', '-n', required=True),
+    Option('--retries', type=int, default=1),
+    Option('--ids', type=int, action='append'),
+    Option('--queue', type=Queue),
+    Option('--verbose', '-v', flag=True, default=False),
+])
+
+JSONL = '\n'.join([
+    '{"args": "--name a --retries 3 -v"}',
+    '"--name \'b c\' --retries x"',
+    '',
+    '["--name", "d", "--ids", "1", "--ids", "2", "--queue", "fast"]',
+    '{"other": 1}',
+    'not json',
+    '"--retries 2"',
+]) + '\n'
+
+
+class TestProcessManifest(unittest.TestCase):
+    """Testes para process_manifest()"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return path
+    
+    def run_manifest(self, name, text, **kwargs):
+        source = self.write(name, text)
+        output = os.path.join(self.directory.name, 'out.jsonl')
+        stats = process_manifest(source, output, kwargs.pop('parser', PARSER), **kwargs)
+        with open(output, encoding='utf-8') as file:
+            return stats, [json.loads(line) for line in file]
+    
+    def test_jsonl(self):
+        """Testa strings, listas de tokens, objetos e erros no JSONL"""
+        stats, records = self.run_manifest('jobs.jsonl', JSONL, workers=0)
+        
+        self.assertEqual([record['line'] for record in records], [1, 2, 4, 5, 6, 7])
+        self.assertEqual(records[0]['args'], {'--retries': 3, '--verbose': True, '--name': 'a'})
+        self.assertIn('--retries', records[1]['error'])
+        self.assertEqual(records[2]['args']['--ids'], [1, 2])
+        self.assertEqual(records[2]['args']['--queue'], 'fast')
+        self.assertIn("'args'", records[3]['error'])
+        self.assertIn('error', records[4])
+        self.assertEqual(records[5]['errors'], ['Option --name is required'])
+        self.assertEqual((stats.rows, stats.errors), (6, 4))
+    
+    def test_workers_keep_order(self):
+        """Testa que o pool de processos mantém a ordem e os resultados"""
+        lines = ''.join(f'--name job{i} --retries {i}\n' for i in range(500))
+        _, expected = self.run_manifest('jobs.txt', lines, workers=0)
+        stats, records = self.run_manifest('jobs.txt', lines, workers=2, chunk_size=7)
+        
+        self.assertEqual(records, expected)
+        self.assertEqual(records[499]['args']['--name'], 'job499')
+        self.assertEqual(stats.rows, 500)
+    
+    def test_csv(self):
+        """Testa a coluna escolhida de um CSV com aspas"""
+        text = 'id,cmd\n1,--name a -v\n2,"--name ""q r"""\n3\n'
+        stats, records = self.run_manifest('jobs.csv', text, field='cmd', workers=0)
+        
+        self.assertEqual(records[0]['args']['--name'], 'a')
+        self.assertEqual(records[1]['args']['--name'], 'q r')
+        self.assertIn("'cmd'", records[2]['error'])
+        self.assertEqual(stats.errors, 1)
+    
+    def test_csv_without_column(self):
+        """Testa que um CSV sem a coluna gera ArgumentError"""
+        with self.assertRaises(ArgumentError):
+            self.run_manifest('jobs.csv', 'id,cmd\n1,x\n', workers=0)
+    
+    def test_defaults(self):
+        """Testa os defaults extras aplicados a cada linha"""
+        _, records = self.run_manifest('jobs.txt', '--name a\n', workers=0,
+                                       defaults={'--queue': 'slow'})
+        self.assertEqual(records[0]['args']['--queue'], 'slow')
+    
+    def test_report(self):
+        """Testa os relatórios de progresso"""
+        reports = []
+        lines = ''.join(f'--name {i}\n' for i in range(50))
+        stats, _ = self.run_manifest('jobs.txt', lines, workers=0, chunk_size=10,
+                                     report=lambda stats: reports.append(stats.rows),
+                                     report_every=0)
+        
+        self.assertEqual(reports, [10, 20, 30, 40, 50])
+        self.assertIsInstance(stats, BatchStats)
+        self.assertGreater(stats.rows_per_second, 0)
+        self.assertEqual(stats.as_dict()['rows'], 50)
+    
+    def test_unknown_format(self):
+        """Testa que um formato desconhecido gera ArgumentError"""
+        with self.assertRaises(ArgumentError):
+            self.run_manifest('jobs.txt', '', format='xml')
+
+
+class TestMain(unittest.TestCase):
+    """Testes para a linha de comando"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, 'jobs.jsonl')
+        self.output = os.path.join(self.directory.name, 'out.jsonl')
+        with open(self.source, 'w') as file:
+            file.write('"--name a"\n"--retries 1"\n')
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def run_main(self, *argv):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            code = main(list(argv))
+        return code, stderr.getvalue()
+    
+    def test_parser_target(self):
+        """Testa --parser módulo:atributo e o código de saída com erros"""
+        code, stderr = self.run_main('-i', self.source, '-o', self.output, '-w', '0',
+                                     '--parser', f'{__name__}:PARSER')
+        self.assertEqual(code, 1)
+        self.assertIn('2 rows, 1 errors', stderr)
+        with open(self.output) as file:
+            self.assertEqual(len(file.readlines()), 2)
+    
+    def test_snapshot(self):
+        """Testa --snapshot com um parser salvo"""
+        snapshot = os.path.join(self.directory.name, 'spec.bin')
+        save_parser(Parser([Option('--name')]), snapshot)
+        code, _ = self.run_main('-i', self.source, '-o', self.output, '-w', '0', '-q',
+                                '--snapshot', snapshot)
+        self.assertEqual(code, 0)
+    
+    def test_usage_errors(self):
+        """Testa que erros de uso saem com 2"""
+        self.assertEqual(self.run_main('--format', 'xml')[0], 2)
+        self.assertEqual(self.run_main('-i', os.path.join(self.directory.name, 'nada'))[0], 2)
+        self.assertEqual(self.run_main('--parser', 'x', '--snapshot', 'y')[0], 2)
+    
+    def test_help(self):
+        """Testa --help"""
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(main(['--help']), 0)
+        self.assertIn('--chunk-size', stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Testes unitários para o módulo friendly_arguments.binary
+"""
+
+import os
+import tracemalloc
+import unittest
+from array import array
+from unittest.mock import patch
+
+from friendly_arguments.binary import parse_bytes
+from friendly_arguments.named import get_args
+from friendly_arguments.parser import Parser, Option, ArgumentError
+
+
+class TestParseBytes(unittest.TestCase):
+    """Testes para parse_bytes() e Parser.parse_bytes()"""
+    
+    def test_same_result_as_get_args(self):
+        """Testa que o resultado equivale ao de get_args() sobre o argv decodificado"""
+        argv = ['script.py', '--name', 'João', '--age=25', '-v', 'pos', 'a=b', '--x=', '--y']
+        result = parse_bytes([os.fsencode(arg) for arg in argv])
+        expected = get_args(argv=argv)
+        
+        self.assertEqual(list(result), list(expected))
+        for key, value in expected.items():
+            if value is True:
+                self.assertIs(result[key], True)
+            else:
+                self.assertEqual(result[key], os.fsencode(value))
+    
+    def test_non_utf8_values(self):
+        """Testa que bytes inválidos em UTF-8 chegam intactos"""
+        result = parse_bytes([b'prog', b'--input', b'caf\xe9.txt', b'--out=\xff\xfe'])
+        self.assertEqual(result['--input'], b'caf\xe9.txt')
+        self.assertEqual(result['--out'], b'\xff\xfe')
+    
+    def test_separate_value_is_original_token(self):
+        """Testa que um valor em token próprio é o próprio objeto bytes"""
+        value = b'x' * 1000
+        result = parse_bytes([b'prog', b'--data', value])
+        self.assertIs(result['--data'], value)
+    
+    def test_views_share_memory(self):
+        """Testa que views=True devolve memoryviews do token original"""
+        token = b'--data=' + b'A' * 1000
+        other = b'payload'
+        result = parse_bytes([b'prog', token, b'--other', other], views=True)
+        
+        self.assertIsInstance(result['--data'], memoryview)
+        self.assertIs(result['--data'].obj, token)
+        self.assertEqual(result['--data'], b'A' * 1000)
+        self.assertIs(result['--other'].obj, other)
+    
+    def test_views_peak_memory(self):
+        """Testa que um payload grande em --data=... não é decodificado nem copiado"""
+        payload = b'A' * (8 * 1024 * 1024)
+        argv = [b'prog', b'--data=' + payload, b'-vd=' + payload]
+        parser = Parser([Option('--verbose', '-v', flag=True), Option('--debug', '-d')])
+        tracemalloc.start()
+        try:
+            result = parse_bytes(argv, parser, views=True)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        self.assertEqual(len(result['--data']), len(payload))
+        self.assertEqual(len(result['--debug']), len(payload))
+        self.assertLess(peak, len(payload) // 100)
+    
+    def test_default_argv(self):
+        """Testa que sem argv o sys.argv é codificado de volta com os.fsencode"""
+        argv = ['script.py', '--path', os.fsdecode(b'/tmp/\xe9')]
+        with patch('sys.argv', argv):
+            result = parse_bytes()
+        self.assertEqual(result['--path'], b'/tmp/\xe9')
+    
+    def test_declared_options(self):
+        """Testa aliases, tipos, flags, append e count no modo bytes"""
+        parser = Parser([
+            Option('--name', '-n', default=b'anon'),
+            Option('--port', '-p', type=int),
+            Option('--ids', type=int, action='append'),
+            Option('--tag', '-t', action='append'),
+            Option('--verbose', '-v', action='count'),
+            Option('--dry-run', flag=True),
+        ])
+        result = parser.parse_bytes([
+            b'prog', b'-p', b'8080', b'--ids=1', b'--ids', b'2', b'-t', b'\xe9',
+            b'--tag=b', b'-vv', b'--dry-run', b'x',
+        ])
+        
+        self.assertEqual(result['--name'], b'anon')
+        self.assertEqual(result['--port'], 8080)
+        self.assertEqual(result['--ids'], array('q', [1, 2]))
+        self.assertEqual(result['--tag'], (b'\xe9', b'b'))
+        self.assertEqual(result['--verbose'], 2)
+        self.assertIs(result['--dry-run'], True)
+        self.assertEqual(result.lookup('-p'), 8080)
+    
+    def test_typed_non_utf8_value(self):
+        """Testa que valores tipados são decodificados como o sys.argv"""
+        from pathlib import Path
+        parser = Parser([Option('--path', type=Path)])
+        result = parser.parse_bytes([b'prog', b'--path', b'/tmp/\xe9'])
+        self.assertEqual(os.fsencode(result['--path']), b'/tmp/\xe9')
+    
+    def test_invalid_typed_value(self):
+        """Testa que valores inválidos geram ArgumentError"""
+        parser = Parser([Option('--port', type=int)])
+        with self.assertRaises(ArgumentError):
+            parser.parse_bytes([b'prog', b'--port=abc'])
+    
+    def test_defaults(self):
+        """Testa defaults extras por alias"""
+        parser = Parser([Option('--name', '-n')])
+        result = parse_bytes([b'prog'], parser, defaults={'-n': b'x'})
+        self.assertEqual(result, {'--name': b'x'})
+
+
+if __name__ == '__main__':
+    unittest.main()
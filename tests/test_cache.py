@@ -0,0 +1,183 @@
+"""
+Testes unitários para o módulo friendly_arguments.cache
+"""
+
+import pickle
+import sys
+import unittest
+
+from friendly_arguments.cache import ParseCache, ReadOnlyArguments, cached_get_args, parse_cache
+from friendly_arguments.named import get_arg
+from friendly_arguments.parser import Parser, Option
+
+
+class TestParseCache(unittest.TestCase):
+    """Testes para o cache de resultados ParseCache"""
+    
+    def setUp(self):
+        """Cria um cache pequeno e salva o sys.argv original"""
+        self.cache = ParseCache(maxsize=2)
+        self.original_argv = sys.argv.copy()
+    
+    def tearDown(self):
+        """Restaura o sys.argv original após cada teste"""
+        sys.argv = self.original_argv
+    
+    def test_hit_returns_same_object(self):
+        """Testa que a segunda chamada reaproveita o resultado"""
+        argv = ['script.py', '--name', 'João']
+        first = self.cache.get_args(argv=argv)
+        second = self.cache.get_args(argv=argv)
+        
+        self.assertIs(first, second)
+        self.assertEqual(first, {'--name': 'João'})
+        self.assertEqual(self.cache.cache_info(), (1, 1, 2, 1))
+    
+    def test_reassigned_sys_argv_is_detected(self):
+        """Testa que reatribuir sys.argv não retorna resultado antigo"""
+        sys.argv = ['script.py', '--name=A']
+        self.assertEqual(self.cache.get_args()['--name'], 'A')
+        
+        sys.argv = ['script.py', '--name=B']
+        self.assertEqual(self.cache.get_args()['--name'], 'B')
+    
+    def test_mutated_sys_argv_is_detected(self):
+        """Testa que alterar sys.argv no lugar não retorna resultado antigo"""
+        sys.argv = ['script.py', '--name=A']
+        self.cache.get_args()
+        sys.argv.append('--verbose')
+        
+        self.assertTrue(self.cache.get_args()['--verbose'])
+    
+    def test_key_includes_defaults_and_parser(self):
+        """Testa que defaults e parser fazem parte da chave"""
+        argv = ['script.py']
+        parser = Parser([Option('--port', default='80')])
+        
+        self.assertEqual(self.cache.get_args({'--a': 1}, argv), {'--a': 1})
+        self.assertEqual(self.cache.get_args({'--a': 2}, argv), {'--a': 2})
+        self.assertEqual(self.cache.get_args(argv=argv, parser=parser), {'--port': '80'})
+        self.assertEqual(self.cache.hits, 0)
+    
+    def test_key_includes_default_types(self):
+        """Testa que defaults iguais de tipos diferentes (1, 1.0, True) não se misturam"""
+        argv = ['script.py']
+        for value in (1, True, 1.0):
+            result = self.cache.get_args({'--debug': value}, argv)
+            self.assertIs(type(result['--debug']), type(value))
+        self.assertEqual(self.cache.hits, 0)
+        
+        self.assertIs(self.cache.get_args({'--debug': True}, argv)['--debug'], True)
+        self.assertEqual(self.cache.hits, 1)
+    
+    def test_parser_changes_invalidate(self):
+        """Testa que declarar uma nova opção gera novo parsing"""
+        parser = Parser([Option('--name')])
+        argv = ['script.py', '-n', 'x']
+        self.assertEqual(self.cache.get_args(argv=argv, parser=parser), {'-n': 'x'})
+        
+        parser.add_option('--number', '-n')
+        
+        self.assertEqual(self.cache.get_args(argv=argv, parser=parser), {'--number': 'x'})
+    
+    def test_lru_eviction(self):
+        """Testa a remoção do item menos usado recentemente"""
+        a, b, c = ['s', '--a'], ['s', '--b'], ['s', '--c']
+        self.cache.get_args(argv=a)
+        self.cache.get_args(argv=b)
+        self.cache.get_args(argv=a)  # 'a' passa a ser o mais recente
+        self.cache.get_args(argv=c)  # remove 'b'
+        
+        self.cache.get_args(argv=a)
+        self.assertEqual(self.cache.hits, 2)
+        self.cache.get_args(argv=b)
+        self.assertEqual(self.cache.misses, 4)
+    
+    def test_unhashable_defaults_are_not_cached(self):
+        """Testa defaults com valores não hasheáveis"""
+        defaults = {'--tags': ['a', 'b']}
+        first = self.cache.get_args(defaults, ['s'])
+        second = self.cache.get_args(defaults, ['s'])
+        
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(self.cache.cache_info().currsize, 0)
+    
+    def test_invalidate(self):
+        """Testa a invalidação explícita"""
+        parser = Parser()
+        self.cache.get_args(argv=['s'], parser=parser)
+        self.cache.get_args(argv=['s'])
+        
+        self.cache.invalidate(parser)
+        self.assertEqual(self.cache.cache_info().currsize, 1)
+        self.cache.invalidate()
+        self.assertEqual(self.cache.cache_info().currsize, 0)
+        
+        self.cache.clear()
+        self.assertEqual(self.cache.cache_info(), (0, 0, 2, 0))
+    
+    def test_result_is_read_only(self):
+        """Testa que o resultado compartilhado não pode ser alterado"""
+        args = self.cache.get_args(argv=['s', '--a=1'])
+        
+        with self.assertRaises(TypeError):
+            args['--a'] = '2'
+        with self.assertRaises(TypeError):
+            args.update({'--b': 1})
+        with self.assertRaises(TypeError):
+            del args['--a']
+        self.assertEqual(dict(args), {'--a': '1'})
+    
+    def test_values_are_read_only(self):
+        """Testa que os arrays das opções repetidas também não podem ser alterados"""
+        parser = Parser([Option('--id', type=int, action='append'), Option('--tag', action='append')])
+        argv = ['s', '--id', '1', '--id', '2', '--tag', 'a']
+        args = self.cache.get_args(argv=argv, parser=parser)
+        
+        with self.assertRaises(AttributeError):
+            args['--id'].append(99)
+        with self.assertRaises(TypeError):
+            args['--id'][0] = 99
+        self.assertEqual(list(self.cache.get_args(argv=argv, parser=parser)['--id']), [1, 2])
+        self.assertEqual(args['--tag'], ('a',))
+        self.assertEqual(list(pickle.loads(pickle.dumps(args))['--id']), [1, 2])
+    
+    def test_aliases_and_pickle(self):
+        """Testa get_arg() com aliases e serialização com pickle"""
+        parser = Parser([Option('--name', '-n')])
+        args = self.cache.get_args(argv=['s', '-n', 'Ana'], parser=parser)
+        
+        self.assertEqual(get_arg(args, '-n'), 'Ana')
+        copy = pickle.loads(pickle.dumps(args))
+        self.assertIsInstance(copy, ReadOnlyArguments)
+        self.assertEqual(copy, args)
+        self.assertEqual(copy.lookup('-n'), 'Ana')
+
+
+class TestCachedGetArgs(unittest.TestCase):
+    """Testes para a função cached_get_args()"""
+    
+    def setUp(self):
+        """Limpa o cache global e salva o sys.argv original"""
+        parse_cache.clear()
+        self.original_argv = sys.argv.copy()
+    
+    def tearDown(self):
+        """Limpa o cache global e restaura o sys.argv original"""
+        parse_cache.clear()
+        sys.argv = self.original_argv
+    
+    def test_shared_between_callers(self):
+        """Testa que chamadas independentes compartilham o resultado"""
+        sys.argv = ['script.py', '--port', '8080']
+        
+        results = [cached_get_args() for _ in range(12)]
+        
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(parse_cache.cache_info().hits, 11)
+        self.assertEqual(parse_cache.cache_info().misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Testes unitários para o módulo friendly_arguments.commands
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from friendly_arguments.commands import Command, CommandTable
+from friendly_arguments.parser import Parser, Option, ArgumentError
+
+
+MODULE_SOURCE = '''
+from friendly_arguments import Parser, Option
+
+PARSER = Parser([Option('--port', '-p', type=int, default=80)])
+
+
+def main(args):
+    return ('{name}', dict(args))
+'''
+
+
+class TestCommandTable(unittest.TestCase):
+    """Testes para a tabela de subcomandos"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Cria módulos de comando num diretório temporário"""
+        cls.directory = tempfile.TemporaryDirectory()
+        for name in ('build', 'status', 'stop', 'serve'):
+            path = os.path.join(cls.directory.name, f'fa_cmd_{name}.py')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(MODULE_SOURCE.format(name=name))
+        sys.path.insert(0, cls.directory.name)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove o diretório temporário do sys.path"""
+        sys.path.remove(cls.directory.name)
+        cls.directory.cleanup()
+    
+    def setUp(self):
+        """Cria uma tabela nova e descarrega os módulos de comando"""
+        for name in list(sys.modules):
+            if name.startswith('fa_cmd_'):
+                del sys.modules[name]
+        
+        self.table = CommandTable()
+        self.table.add('build', 'fa_cmd_build:main', 'b',
+                       parser=[Option('--jobs', '-j', type=int, default=1)])
+        self.table.add('status', 'fa_cmd_status:main', 'st')
+        self.table.add('stop', 'fa_cmd_stop:main')
+        self.table.add('serve', 'fa_cmd_serve:main', parser='fa_cmd_serve:PARSER')
+    
+    def test_dispatch_imports_only_the_command(self):
+        """Testa que só o módulo do comando executado é importado"""
+        result = self.table.dispatch(['tool', 'build', '-j', '4', '--dry-run'])
+        
+        self.assertEqual(result, ('build', {'--jobs': 4, '--dry-run': True}))
+        self.assertIn('fa_cmd_build', sys.modules)
+        for name in ('fa_cmd_status', 'fa_cmd_stop', 'fa_cmd_serve'):
+            self.assertNotIn(name, sys.modules)
+    
+    def test_parse_does_not_run_the_command(self):
+        """Testa que parse() resolve o comando sem importar o módulo dele"""
+        command, args = self.table.parse(['tool', 'status', '--all'])
+        
+        self.assertEqual(command.name, 'status')
+        self.assertEqual(args, {'--all': True})
+        self.assertFalse(command.loaded)
+        self.assertNotIn('fa_cmd_status', sys.modules)
+    
+    def test_parser_from_module(self):
+        """Testa a especificação de opções importada junto com o comando"""
+        result = self.table.dispatch(['tool', 'serve', '-p', '8080'])
+        
+        self.assertEqual(result, ('serve', {'--port': 8080}))
+    
+    def test_aliases(self):
+        """Testa comandos chamados por alias"""
+        self.assertEqual(self.table.resolve('b').name, 'build')
+        self.assertEqual(self.table.resolve('st').name, 'status')
+    
+    def test_abbreviations(self):
+        """Testa abreviações sem ambiguidade"""
+        self.assertEqual(self.table.resolve('bu').name, 'build')
+        self.assertEqual(self.table.resolve('stat').name, 'status')
+        self.assertEqual(self.table.resolve('sto').name, 'stop')
+        self.assertEqual(self.table.resolve('ser').name, 'serve')
+    
+    def test_exact_name_wins_over_abbreviation(self):
+        """Testa que um nome completo nunca é tratado como abreviação"""
+        self.table.add('stat', 'fa_cmd_status:main')
+        
+        self.assertEqual(self.table.resolve('stat').name, 'stat')
+        self.assertEqual(self.table.resolve('statu').name, 'status')
+    
+    def test_ambiguous_abbreviation(self):
+        """Testa que abreviações ambíguas geram ArgumentError"""
+        with self.assertRaises(ArgumentError) as context:
+            self.table.resolve('s')
+        
+        self.assertIn('serve, status, stop', str(context.exception))
+    
+    def test_alias_does_not_make_abbreviation_ambiguous(self):
+        """Testa que nome e alias do mesmo comando contam uma vez só"""
+        table = CommandTable()
+        table.add('list', 'fa_cmd_status:main', 'li', 'ls')
+        
+        self.assertEqual(table.resolve('l').name, 'list')
+    
+    def test_abbreviations_disabled(self):
+        """Testa a tabela sem abreviações"""
+        table = CommandTable(self.table.commands, abbreviations=False)
+        
+        self.assertEqual(table.resolve('st').name, 'status')
+        with self.assertRaises(ArgumentError):
+            table.resolve('bu')
+    
+    def test_unknown_command(self):
+        """Testa comandos desconhecidos"""
+        for word in ('deploy', 'buildx', ''):
+            with self.assertRaises(ArgumentError):
+                self.table.resolve(word)
+    
+    def test_missing_command(self):
+        """Testa argv sem comando"""
+        with self.assertRaises(ArgumentError):
+            self.table.parse(['tool'])
+        with self.assertRaises(ArgumentError):
+            self.table.parse(['tool', '--verbose'])
+    
+    def test_duplicate_names(self):
+        """Testa que nomes repetidos geram ArgumentError"""
+        self.table.add('bake', 'fa_cmd_build:main', 'b')
+        
+        with self.assertRaises(ArgumentError):
+            self.table.compile()
+    
+    def test_table_is_recompiled(self):
+        """Testa que comandos adicionados depois da compilação são encontrados"""
+        self.table.resolve('build')
+        self.table.add('bundle', 'fa_cmd_build:main')
+        
+        self.assertEqual(self.table.resolve('bun').name, 'bundle')
+        with self.assertRaises(ArgumentError):
+            self.table.resolve('bu')
+    
+    def test_invalid_declarations(self):
+        """Testa declarações de comando inválidas"""
+        with self.assertRaises(ArgumentError):
+            Command('build', 'fa_cmd_build.main')
+        with self.assertRaises(ArgumentError):
+            Command('--build', 'fa_cmd_build:main')
+        
+        command = Command('x', 'fa_cmd_build:main', parser='fa_cmd_build:main')
+        with self.assertRaises(ArgumentError):
+            command.parser
+    
+    def test_container_protocol(self):
+        """Testa len(), iteração e busca por nome"""
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual([command.name for command in self.table],
+                         ['build', 'status', 'stop', 'serve'])
+        self.assertIn('st', self.table)
+        self.assertNotIn('deploy', self.table)
+    
+    def test_accepts_parser_instance(self):
+        """Testa que o comando aceita um Parser já construído"""
+        parser = Parser([Option('--name', '-n')])
+        command = Command('greet', 'fa_cmd_build:main', parser=parser)
+        
+        self.assertIs(command.parser, parser)
+
+
+if __name__ == '__main__':
+    unittest.main()
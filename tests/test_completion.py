@@ -0,0 +1,267 @@
+"""
+Testes unitários para os módulos friendly_arguments.completion e friendly_arguments.complete
+"""
+
+import enum
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from friendly_arguments.commands import CommandTable
+from friendly_arguments.complete import FLAG, VALUE, complete, read_index, _join_equals
+from friendly_arguments.completion import (
+    build_index, completion_script, default_index_path, write_index
+)
+from friendly_arguments.parser import Parser, Option, ArgumentError
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+def make_parser():
+    """Parser usado nos testes de completação"""
+    return Parser([
+        Option('--name', '-n'),
+        Option('--verbose', '-v', flag=True),
+        Option('--color', type=Color),
+        Option('--cache', type=bool),
+    ])
+
+
+def make_table():
+    """Tabela de subcomandos usada nos testes de completação"""
+    table = CommandTable()
+    table.add('build', 'tool.build:main', 'b', parser=[Option('--jobs', '-j', type=int)])
+    table.add('status', 'tool.status:main', parser=[Option('--all', flag=True)])
+    table.add('stop', 'tool.stop:main')
+    return table
+
+
+class TestIndex(unittest.TestCase):
+    """Testes para a geração do índice de completação"""
+    
+    def setUp(self):
+        """Cria um diretório temporário para os índices"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'tool.index')
+    
+    def tearDown(self):
+        """Remove o diretório temporário"""
+        self.directory.cleanup()
+    
+    def test_parser_index(self):
+        """Testa o índice de um Parser: flags, valores livres e escolhas"""
+        index = build_index(make_parser())
+        
+        self.assertEqual(index['options'], {
+            '--name': VALUE, '-n': VALUE,
+            '--verbose': FLAG, '-v': FLAG,
+            '--color': ['RED', 'GREEN'],
+            '--cache': ['false', 'true'],
+        })
+    
+    def test_command_table_index(self):
+        """Testa o índice de uma tabela de subcomandos"""
+        index = build_index(make_table())
+        
+        self.assertEqual(index['commands'], {
+            'build': 'build', 'b': 'build', 'status': 'status', 'stop': 'stop',
+        })
+        self.assertEqual(index['specs']['build'], {'--jobs': VALUE, '-j': VALUE})
+        self.assertEqual(index['specs']['stop'], {})
+    
+    def test_write_and_read(self):
+        """Testa a gravação e a leitura do índice"""
+        write_index(make_parser(), 'tool', self.path)
+        
+        self.assertEqual(read_index(self.path), build_index(make_parser()))
+    
+    def test_index_is_rewritten_only_when_spec_changes(self):
+        """Testa a invalidação do índice pelo hash da especificação"""
+        parser = make_parser()
+        write_index(parser, 'tool', self.path)
+        os.utime(self.path, ns=(0, 0))
+        
+        write_index(parser, 'tool', self.path)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, 0)
+        
+        parser.add_option('--output', '-o')
+        write_index(parser, 'tool', self.path)
+        self.assertNotEqual(os.stat(self.path).st_mtime_ns, 0)
+        self.assertIn('--output', read_index(self.path)['options'])
+    
+    def test_fingerprint(self):
+        """Testa que o hash muda só quando a especificação muda"""
+        self.assertEqual(make_parser().fingerprint(), make_parser().fingerprint())
+        self.assertEqual(make_table().fingerprint(), make_table().fingerprint())
+        
+        changed = make_parser()
+        changed.options[0].aliases = ('-N',)
+        self.assertNotEqual(changed.fingerprint(), make_parser().fingerprint())
+        
+        table = make_table()
+        table.add('start', 'tool.start:main')
+        self.assertNotEqual(table.fingerprint(), make_table().fingerprint())
+    
+    def test_invalid_index(self):
+        """Testa que índices ausentes ou inválidos são ignorados"""
+        self.assertIsNone(read_index(self.path))
+        with open(self.path, 'w') as file:
+            file.write('something else\n')
+        self.assertIsNone(read_index(self.path))
+        
+        write_index(make_parser(), 'tool', self.path)
+        with open(self.path, 'a') as file:
+            file.write('O\t\t--broken\tX\n')
+        self.assertIsNone(read_index(self.path))
+    
+    def test_default_index_path(self):
+        """Testa o local padrão do índice"""
+        original = os.environ.get('XDG_CACHE_HOME')
+        os.environ['XDG_CACHE_HOME'] = self.directory.name
+        try:
+            self.assertEqual(
+                default_index_path('tool'),
+                os.path.join(self.directory.name, 'friendly_arguments', 'completion', 'tool.index'),
+            )
+        finally:
+            if original is None:
+                del os.environ['XDG_CACHE_HOME']
+            else:
+                os.environ['XDG_CACHE_HOME'] = original
+
+
+class TestComplete(unittest.TestCase):
+    """Testes para as respostas do helper de completação"""
+    
+    def setUp(self):
+        """Cria os índices de um Parser e de uma tabela de subcomandos"""
+        self.options = build_index(make_parser())
+        self.commands = build_index(make_table())
+    
+    def test_option_names(self):
+        """Testa a completação de nomes de opções"""
+        self.assertEqual(complete(self.options, ['tool', '--c'], 1), ['--cache', '--color'])
+        self.assertEqual(complete(self.options, ['tool', '-'], 1),
+                         ['--cache', '--color', '--name', '--verbose', '-n', '-v'])
+    
+    def test_choices_after_option(self):
+        """Testa a completação dos valores de uma opção"""
+        self.assertEqual(complete(self.options, ['tool', '--color', ''], 2), ['RED', 'GREEN'])
+        self.assertEqual(complete(self.options, ['tool', '--color', 'G'], 2), ['GREEN'])
+        self.assertEqual(complete(self.options, ['tool', '--color=R'], 1), ['--color=RED'])
+        self.assertEqual(complete(self.options, ['tool', '--name', ''], 2), [])
+    
+    def test_flag_does_not_expect_value(self):
+        """Testa que flags não esperam valor"""
+        self.assertEqual(complete(self.options, ['tool', '-v', '--n'], 2), ['--name'])
+        self.assertEqual(complete(self.options, ['tool', '--color', 'RED', '--v'], 3),
+                         ['--verbose'])
+    
+    def test_missing_current_word(self):
+        """Testa a posição depois da última palavra"""
+        self.assertEqual(complete(self.options, ['tool', '--color'], 2), ['RED', 'GREEN'])
+    
+    def test_commands(self):
+        """Testa a completação de subcomandos e de suas opções"""
+        self.assertEqual(complete(self.commands, ['tool', 's'], 1), ['status', 'stop'])
+        self.assertEqual(complete(self.commands, ['tool', 'build', '--'], 2), ['--jobs'])
+        self.assertEqual(complete(self.commands, ['tool', 'b', '-'], 2), ['--jobs', '-j'])
+        self.assertEqual(complete(self.commands, ['tool', 'stat', '--'], 2), ['--all'])
+        self.assertEqual(complete(self.commands, ['tool', 'build', 'x'], 2), [])
+    
+    def test_join_equals(self):
+        """Testa a junção de '--chave=valor' separado pelo bash"""
+        self.assertEqual(_join_equals(['tool', '--color', '=', 'R'], 3),
+                         (['tool', '--color=R'], 1, True))
+        self.assertEqual(_join_equals(['tool', '--color', '='], 2),
+                         (['tool', '--color='], 1, True))
+        self.assertEqual(_join_equals(['tool', '--color', '=', 'RED', '--n'], 4),
+                         (['tool', '--color=RED', '--n'], 2, False))
+        self.assertEqual(_join_equals(['tool', '--color', '=', ''], 3),
+                         (['tool', '--color=', ''], 2, False))
+
+
+class TestScripts(unittest.TestCase):
+    """Testes para os scripts de completação dos shells"""
+    
+    def setUp(self):
+        """Grava o índice de uma tabela de subcomandos"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = write_index(make_table(), 'my-tool',
+                                os.path.join(self.directory.name, 'my-tool.index'))
+    
+    def tearDown(self):
+        """Remove o diretório temporário"""
+        self.directory.cleanup()
+    
+    def test_scripts(self):
+        """Testa que cada shell recebe um script com o índice e o helper"""
+        for shell in ('bash', 'zsh', 'fish'):
+            script = completion_script(shell, 'my-tool', self.path, python='/usr/bin/python3')
+            self.assertIn('complete.py', script)
+            self.assertIn(self.path, script)
+            self.assertIn('_friendly_arguments_my_tool', script)
+        
+        with self.assertRaises(ArgumentError):
+            completion_script('powershell', 'my-tool', self.path)
+    
+    def helper(self, *args):
+        """Executa o helper num interpretador novo"""
+        helper = os.path.join(ROOT, 'friendly_arguments', 'complete.py')
+        return subprocess.run(
+            [sys.executable, '-S', helper, self.path, *args], capture_output=True, text=True,
+        )
+    
+    def test_helper(self):
+        """Testa o helper de linha de comando"""
+        result = self.helper('zsh', '2', 'my-tool', 'build', '-')
+        
+        self.assertEqual(result.stdout.split(), ['--jobs', '-j'])
+        self.assertEqual(result.returncode, 0)
+    
+    def test_helper_bash_equals(self):
+        """Testa que o bash recebe só o valor depois de '='"""
+        parser_index = os.path.join(self.directory.name, 'colors.index')
+        write_index(make_parser(), 'colors', parser_index)
+        helper = os.path.join(ROOT, 'friendly_arguments', 'complete.py')
+        result = subprocess.run(
+            [sys.executable, '-S', helper, parser_index, 'bash', '3', 'colors', '--color', '=', 'G'],
+            capture_output=True, text=True,
+        )
+        
+        self.assertEqual(result.stdout.split(), ['GREEN'])
+    
+    def test_index_format(self):
+        """Testa que o índice gravado tem só registros de texto simples"""
+        with open(self.path, encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        
+        self.assertTrue(lines[0].startswith('friendly-arguments-completion 1 '))
+        self.assertIn('C\tb\tbuild', lines)
+        self.assertIn('O\tbuild\t--jobs\t1', lines)
+    
+    @unittest.skipIf(shutil.which('bash') is None, "bash não disponível")
+    def test_bash_script(self):
+        """Testa o script de bash com COMP_WORDS de verdade"""
+        script = completion_script('bash', 'my-tool', self.path)
+        command = (
+            f"{script}\n"
+            "COMP_WORDS=(my-tool st); COMP_CWORD=1\n"
+            "_friendly_arguments_my_tool\n"
+            "printf '%s\\n' \"${COMPREPLY[@]}\"\n"
+        )
+        output = subprocess.run(['bash', '-c', command], capture_output=True, text=True).stdout
+        
+        self.assertEqual(output.split(), ['status', 'stop'])
+
+
+if __name__ == '__main__':
+    unittest.main()
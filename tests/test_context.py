@@ -0,0 +1,212 @@
+"""
+Testes unitários para o módulo friendly_arguments.context
+"""
+
+import asyncio
+import contextvars
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from friendly_arguments.cache import cached_get_args
+from friendly_arguments.commands import CommandTable
+from friendly_arguments.context import argv_context, current_argv
+from friendly_arguments.named import get_arg, get_args, get_params_sys_args
+from friendly_arguments.parser import Parser, Option
+
+
+class TestArgvContext(unittest.TestCase):
+    """Testes para argv_context() em um único fluxo"""
+    
+    def setUp(self):
+        """Salva o sys.argv original"""
+        self.original_argv = sys.argv.copy()
+        sys.argv = ['script.py', '--name', 'global']
+    
+    def tearDown(self):
+        """Restaura o sys.argv original após cada teste"""
+        sys.argv = self.original_argv
+    
+    def test_block_replaces_sys_argv(self):
+        """Testa que dentro do bloco get_args() lê o vetor do contexto"""
+        with argv_context(['job', '--name', 'local', '-v']) as argv:
+            self.assertEqual(argv, ('job', '--name', 'local', '-v'))
+            self.assertEqual(get_args(), {'--name': 'local', '-v': True})
+            self.assertEqual(get_arg(get_args(), '--name', '-n'), 'local')
+            self.assertEqual(current_argv(), argv)
+        
+        self.assertEqual(get_args(), {'--name': 'global'})
+        self.assertIs(current_argv(), sys.argv)
+        self.assertEqual(sys.argv, ['script.py', '--name', 'global'])
+    
+    def test_nested_blocks(self):
+        """Testa que blocos aninhados restauram o vetor anterior"""
+        outer = argv_context(['job', '--level=1'])
+        with outer:
+            with argv_context(['job', '--level=2']):
+                self.assertEqual(get_args()['--level'], '2')
+            self.assertEqual(get_args()['--level'], '1')
+            with outer:
+                self.assertEqual(get_args()['--level'], '1')
+            self.assertEqual(get_args()['--level'], '1')
+        self.assertNotIn('--level', get_args())
+    
+    def test_restored_after_exception(self):
+        """Testa que o vetor é restaurado mesmo com exceção no bloco"""
+        with self.assertRaises(RuntimeError):
+            with argv_context(['job', '--name', 'local']):
+                raise RuntimeError()
+        self.assertEqual(get_args()['--name'], 'global')
+    
+    def test_copy_of_argv(self):
+        """Testa que alterar a lista original não muda o vetor do contexto"""
+        argv = ['job', '--name', 'a']
+        with argv_context(argv):
+            argv[2] = 'b'
+            self.assertEqual(get_args()['--name'], 'a')
+    
+    def test_every_reader(self):
+        """Testa parser, modo preguiçoso, cache, legado e subcomandos"""
+        parser = Parser([Option('--name', '-n')])
+        table = CommandTable()
+        table.add('build', 'tool.build:main')
+        
+        with argv_context(['tool', 'build', '-n', 'local', '--text=x']):
+            self.assertEqual(parser.parse()['--name'], 'local')
+            self.assertEqual(parser.parse_lazy()['--name'], 'local')
+            self.assertEqual(get_args(lazy=True)['-n'], 'local')
+            self.assertEqual(cached_get_args()['-n'], 'local')
+            self.assertEqual(get_params_sys_args(['--text=']), {'--text=': 'x'})
+            self.assertEqual(table.parse()[0].name, 'build')
+    
+    def test_decorator(self):
+        """Testa o uso como decorador em funções comuns e assíncronas"""
+        @argv_context(['job', '--mode', 'sync'])
+        def sync_job():
+            return get_args()['--mode']
+        
+        @argv_context(['job', '--mode', 'async'])
+        async def async_job():
+            await asyncio.sleep(0)
+            return get_args()['--mode']
+        
+        self.assertEqual(sync_job(), 'sync')
+        self.assertEqual(asyncio.run(async_job()), 'async')
+        self.assertEqual(sync_job.__name__, 'sync_job')
+        self.assertNotIn('--mode', get_args())
+
+
+class TestConcurrency(unittest.TestCase):
+    """Testes de estresse com muitas tarefas e threads simultâneas"""
+    
+    TASKS = 5000
+    
+    def setUp(self):
+        """Salva o sys.argv original"""
+        self.original_argv = sys.argv.copy()
+        sys.argv = ['script.py', '--id', 'global']
+    
+    def tearDown(self):
+        """Restaura o sys.argv original após cada teste"""
+        sys.argv = self.original_argv
+    
+    def test_asyncio_tasks(self):
+        """Testa milhares de tarefas asyncio intercaladas, cada uma com seu argv"""
+        parser = Parser([Option('--id', type=int), Option('--tag', '-t', action='append')])
+        
+        async def handle(i):
+            with argv_context(['bot', '--id', str(i), '-t', 'a', '-t', str(i)]):
+                await asyncio.sleep(0)  # outras tarefas entram aqui
+                first = get_args()['--id']
+                await asyncio.sleep(0)
+                args = parser.parse()
+                await asyncio.sleep(0)
+                return first, args['--id'], args['--tag'], get_args()['--id']
+        
+        async def run_all():
+            return await asyncio.gather(*(handle(i) for i in range(self.TASKS)))
+        
+        results = asyncio.run(run_all())
+        for i, (first, parsed, tags, last) in enumerate(results):
+            self.assertEqual((first, parsed, tags, last), (str(i), i, ('a', str(i)), str(i)))
+        self.assertEqual(get_args()['--id'], 'global')
+    
+    def test_shared_instance(self):
+        """Testa uma mesma instância usada como bloco por tarefas e threads simultâneas"""
+        shared = argv_context(['bot', '--id', 'shared'])
+        
+        async def handle(i):
+            with shared:
+                await asyncio.sleep(0)
+                with argv_context(['bot', '--id', str(i)]):
+                    await asyncio.sleep(0)
+                    inner = get_args()['--id']
+                await asyncio.sleep(0)
+                return inner, get_args()['--id']
+        
+        async def run_all():
+            return await asyncio.gather(*(handle(i) for i in range(self.TASKS)))
+        
+        results = asyncio.run(run_all())
+        self.assertEqual(results, [(str(i), 'shared') for i in range(self.TASKS)])
+        
+        barrier = threading.Barrier(8)
+        
+        def work(i):
+            with shared:
+                if i < 8:
+                    barrier.wait()
+                return get_args()['--id']
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertEqual(set(pool.map(work, range(1000))), {'shared'})
+        self.assertEqual(get_args()['--id'], 'global')
+    
+    def test_child_tasks_inherit(self):
+        """Testa que tarefas criadas dentro do bloco herdam o vetor"""
+        async def child():
+            await asyncio.sleep(0)
+            return get_args()['--id']
+        
+        async def parent(i):
+            with argv_context(['bot', '--id', str(i)]):
+                task = asyncio.ensure_future(child())
+            return await task
+        
+        async def run_all():
+            return await asyncio.gather(*(parent(i) for i in range(100)))
+        
+        self.assertEqual(asyncio.run(run_all()), [str(i) for i in range(100)])
+    
+    def test_thread_pool(self):
+        """Testa milhares de parses simultâneos num pool de threads, sem lock"""
+        barrier = threading.Barrier(16)
+        
+        def handle(i):
+            with argv_context(['bot', '--id', str(i), '--worker', threading.current_thread().name]):
+                if i < 16:
+                    barrier.wait()  # garante que as primeiras rodam juntas
+                args = get_args()
+                return args['--id'], args['--worker'] == threading.current_thread().name
+        
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(handle, range(self.TASKS)))
+        
+        self.assertEqual(results, [(str(i), True) for i in range(self.TASKS)])
+        self.assertEqual(get_args()['--id'], 'global')
+    
+    def test_threads_start_without_context(self):
+        """Testa que threads novas não herdam o vetor, exceto com copy_context()"""
+        with argv_context(['bot', '--id', 'local']):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                plain = pool.submit(lambda: get_args()['--id']).result()
+                copied = pool.submit(contextvars.copy_context().run,
+                                     lambda: get_args()['--id']).result()
+        
+        self.assertEqual(plain, 'global')
+        self.assertEqual(copied, 'local')
+
+
+if __name__ == '__main__':
+    unittest.main()
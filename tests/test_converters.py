@@ -0,0 +1,163 @@
+"""
+Testes unitários para o módulo friendly_arguments.converters
+"""
+
+import unittest
+from array import array
+from enum import Enum
+from pathlib import Path
+
+from friendly_arguments.converters import ListOf, converter_for, bind_converter, choices_for
+from friendly_arguments.parser import Parser, Option, ArgumentError, parse_many
+
+
+class Color(Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+class Level(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+class TestConverterFor(unittest.TestCase):
+    """Testes para os conversores pré-compilados"""
+    
+    def test_int_and_float(self):
+        """Testa conversão para int e float"""
+        self.assertEqual(converter_for(int)('8080'), 8080)
+        self.assertEqual(converter_for(float)('-1.5'), -1.5)
+    
+    def test_bool(self):
+        """Testa as grafias aceitas para bool"""
+        convert = converter_for(bool)
+        for value in ('1', 'true', 'True', 'yes', 'on', 'y'):
+            self.assertIs(convert(value), True)
+        for value in ('0', 'false', 'NO', 'off', 'n'):
+            self.assertIs(convert(value), False)
+        with self.assertRaises(ValueError):
+            convert('talvez')
+    
+    def test_enum_by_name_and_value(self):
+        """Testa Enum por nome, nome em minúsculas e valor"""
+        self.assertIs(converter_for(Color)('RED'), Color.RED)
+        self.assertIs(converter_for(Color)('green'), Color.GREEN)
+        self.assertIs(converter_for(Level)('2'), Level.HIGH)
+        self.assertIs(converter_for(Level)('low'), Level.LOW)
+    
+    def test_path_and_callables(self):
+        """Testa tipos arbitrários chamáveis como Path"""
+        self.assertEqual(converter_for(Path)('/tmp/x'), Path('/tmp/x'))
+    
+    def test_numeric_lists_use_array(self):
+        """Testa que listas numéricas viram array.array"""
+        ints = converter_for(ListOf(int))('1, 2,3')
+        floats = converter_for(ListOf(float, sep=';'))('1.5;2')
+        
+        self.assertEqual(ints, array('q', [1, 2, 3]))
+        self.assertEqual(floats, array('d', [1.5, 2.0]))
+        self.assertEqual(converter_for(ListOf(int))(''), array('q'))
+    
+    def test_other_lists_use_tuple(self):
+        """Testa que outras listas viram tuplas"""
+        self.assertEqual(converter_for(ListOf())('a, b,c'), ('a', 'b', 'c'))
+        self.assertEqual(converter_for(ListOf(Color))('red,GREEN'), (Color.RED, Color.GREEN))
+    
+    def test_converters_are_cached(self):
+        """Testa que cada tipo é compilado uma única vez"""
+        self.assertIs(converter_for(ListOf(int)), converter_for(ListOf(int)))
+        self.assertIs(converter_for(Color), converter_for(Color))
+    
+    def test_unsupported_type(self):
+        """Testa tipo que não é chamável"""
+        with self.assertRaises(ArgumentError):
+            converter_for(42)
+    
+    def test_choices_for(self):
+        """Testa as opções aceitas de um Enum"""
+        self.assertEqual(choices_for(Color), ('RED', 'GREEN'))
+        self.assertIsNone(choices_for(int))
+
+
+class TestBindConverter(unittest.TestCase):
+    """Testes para as mensagens de erro dos conversores"""
+    
+    def test_error_message(self):
+        """Testa mensagem com o nome da opção, o valor e o tipo"""
+        convert = bind_converter('--port', int)
+        
+        with self.assertRaises(ArgumentError) as context:
+            convert('abc')
+        
+        self.assertIn('--port', str(context.exception))
+        self.assertIn("'abc'", str(context.exception))
+        self.assertIn('int', str(context.exception))
+    
+    def test_missing_value(self):
+        """Testa opção tipada sem valor"""
+        with self.assertRaises(ArgumentError):
+            bind_converter('--port', int)(True)
+        self.assertIs(bind_converter('--debug', bool)(True), True)
+    
+    def test_list_overflow(self):
+        """Testa inteiros fora do intervalo de array('q')"""
+        with self.assertRaises(ArgumentError):
+            bind_converter('--ids', ListOf(int))(str(2 ** 70))
+
+
+class TestTypedParser(unittest.TestCase):
+    """Testes para opções tipadas no Parser"""
+    
+    def setUp(self):
+        """Cria um parser com opções tipadas"""
+        self.parser = Parser([
+            Option('--port', '-p', type=int, default=8080),
+            Option('--ratio', type=float),
+            Option('--color', type=Color),
+            Option('--ports', type=ListOf(int)),
+            Option('--debug', type=bool),
+            Option('--output', '-o', type=Path),
+        ])
+    
+    def test_values_converted_in_parse(self):
+        """Testa que os valores são convertidos durante o parsing"""
+        args = self.parser.parse([
+            'script.py', '-p', '9090', '--ratio=0.5', '--color', 'red',
+            '--ports=80,443', '--debug', '-o', 'out.txt',
+        ])
+        
+        self.assertEqual(args['--port'], 9090)
+        self.assertEqual(args['--ratio'], 0.5)
+        self.assertIs(args['--color'], Color.RED)
+        self.assertEqual(args['--ports'], array('q', [80, 443]))
+        self.assertIs(args['--debug'], True)
+        self.assertEqual(args['--output'], Path('out.txt'))
+    
+    def test_defaults_not_converted(self):
+        """Testa que os valores padrão são mantidos como declarados"""
+        self.assertEqual(self.parser.parse(['script.py']), {'--port': 8080})
+    
+    def test_invalid_value(self):
+        """Testa erro claro para valores inválidos"""
+        with self.assertRaises(ArgumentError) as context:
+            self.parser.parse(['script.py', '--port=http'])
+        self.assertIn('--port', str(context.exception))
+    
+    def test_undeclared_options_stay_strings(self):
+        """Testa que opções não declaradas continuam como strings"""
+        args = self.parser.parse(['script.py', '--other=1'])
+        
+        self.assertEqual(args['--other'], '1')
+    
+    def test_lazy_and_batch_convert(self):
+        """Testa a conversão nos modos preguiçoso e em lote"""
+        argv = ['script.py', '--port', '1', '--ratio=2']
+        
+        self.assertEqual(dict(self.parser.parse_lazy(argv)), {'--port': 1, '--ratio': 2.0})
+        self.assertEqual(self.parser.parse_lazy(argv)['--port'], 1)
+        self.assertEqual(parse_many([argv], self.parser, columnar=True)['--port'], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
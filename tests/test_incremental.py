@@ -0,0 +1,185 @@
+"""
+Testes unitários para o módulo friendly_arguments.incremental
+"""
+
+import random
+import unittest
+
+from friendly_arguments.incremental import IncrementalParser
+from friendly_arguments.parser import Parser, Option, ArgumentError
+
+
+def make_parser():
+    return Parser([
+        Option('--verbose', '-v', flag=True, default=False),
+        Option('--count', '-c', action='count', default=0),
+        Option('--port', '-p', type=int, default=8080),
+        Option('--name', '-n'),
+        Option('--tag', '-t', action='append'),
+        Option('--ids', type=int, action='append'),
+    ])
+
+
+class TestIncrementalParser(unittest.TestCase):
+    """Testes para IncrementalParser"""
+    
+    def setUp(self):
+        self.parser = make_parser()
+        self.shell = IncrementalParser(self.parser)
+    
+    def test_push_and_pop(self):
+        """Testa que push() e pop() acompanham o parsing completo"""
+        for token in ['--name', 'ana', '-vc', '-t', 'a', '--ids', '1', '--ids', '2']:
+            self.shell.push(token)
+        self.assertEqual(self.shell.result, self.parser.parse(['prog'] + list(self.shell.tokens)))
+        
+        self.assertEqual(self.shell.pop(), '2')
+        self.assertEqual(self.shell.expecting, '--ids')
+        self.assertEqual(self.shell.pop(), '--ids')
+        self.assertEqual(list(self.shell.result['--ids']), [1])
+    
+    def test_expecting(self):
+        """Testa o estado 'esperando valor'"""
+        self.assertIsNone(self.shell.expecting)
+        self.shell.update(['-v', '--port'])
+        self.assertEqual(self.shell.expecting, '--port')
+        self.shell.update(['-v', '-p', '80'])
+        self.assertIsNone(self.shell.expecting)
+        self.shell.update(['-v', '-p', '80', '-vn'])
+        self.assertEqual(self.shell.expecting, '--name')
+        self.shell.update(['--other'])
+        self.assertEqual(self.shell.expecting, '--other')
+    
+    def test_waiting_option_is_a_flag(self):
+        """Testa que a opção esperando valor aparece como flag no resultado"""
+        self.shell.update(['--name'])
+        self.assertEqual(self.shell.result['--name'], True)
+        self.shell.update(['--name', 'ana'])
+        self.assertEqual(self.shell.result['--name'], 'ana')
+    
+    def test_edit_last_token(self):
+        """Testa a edição do último token, letra por letra"""
+        line = ['--name', 'ana', '--port', '']
+        for text in ('8', '80', '808', '80'):
+            line[-1] = text
+            self.shell.update(line)
+        self.assertEqual(self.shell.result['--port'], 80)
+        self.assertEqual(self.shell.errors, [])
+    
+    def test_prefix_is_kept(self):
+        """Testa que só os tokens depois do prefixo comum são parseados de novo"""
+        self.shell.update(['--name', 'ana', '-t', 'a', '-t', 'b'])
+        parsed = []
+        step = self.shell._step
+        self.shell._step = lambda token: parsed.append(token) or step(token)
+        
+        self.shell.update(['--name', 'ana', '-t', 'a', '-t', 'c', '-v'])
+        self.assertEqual(parsed, ['c', '-v'])
+        self.assertEqual(self.shell.result['--tag'], ('a', 'c'))
+    
+    def test_replace_last_and_truncate(self):
+        """Testa as edições explícitas, sem comparar a linha inteira"""
+        self.shell.update(('--name', 'ana', '--port', '8'))
+        parsed = []
+        step = self.shell._step
+        self.shell._step = lambda token: parsed.append(token) or step(token)
+        
+        self.assertEqual(self.shell.replace_last('80'), '8')
+        self.assertEqual(parsed, ['80'])
+        self.assertEqual(self.shell.result['--port'], 80)
+        
+        self.shell.truncate(3)
+        self.assertEqual(self.shell.tokens, ('--name', 'ana', '--port'))
+        self.assertEqual(self.shell.expecting, '--port')
+        self.shell.truncate(5)
+        self.assertEqual(len(self.shell.tokens), 3)
+        
+        self.shell.update(iter(['--name', 'bia']))
+        self.assertEqual(self.shell.result['--name'], 'bia')
+        self.assertEqual(parsed, ['80', 'bia'])
+    
+    def test_result_is_a_copy(self):
+        """Testa que resultados anteriores não mudam com novos tokens"""
+        self.shell.update(['-t', 'a', '--ids', '1'])
+        first = self.shell.result
+        self.shell.update(['-t', 'a', '--ids', '1', '-t', 'b', '--ids', '2'])
+        self.assertEqual(first['--tag'], ('a',))
+        self.assertEqual(list(first['--ids']), [1])
+    
+    def test_conversion_errors(self):
+        """Testa que valores inválidos viram erros sem interromper o parsing"""
+        self.shell.update(['--port', 'x', '--name', 'ana'])
+        args = self.shell.result
+        self.assertEqual(args['--port'], 8080)
+        self.assertEqual(args['--name'], 'ana')
+        self.assertEqual(len(self.shell.errors), 1)
+        
+        self.shell.update(['--port', '81'])
+        self.assertEqual(self.shell.errors, [])
+    
+    def test_invalid_flag_keeps_next_token(self):
+        """Testa que uma opção tipada sem valor não derruba o token seguinte"""
+        self.shell.update(['--port', '--verbose'])
+        self.assertIs(self.shell.result['--verbose'], True)
+        self.assertEqual(self.shell.result['--port'], 8080)
+        self.assertEqual(len(self.shell.errors), 1)
+        
+        self.shell.pop()
+        self.assertEqual(self.shell.expecting, '--port')
+        self.assertEqual(self.shell.errors, [])
+    
+    def test_validation_errors(self):
+        """Testa que as restrições do parser aparecem em errors"""
+        parser = Parser([Option('--name', required=True), Option('--port', type=int, max=10)])
+        shell = IncrementalParser(parser)
+        shell.update(['--port', '20'])
+        self.assertEqual(len(shell.errors), 2)
+        shell.update(['--port', '2', '--name', 'x'])
+        self.assertEqual(shell.errors, [])
+    
+    def test_end_of_options(self):
+        """Testa que '--' pode ser desfeito"""
+        self.shell.update(['--', '-v'])
+        self.assertIs(self.shell.result['--verbose'], False)
+        self.shell.update(['-v'])
+        self.assertIs(self.shell.result['--verbose'], True)
+    
+    def test_parser_changes(self):
+        """Testa que opções novas no parser fazem o estado ser refeito"""
+        self.shell.update(['--level', '3'])
+        self.parser.add_option('--level', type=int)
+        self.shell.update(['--level', '3'])
+        self.assertEqual(self.shell.result['--level'], 3)
+    
+    def test_default_parser(self):
+        """Testa as regras de get_args() sem parser"""
+        shell = IncrementalParser(defaults={'--mode': 'a'})
+        shell.update(['--x=1', '-y'])
+        self.assertEqual(shell.result, {'--mode': 'a', '--x': '1', '-y': True})
+    
+    def test_random_edits(self):
+        """Testa edições aleatórias contra o parsing completo"""
+        pool = ['-v', '-c', '-vc', '-ccn', 'x', '-p', '80', '-5', '--port=1', '-n', 'ana',
+                '-t', 'b', '-tq', '--ids', '7', '--', '--und', 'u=1', '-', '--name=']
+        rng = random.Random(7)
+        shell = IncrementalParser(self.parser)
+        tokens = []
+        for _ in range(500):
+            choice = rng.random()
+            if choice < 0.6 or not tokens:
+                tokens = tokens + [rng.choice(pool)]
+            elif choice < 0.8:
+                tokens = tokens[:-1]
+            else:
+                tokens = tokens[:rng.randrange(len(tokens))] + [rng.choice(pool)]
+            shell.update(tokens)
+            result = shell.result
+            try:
+                expected = self.parser.parse(['prog'] + tokens)
+            except ArgumentError:
+                continue
+            self.assertEqual(result, expected, tokens)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Testes unitários para o pacote friendly_arguments (importação e atributos preguiçosos)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import friendly_arguments
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImports(unittest.TestCase):
+    """Testes para a importação preguiçosa dos recursos do pacote"""
+    
+    def imported_modules(self, code):
+        """Retorna os módulos carregados por `code` num interpretador novo"""
+        script = (
+            "import sys, json\n"
+            "before = set(sys.modules)\n"
+            f"{code}\n"
+            "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', script], cwd=ROOT, check=True,
+            capture_output=True, text=True,
+        ).stdout
+        return set(json.loads(output))
+    
+    def test_import_stays_light(self):
+        """Testa que importar o pacote não carrega módulos pesados"""
+        modules = self.imported_modules("import friendly_arguments")
+        
+        for heavy in ('typing', 'functools', 'enum', 'array', 'mmap', 'configparser',
+                      'threading', 'friendly_arguments.converters',
+                      'friendly_arguments.cache', 'friendly_arguments.layered',
+                      'friendly_arguments.instrumentation', 'friendly_arguments.commands',
+                      'friendly_arguments.completion', 'friendly_arguments.snapshot',
+                      'friendly_arguments.binary', 'friendly_arguments.context',
+                      'friendly_arguments.strings', 'friendly_arguments.shared',
+                      'friendly_arguments.record', 'friendly_arguments.validation',
+                      'friendly_arguments.server', 'friendly_arguments.client',
+                      'friendly_arguments.incremental', 'friendly_arguments.batch',
+                      'socket', 'multiprocessing', 'contextvars',
+                      'pickle', 're'):
+            self.assertNotIn(heavy, modules)
+    
+    def test_get_args_works_without_heavy_modules(self):
+        """Testa que get_args() funciona sem carregar recursos opcionais"""
+        modules = self.imported_modules(
+            "from friendly_arguments import get_args\n"
+            "get_args(argv=['s', '--a=1'])"
+        )
+        
+        self.assertNotIn('typing', modules)
+        self.assertNotIn('friendly_arguments.converters', modules)
+    
+    def test_lazy_attributes(self):
+        """Testa que os atributos preguiçosos são carregados sob demanda"""
+        from friendly_arguments.converters import ListOf
+        from friendly_arguments.layered import layered_args
+        
+        self.assertIs(friendly_arguments.ListOf, ListOf)
+        self.assertIs(friendly_arguments.layered_args, layered_args)
+    
+    def test_all_names_exist(self):
+        """Testa que todos os nomes de __all__ existem"""
+        for name in friendly_arguments.__all__:
+            self.assertTrue(hasattr(friendly_arguments, name), name)
+        self.assertIn('ParseCache', dir(friendly_arguments))
+    
+    def test_unknown_attribute(self):
+        """Testa atributo inexistente"""
+        with self.assertRaises(AttributeError):
+            friendly_arguments.does_not_exist
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+"""
+Testes unitários para o módulo friendly_arguments.instrumentation
+"""
+
+import unittest
+
+from friendly_arguments import parser as parser_module
+from friendly_arguments.cache import ParseCache
+from friendly_arguments.instrumentation import (
+    ParseEvent, ParseStats, add_hook, remove_hook, clear_hooks, collect_stats
+)
+from friendly_arguments.named import get_args
+from friendly_arguments.parser import Parser, Option, ArgumentError
+
+
+class TestHooks(unittest.TestCase):
+    """Testes para os hooks de instrumentação do parser"""
+    
+    def tearDown(self):
+        """Remove todos os hooks após cada teste"""
+        clear_hooks()
+    
+    def test_no_hooks_means_no_instrumentation(self):
+        """Testa que sem hooks o parser não é instrumentado"""
+        self.assertIsNone(parser_module._instrumentation)
+        
+        callback = lambda token: None
+        add_hook('token', callback)
+        self.assertIsNotNone(parser_module._instrumentation)
+        
+        remove_hook('token', callback)
+        self.assertIsNone(parser_module._instrumentation)
+    
+    def test_pre_and_post_parse(self):
+        """Testa os hooks antes e depois do parsing"""
+        calls = []
+        add_hook('pre_parse', lambda parser, argv: calls.append(('pre', list(argv))))
+        add_hook('post_parse', lambda event: calls.append(('post', event.tokens)))
+        
+        args = get_args(argv=['script.py', '--name', 'João', '--verbose'])
+        
+        self.assertEqual(args, {'--name': 'João', '--verbose': True})
+        self.assertEqual(calls, [
+            ('pre', ['script.py', '--name', 'João', '--verbose']),
+            ('post', 3),
+        ])
+    
+    def test_token_hook(self):
+        """Testa que o hook por token recebe cada token, sem o nome do programa"""
+        tokens = []
+        add_hook('token', tokens.append)
+        
+        get_args(argv=['script.py', '--a=1', '-b', '2'])
+        
+        self.assertEqual(tokens, ['--a=1', '-b', '2'])
+    
+    def test_results_are_unchanged(self):
+        """Testa que o parsing instrumentado retorna o mesmo resultado"""
+        parser = Parser([
+            Option('--port', '-p', type=int, default=80),
+            Option('--tag', action='append'),
+            Option('--verbose', '-v', action='count'),
+        ])
+        argv = ['s', '-p', '8080', '--tag=a', '--tag', 'b', '-vv', '--x']
+        expected = parser.parse(argv, {'--y': 1})
+        
+        add_hook('post_parse', lambda event: None)
+        args = parser.parse(argv, {'--y': 1})
+        
+        self.assertEqual(args, expected)
+        self.assertEqual(list(args), list(expected))
+        self.assertEqual(args.lookup('-p'), 8080)
+    
+    def test_conversion_time(self):
+        """Testa a contagem e o tempo das conversões de tipo"""
+        events = []
+        add_hook('post_parse', events.append)
+        parser = Parser([Option('--port', type=int), Option('--ratio', type=float)])
+        
+        parser.parse(['s', '--port=80', '--ratio', '0.5', '--name=x'])
+        
+        event = events[0]
+        self.assertIsInstance(event, ParseEvent)
+        self.assertIs(event.parser, parser)
+        self.assertEqual(event.conversions, 2)
+        self.assertGreaterEqual(event.conversion_time, 0.0)
+        self.assertLessEqual(event.conversion_time, event.duration)
+    
+    def test_recompiled_parser(self):
+        """Testa que opções novas são instrumentadas após recompilar"""
+        events = []
+        add_hook('post_parse', events.append)
+        parser = Parser([Option('--port', type=int)])
+        parser.parse(['s', '--port=80'])
+        
+        parser.add_option('--count', type=int)
+        args = parser.parse(['s', '--port=80', '--count=2'])
+        
+        self.assertEqual(args, {'--port': 80, '--count': 2})
+        self.assertEqual(events[-1].conversions, 2)
+    
+    def test_error_is_reported(self):
+        """Testa que erros de parsing são informados e propagados"""
+        events = []
+        add_hook('post_parse', events.append)
+        parser = Parser([Option('--port', type=int)])
+        
+        with self.assertRaises(ArgumentError):
+            parser.parse(['s', '--port=abc'])
+        
+        self.assertIsInstance(events[0].error, ArgumentError)
+    
+    def test_other_entry_points(self):
+        """Testa que cada ponto de entrada informa um parsing por linha de comando"""
+        from friendly_arguments.layered import layered_args
+        from friendly_arguments.parser import parse_many
+        from friendly_arguments.record import parse_records
+        from friendly_arguments.strings import parse_string, parse_strings
+        
+        parser = Parser([Option('--port', '-p', type=int, default=80)])
+        events = []
+        tokens = []
+        add_hook('post_parse', events.append)
+        add_hook('token', tokens.append)
+        
+        calls = [
+            (lambda: parser.parse_record(['s', '-p', '1']), [['s', '-p', '1']]),
+            (lambda: parse_many([['s', '-p', '1'], ['s']], parser), [['s', '-p', '1'], ['s']]),
+            (lambda: parse_many([['s', '--port=2']], parser, columnar=True), [['s', '--port=2']]),
+            (lambda: list(parse_records([['s', '-p3']], parser)), [['s', '-p3']]),
+            (lambda: parser.parse_bytes([b's', b'--port', b'4']), [[b's', b'--port', b'4']]),
+            (lambda: parse_string('-p 5', parser), ['-p 5']),
+            (lambda: list(parse_strings(['-p 6', ''], parser)), ['-p 6', '']),
+            (lambda: layered_args(['s', '-p', '7'], parser, env_prefix='APP_', environ={}),
+             [['s', '-p', '7']]),
+        ]
+        for call, argvs in calls:
+            del events[:], tokens[:]
+            with self.subTest(argvs=argvs):
+                call()
+                self.assertEqual([list(event.argv) if type(event.argv) is not str else event.argv
+                                  for event in events], argvs)
+                self.assertEqual(sum(event.tokens for event in events), len(tokens))
+                self.assertEqual(sum(event.conversions for event in events),
+                                 sum(1 for argv in argvs if len(argv) > 1))
+    
+    def test_entry_point_error_is_reported(self):
+        """Testa que erros fora de Parser.parse() também são informados"""
+        from friendly_arguments.strings import parse_strings
+        
+        events = []
+        add_hook('post_parse', events.append)
+        parser = Parser([Option('--port', type=int)])
+        
+        with self.assertRaises(ArgumentError):
+            list(parse_strings(['--port 1', '--port abc'], parser))
+        
+        self.assertEqual([event.argv for event in events], ['--port 1', '--port abc'])
+        self.assertIsNone(events[0].error)
+        self.assertIsInstance(events[1].error, ArgumentError)
+    
+    def test_cache_hits(self):
+        """Testa que acertos do ParseCache são informados"""
+        cache = ParseCache()
+        events = []
+        add_hook('post_parse', events.append)
+        
+        cache.get_args(argv=['s', '--a=1'])
+        cache.get_args(argv=['s', '--a=1'])
+        
+        self.assertEqual([event.cache_hit for event in events], [False, True])
+        self.assertEqual(events[1].tokens, 0)
+    
+    def test_unknown_event(self):
+        """Testa que eventos desconhecidos geram ArgumentError"""
+        with self.assertRaises(ArgumentError):
+            add_hook('on_parse', print)
+    
+    def test_remove_unregistered(self):
+        """Testa que remover um hook não registrado gera ValueError"""
+        with self.assertRaises(ValueError):
+            remove_hook('token', print)
+
+
+class TestParseStats(unittest.TestCase):
+    """Testes para as estatísticas agregadas"""
+    
+    def tearDown(self):
+        """Remove todos os hooks após cada teste"""
+        clear_hooks()
+    
+    def test_collect_stats(self):
+        """Testa a coleta de estatísticas num bloco with"""
+        cache = ParseCache()
+        with collect_stats() as stats:
+            get_args(argv=['s', '--a', '1', '--b'])
+            Parser([Option('--n', type=int)]).parse(['s', '--n=3'])
+            cache.get_args(argv=['s'])
+            cache.get_args(argv=['s'])
+        
+        self.assertEqual(stats.parses, 3)
+        self.assertEqual(stats.tokens, 4)
+        self.assertEqual(stats.conversions, 1)
+        self.assertEqual(stats.cache_hits, 1)
+        self.assertEqual(stats.errors, 0)
+        self.assertGreater(stats.parse_time, 0.0)
+        self.assertIsNone(parser_module._instrumentation)
+    
+    def test_as_dict_and_reset(self):
+        """Testa a exportação e o zeramento dos contadores"""
+        stats = ParseStats()
+        add_hook('post_parse', stats)
+        get_args(argv=['s', '--a=1'])
+        
+        self.assertEqual(stats.as_dict()['tokens'], 1)
+        self.assertEqual(set(stats.as_dict()), {
+            'parses', 'tokens', 'parse_time', 'conversions', 'conversion_time',
+            'cache_hits', 'errors',
+        })
+        
+        stats.reset()
+        self.assertEqual(stats.parses, 0)
+        self.assertEqual(stats.tokens, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
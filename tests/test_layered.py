@@ -0,0 +1,228 @@
+"""
+Testes unitários para o módulo friendly_arguments.layered
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from friendly_arguments.layered import (
+    ConfigCache, EnvironmentLayer, layered_args, option_key, environment_name, config_cache
+)
+from friendly_arguments.named import get_arg
+from friendly_arguments.parser import Parser, Option, ArgumentError
+
+
+class TestNames(unittest.TestCase):
+    """Testes para a conversão de nomes de configuração e ambiente"""
+    
+    def test_option_key(self):
+        """Testa a normalização de nomes para chaves de opção"""
+        self.assertEqual(option_key('log_level'), '--log-level')
+        self.assertEqual(option_key('LOG-LEVEL'), '--log-level')
+        self.assertEqual(option_key('--log-level'), '--log-level')
+    
+    def test_environment_name(self):
+        """Testa o nome da variável de ambiente de uma opção"""
+        self.assertEqual(environment_name('APP_', '--log-level'), 'APP_LOG_LEVEL')
+        self.assertEqual(environment_name('APP_', '-p'), 'APP_P')
+
+
+class TestEnvironmentLayer(unittest.TestCase):
+    """Testes para a camada de variáveis de ambiente"""
+    
+    def test_live_view(self):
+        """Testa que a camada lê o ambiente sem copiá-lo"""
+        environ = {'APP_PORT': '80', 'OTHER': 'x'}
+        layer = EnvironmentLayer('APP_', environ)
+        
+        self.assertEqual(layer['--port'], '80')
+        environ['APP_LOG_LEVEL'] = 'debug'
+        self.assertEqual(layer['--log-level'], 'debug')
+        self.assertEqual(sorted(layer), ['--log-level', '--port'])
+        self.assertEqual(len(layer), 2)
+        self.assertNotIn('--other', layer)
+
+
+class TestConfigCache(unittest.TestCase):
+    """Testes para o cache de arquivos de configuração"""
+    
+    def setUp(self):
+        """Cria um diretório temporário e um cache novo"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ConfigCache()
+    
+    def tearDown(self):
+        """Remove o diretório temporário"""
+        self.tmp.cleanup()
+    
+    def write(self, name, content):
+        """Escreve um arquivo de configuração e retorna o caminho"""
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+    
+    def test_json(self):
+        """Testa arquivo JSON"""
+        path = self.write('app.json', json.dumps({'port': 80, 'log_level': 'info'}))
+        
+        self.assertEqual(self.cache.load(path), {'--port': 80, '--log-level': 'info'})
+    
+    def test_ini_sections(self):
+        """Testa arquivo INI com e sem seção escolhida"""
+        path = self.write('app.ini', '[server]\nport = 80\n\n[client]\nPort = 81\nretries = 3\n')
+        
+        self.assertEqual(self.cache.load(path), {'--port': '81', '--retries': '3'})
+        self.assertEqual(self.cache.load(path, 'server'), {'--port': '80'})
+    
+    def test_toml(self):
+        """Testa arquivo TOML (quando disponível)"""
+        try:
+            import tomllib  # noqa: F401
+        except ImportError:
+            self.skipTest('tomllib indisponível')
+        path = self.write('app.toml', 'port = 80\n[db]\nhost = "x"\n')
+        
+        self.assertEqual(self.cache.load(path, 'db'), {'--host': 'x'})
+    
+    def test_cached_until_file_changes(self):
+        """Testa que o arquivo só é relido quando muda"""
+        path = self.write('app.json', '{"port": 80}')
+        first = self.cache.load(path)
+        self.assertIs(self.cache.load(path), first)
+        self.assertEqual(self.cache.reads, 1)
+        
+        self.write('app.json', '{"port": 8080}')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        self.assertEqual(self.cache.load(path), {'--port': 8080})
+        self.assertEqual(self.cache.reads, 2)
+    
+    def test_errors(self):
+        """Testa arquivos inválidos, ausentes e formatos desconhecidos"""
+        with self.assertRaises(ArgumentError):
+            self.cache.load(self.write('bad.json', '{'))
+        with self.assertRaises(ArgumentError):
+            self.cache.load(self.write('list.json', '[1, 2]'))
+        with self.assertRaises(ArgumentError):
+            self.cache.load(self.write('app.yaml', 'port: 1'))
+        with self.assertRaises(ArgumentError):
+            self.cache.load(os.path.join(self.tmp.name, 'missing.json'))
+
+
+class TestLayeredArgs(unittest.TestCase):
+    """Testes para a resolução em camadas com layered_args()"""
+    
+    def setUp(self):
+        """Cria um parser, um arquivo de configuração e um ambiente"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = os.path.join(self.tmp.name, 'app.ini')
+        with open(self.config, 'w', encoding='utf-8') as file:
+            file.write('[app]\nport = 7000\nhost = config-host\nworkers = 4\n')
+        self.parser = Parser([
+            Option('--port', '-p', type=int, default=80),
+            Option('--host', default='localhost'),
+            Option('--workers', type=int, default=1),
+            Option('--debug', type=bool, default=False),
+        ])
+        self.environ = {'APP_PORT': '9000', 'APP_DEBUG': 'yes'}
+        config_cache.clear()
+    
+    def tearDown(self):
+        """Remove o diretório temporário"""
+        self.tmp.cleanup()
+    
+    def resolve(self, argv):
+        return layered_args(argv, self.parser, env_prefix='APP_', config=self.config,
+                            environ=self.environ)
+    
+    def test_priority_order(self):
+        """Testa a prioridade argv > ambiente > configuração > defaults"""
+        args = self.resolve(['script.py', '--host', 'cli-host'])
+        
+        self.assertEqual(args['--host'], 'cli-host')
+        self.assertEqual(args['--port'], 9000)
+        self.assertEqual(args['--workers'], 4)
+        self.assertIs(args['--debug'], True)
+        self.assertEqual(args.source('--host'), 'argv')
+        self.assertEqual(args.source('-p'), 'env')
+        self.assertEqual(args.source('--workers'), 'config')
+    
+    def test_defaults_layer(self):
+        """Testa a camada de valores padrão"""
+        args = layered_args(['script.py'], self.parser, defaults={'--extra': 'x'})
+        
+        self.assertEqual(args['--port'], 80)
+        self.assertEqual(args['--extra'], 'x')
+        self.assertEqual(args.source('--extra'), 'defaults')
+        self.assertIsNone(args.source('--missing'))
+    
+    def test_aliases_and_get_arg(self):
+        """Testa busca por alias"""
+        args = self.resolve(['script.py', '-p', '1'])
+        
+        self.assertEqual(args.lookup('-p'), 1)
+        self.assertEqual(get_arg(args, '-p'), 1)
+    
+    def test_keys_and_dict(self):
+        """Testa a visão completa das camadas combinadas"""
+        args = self.resolve(['script.py'])
+        
+        self.assertEqual(dict(args), {
+            '--port': 9000, '--host': 'config-host', '--workers': 4, '--debug': True,
+        })
+    
+    def test_repeated_options_like_argv(self):
+        """Testa que opções append e count têm a mesma forma em qualquer camada"""
+        parser = Parser([
+            Option('--tag', action='append'),
+            Option('--ids', type=int, action='append'),
+            Option('--verbose', '-v', action='count', default=0),
+        ])
+        config = os.path.join(self.tmp.name, 'app.json')
+        with open(config, 'w', encoding='utf-8') as file:
+            json.dump({'ids': [1, '2'], 'verbose': 2}, file)
+        
+        args = layered_args(['script.py'], parser, env_prefix='APP_', config=config,
+                            environ={'APP_TAG': 'a'})
+        cli = parser.parse(['script.py', '--tag', 'a', '--ids', '1', '--ids', '2', '-vv'])
+        self.assertEqual(args['--tag'], cli['--tag'])
+        self.assertEqual(args['--ids'], cli['--ids'])
+        self.assertIs(type(args['--ids']), type(cli['--ids']))
+        self.assertEqual(args['--verbose'], 2)
+        
+        args = layered_args(['script.py'], parser, env_prefix='APP_',
+                            environ={'APP_VERBOSE': 'x'})
+        with self.assertRaises(ArgumentError):
+            args['--verbose']
+    
+    def test_config_read_once(self):
+        """Testa que resoluções repetidas não releem o arquivo"""
+        for _ in range(5):
+            self.resolve(['script.py'])
+        
+        self.assertEqual(config_cache.reads, 1)
+    
+    def test_layers_are_not_copied(self):
+        """Testa que o ambiente é lido ao vivo"""
+        args = self.resolve(['script.py'])
+        self.environ['APP_HOST'] = 'env-host'
+        
+        self.assertEqual(args['--host'], 'env-host')
+    
+    def test_uses_sys_argv_by_default(self):
+        """Testa que sys.argv é usado quando argv não é informado"""
+        original = sys.argv
+        sys.argv = ['script.py', '--host=argv-host']
+        try:
+            self.assertEqual(layered_args()['--host'], 'argv-host')
+        finally:
+            sys.argv = original
+
+
+if __name__ == '__main__':
+    unittest.main()
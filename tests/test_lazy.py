@@ -0,0 +1,119 @@
+"""
+Testes unitários para o módulo friendly_arguments.lazy
+"""
+
+import random
+import sys
+import unittest
+
+from friendly_arguments.named import get_args, get_arg
+from friendly_arguments.parser import Parser, Option, ArgumentError
+from friendly_arguments.lazy import LazyArguments
+
+
+class TestLazyArguments(unittest.TestCase):
+    """Testes para o mapeamento preguiçoso LazyArguments"""
+    
+    def setUp(self):
+        """Cria um parser e salva o sys.argv original"""
+        self.parser = Parser([
+            Option('--name', '-n', default='Anonymous'),
+            Option('--verbose', '-v', flag=True),
+        ])
+        self.original_argv = sys.argv.copy()
+    
+    def tearDown(self):
+        """Restaura o sys.argv original após cada teste"""
+        sys.argv = self.original_argv
+    
+    def test_lookup_stops_at_last_occurrence(self):
+        """Testa que a busca para na última ocorrência da chave"""
+        argv = ['script.py'] + [f'--arg{i}=x' for i in range(1000)] + ['--help']
+        args = LazyArguments(self.parser, argv)
+        
+        self.assertTrue(args['--help'])
+        self.assertFalse(args.complete)
+        self.assertEqual(args._position, len(argv) - 2)
+    
+    def test_last_value_wins(self):
+        """Testa que o último valor prevalece"""
+        args = self.parser.parse_lazy(['script.py', '--name=First', '-n', 'Second', '--x'])
+        
+        self.assertEqual(args['--name'], 'Second')
+    
+    def test_memoizes_scanned_tokens(self):
+        """Testa que tokens já lidos não são lidos de novo"""
+        args = self.parser.parse_lazy(['script.py', '--a=1', '--b', '2', '--c=3'])
+        
+        self.assertEqual(args['--b'], '2')
+        position = args._position
+        self.assertEqual(args['--c'], '3')
+        self.assertEqual(args._position, position)
+    
+    def test_missing_key_uses_defaults(self):
+        """Testa que chaves ausentes caem nos valores padrão"""
+        args = self.parser.parse_lazy(['script.py', '-v'], defaults={'--age': '18'})
+        
+        self.assertEqual(args['--name'], 'Anonymous')
+        self.assertEqual(args['--age'], '18')
+        self.assertTrue(args.complete)
+        with self.assertRaises(KeyError):
+            args['--missing']
+    
+    def test_len_and_iteration_match_parse(self):
+        """Testa que len() e a iteração seguem o resultado de parse()"""
+        argv = ['script.py', '--x', '1', '-n', 'Ana', '--y=2', '--x=3', '-v']
+        lazy = self.parser.parse_lazy(argv, defaults={'--z': 0})
+        eager = self.parser.parse(argv, defaults={'--z': 0})
+        
+        self.assertEqual(len(lazy), len(eager))
+        self.assertEqual(list(lazy), list(eager))
+        self.assertEqual(dict(lazy), eager)
+    
+    def test_flags_and_positionals(self):
+        """Testa flags declaradas, posicionais e valores com '='"""
+        argv = ['script.py', 'pos', '-v', 'file.txt', '--eq', 'a=b', '--last']
+        args = self.parser.parse_lazy(argv)
+        
+        self.assertEqual(args['--eq'], 'a=b')
+        self.assertTrue(args['--verbose'])
+        self.assertNotIn('file.txt', args)
+        self.assertEqual(dict(args), self.parser.parse(argv))
+    
+    def test_random_equivalence(self):
+        """Testa equivalência com parse() em vetores aleatórios"""
+        rng = random.Random(42)
+        pieces = ['--a', '--b', '-n', '-v', '--verbose', 'x', 'y', '--a=1', 'k=v', '-', '--']
+        for _ in range(500):
+            argv = ['script.py'] + [rng.choice(pieces) for _ in range(rng.randint(0, 12))]
+            expected = self.parser.parse(argv)
+            
+            lazy = self.parser.parse_lazy(argv)
+            for key in rng.sample(pieces, 3):
+                self.assertEqual(lazy.get(key), expected.get(key), argv)
+            self.assertEqual(list(lazy.items()), list(expected.items()), argv)
+    
+    def test_get_arg_and_lookup(self):
+        """Testa get_arg() e lookup() com aliases"""
+        args = self.parser.parse_lazy(['script.py', '-n', 'Bia'])
+        
+        self.assertEqual(args.lookup('-n'), 'Bia')
+        self.assertEqual(get_arg(args, '-n'), 'Bia')
+    
+    def test_get_args_lazy(self):
+        """Testa get_args(lazy=True)"""
+        sys.argv = ['script.py', '--name', 'João', '--verbose']
+        args = get_args(lazy=True)
+        
+        self.assertIsInstance(args, LazyArguments)
+        self.assertEqual(args['--name'], 'João')
+        self.assertEqual(dict(args), get_args())
+    
+    def test_lazy_with_response_files_rejected(self):
+        """Testa que lazy e response_files não podem ser combinados"""
+        with self.assertRaises(ArgumentError):
+            get_args(argv=['script.py'], lazy=True, response_files=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,14 @@
 Testes unitários para o módulo friendly_arguments.named
 """
 
+import random
 import sys
 import unittest
 from unittest.mock import patch
 
-from friendly_arguments.named import get_args, get_arg, get_params_sys_args
+from friendly_arguments.named import (
+    get_args, get_arg, get_params_sys_args, compile_keys, KeyIndex
+)
 
 
 class TestGetArgs(unittest.TestCase):
@@ -134,14 +137,15 @@ class TestGetArgs(unittest.TestCase):
         self.assertEqual(args['--balance'], '-500')
     
     def test_negative_numbers_with_space(self):
-        """Testa números negativos com espaço (limitação conhecida)"""
-        # Nota: '--arg -500' interpreta -500 como flag, não como valor
-        # Para números negativos, use sempre '=' : '--arg=-500'
-        sys.argv = ['script.py', '--balance', '-500']
+        """Testa números negativos com espaço"""
+        sys.argv = ['script.py', '--balance', '-500', '--offset', '-0.5', '--exp', '-1e3']
         args = get_args()
         
-        # -500 é interpretado como uma flag booleana
-        self.assertTrue(args['-500'])
+        # Números negativos são valores, não opções
+        self.assertEqual(args['--balance'], '-500')
+        self.assertEqual(args['--offset'], '-0.5')
+        self.assertEqual(args['--exp'], '-1e3')
+        self.assertNotIn('-500', args)
     
     def test_special_characters(self):
         """Testa caracteres especiais"""
@@ -348,6 +352,91 @@ class TestGetParamsSysArgs(unittest.TestCase):
         self.assertEqual(args['--timeout='], '30')
 
 
+class TestKeyIndex(unittest.TestCase):
+    """Testes para o índice compilado de chaves da API legada"""
+    
+    def setUp(self):
+        """Salva o sys.argv original antes de cada teste"""
+        self.original_argv = sys.argv.copy()
+    
+    def tearDown(self):
+        """Restaura o sys.argv original após cada teste"""
+        sys.argv = self.original_argv
+    
+    @staticmethod
+    def reference_match(keys, arg):
+        """Implementação original: primeira chave que é prefixo vence"""
+        for key in keys:
+            if arg.startswith(key):
+                return key
+        return None
+    
+    def test_exact_match(self):
+        """Testa busca exata pelo texto até o '='"""
+        index = KeyIndex(['--text=', '--name='])
+        
+        self.assertEqual(index.match('--text=hello'), '--text=')
+        self.assertEqual(index.match('--name='), '--name=')
+        self.assertIsNone(index.match('--other=1'))
+        self.assertIsNone(index.match('--text'))
+    
+    def test_first_match_wins_with_prefix_keys(self):
+        """Testa que a primeira chave da lista vence entre prefixos"""
+        index = KeyIndex(['--t', '--text='])
+        self.assertEqual(index.match('--text=hi'), '--t')
+        
+        index = KeyIndex(['--text=', '--t'])
+        self.assertEqual(index.match('--text=hi'), '--text=')
+        self.assertEqual(index.match('--tx'), '--t')
+    
+    def test_empty_key_matches_everything(self):
+        """Testa chave vazia (startswith('') é sempre verdadeiro)"""
+        index = KeyIndex(['--text=', ''])
+        
+        self.assertEqual(index.match('--text=1'), '--text=')
+        self.assertEqual(index.match('anything'), '')
+    
+    def test_matches_reference_implementation(self):
+        """Testa equivalência com o laço original em entradas aleatórias"""
+        rng = random.Random(1234)
+        alphabet = 'ab=-'
+        for _ in range(300):
+            keys = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 4)))
+                    for _ in range(rng.randint(1, 6))]
+            index = KeyIndex(keys)
+            for _ in range(20):
+                arg = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+                self.assertEqual(index.match(arg), self.reference_match(keys, arg))
+    
+    def test_compile_keys_is_cached(self):
+        """Testa que a mesma lista de chaves reaproveita o índice"""
+        first = compile_keys(['--text=', '--name='])
+        second = compile_keys(['--text=', '--name='])
+        
+        self.assertIs(first, second)
+        self.assertIs(compile_keys(first), first)
+    
+    def test_get_params_sys_args_with_index(self):
+        """Testa get_params_sys_args() recebendo um índice compilado"""
+        sys.argv = ['script.py', '--text=hello', '--name=world', '--text=again']
+        index = compile_keys(['--text=', '--name='])
+        
+        args = get_params_sys_args(index)
+        
+        self.assertEqual(args, {'--text=': 'again', '--name=': 'world'})
+    
+    def test_many_keys(self):
+        """Testa muitas chaves e muitos argumentos"""
+        keys = [f'--key{i}=' for i in range(500)]
+        sys.argv = ['script.py'] + [f'--key{i % 500}={i}' for i in range(2000)]
+        
+        args = get_params_sys_args(keys)
+        
+        self.assertEqual(len(args), 500)
+        self.assertEqual(args['--key0='], '1500')
+        self.assertEqual(args['--key499='], '1999')
+
+
 class TestIntegration(unittest.TestCase):
     """Testes de integração combinando múltiplas funções"""
     
@@ -0,0 +1,277 @@
+"""
+Testes unitários para o módulo friendly_arguments.parser
+"""
+
+import sys
+import unittest
+from array import array
+
+from friendly_arguments.named import get_args, get_arg
+from friendly_arguments.parser import Parser, Option, Arguments, ArgumentError, parse_many
+
+
+class TestParser(unittest.TestCase):
+    """Testes para a classe Parser"""
+    
+    def setUp(self):
+        """Cria um parser com opções, aliases e flags declarados"""
+        self.parser = Parser([
+            Option('--name', '-n', default='Anonymous'),
+            Option('--verbose', '-v', flag=True, default=False),
+            Option('--port', '-p'),
+        ])
+    
+    def test_aliases_resolve_to_canonical_key(self):
+        """Testa que aliases são armazenados na chave canônica"""
+        args = self.parser.parse(['script.py', '-n', 'João', '-p=8080'])
+        
+        self.assertEqual(args['--name'], 'João')
+        self.assertEqual(args['--port'], '8080')
+        self.assertNotIn('-n', args)
+        self.assertNotIn('-p', args)
+    
+    def test_declared_defaults(self):
+        """Testa valores padrão declarados nas opções"""
+        args = self.parser.parse(['script.py'])
+        
+        self.assertEqual(args, {'--name': 'Anonymous', '--verbose': False})
+    
+    def test_call_defaults_override_declared_defaults(self):
+        """Testa que defaults da chamada têm prioridade sobre os declarados"""
+        args = self.parser.parse(['script.py'], defaults={'-n': 'Maria', '--age': '18'})
+        
+        self.assertEqual(args['--name'], 'Maria')
+        self.assertEqual(args['--age'], '18')
+    
+    def test_flag_does_not_consume_value(self):
+        """Testa que flags declaradas não consomem o próximo token"""
+        args = self.parser.parse(['script.py', '-v', 'arquivo.txt', '--name', 'Ana'])
+        
+        self.assertTrue(args['--verbose'])
+        self.assertEqual(args['--name'], 'Ana')
+    
+    def test_undeclared_options_work_like_get_args(self):
+        """Testa que opções não declaradas seguem as regras de get_args()"""
+        argv = ['script.py', '--city', 'São Paulo', '--debug', '--x=1']
+        args = self.parser.parse(argv)
+        
+        self.assertEqual(args['--city'], 'São Paulo')
+        self.assertTrue(args['--debug'])
+        self.assertEqual(args['--x'], '1')
+    
+    def test_last_value_wins_across_aliases(self):
+        """Testa que o último valor prevalece mesmo com aliases diferentes"""
+        args = self.parser.parse(['script.py', '--name=First', '-n', 'Second'])
+        
+        self.assertEqual(args['--name'], 'Second')
+    
+    def test_lookup_and_get_arg_use_alias_table(self):
+        """Testa busca por alias em Arguments.lookup() e get_arg()"""
+        args = self.parser.parse(['script.py', '--port', '80'])
+        
+        self.assertIsInstance(args, Arguments)
+        self.assertEqual(args.lookup('-p'), '80')
+        self.assertEqual(get_arg(args, '-p'), '80')
+        self.assertEqual(get_arg(args, '--missing', default='x'), 'x')
+    
+    def test_canonical(self):
+        """Testa a resolução de nomes canônicos"""
+        self.assertEqual(self.parser.canonical('-v'), '--verbose')
+        self.assertEqual(self.parser.canonical('--other'), '--other')
+    
+    def test_add_option_recompiles(self):
+        """Testa que declarar uma nova opção invalida a compilação"""
+        self.parser.parse(['script.py'])
+        self.parser.add_option('--city', '-c', default='Recife')
+        
+        args = self.parser.parse(['script.py', '-c', 'Natal'])
+        
+        self.assertEqual(args['--city'], 'Natal')
+    
+    def test_duplicate_names_rejected(self):
+        """Testa que nomes repetidos geram erro"""
+        parser = Parser([Option('--name', '-n'), Option('--number', '-n')])
+        
+        with self.assertRaises(ArgumentError):
+            parser.parse(['script.py'])
+    
+    def test_empty_name_rejected(self):
+        """Testa que nome vazio gera erro"""
+        with self.assertRaises(ArgumentError):
+            Option('')
+
+
+class TestActions(unittest.TestCase):
+    """Testes para as ações append e count"""
+    
+    def setUp(self):
+        """Cria um parser com opções acumuladoras"""
+        self.parser = Parser([
+            Option('--include', '-I', action='append'),
+            Option('--id', type=int, action='append'),
+            Option('--weight', type=float, action='append'),
+            Option('--verbose', '-v', action='count', default=0),
+            Option('--name'),
+        ])
+    
+    def test_append_keeps_order(self):
+        """Testa que append coleta todos os valores em ordem"""
+        args = self.parser.parse(['script.py', '--include', 'a', '-I=b', '--include', 'c'])
+        
+        self.assertEqual(args['--include'], ('a', 'b', 'c'))
+    
+    def test_typed_append_uses_array(self):
+        """Testa que append de int e float usa array.array"""
+        args = self.parser.parse(['script.py', '--id', '1', '--id=2', '--weight', '0.5'])
+        
+        self.assertEqual(args['--id'], array('q', [1, 2]))
+        self.assertEqual(args['--weight'], array('d', [0.5]))
+    
+    def test_count(self):
+        """Testa contagem de flags, incluindo a forma repetida -vvv"""
+        args = self.parser.parse(['script.py', '-v', '--verbose', '-vvv', 'file.txt'])
+        
+        self.assertEqual(args['--verbose'], 5)
+        self.assertNotIn('-vvv', args)
+    
+    def test_count_default(self):
+        """Testa o valor padrão de uma opção count"""
+        self.assertEqual(self.parser.parse(['script.py'])['--verbose'], 0)
+    
+    def test_count_rejects_value(self):
+        """Testa que count não aceita '--opção=valor'"""
+        with self.assertRaises(ArgumentError):
+            self.parser.parse(['script.py', '--verbose=3'])
+    
+    def test_store_still_overwrites(self):
+        """Testa que opções comuns continuam com o último valor"""
+        args = self.parser.parse(['script.py', '--name', 'a', '--name', 'b'])
+        
+        self.assertEqual(args['--name'], 'b')
+    
+    def test_many_repetitions(self):
+        """Testa muitas repetições da mesma opção"""
+        argv = ['script.py'] + ['--include', 'x'] * 10000
+        
+        self.assertEqual(len(self.parser.parse(argv)['--include']), 10000)
+    
+    def test_unknown_action(self):
+        """Testa ação desconhecida"""
+        with self.assertRaises(ArgumentError):
+            Option('--x', action='extend')
+    
+    def test_lazy_with_actions(self):
+        """Testa que o modo preguiçoso coleta todas as ocorrências"""
+        argv = ['script.py', '-I', 'a', '-vv', '--name', 'n', '-I', 'b']
+        lazy = self.parser.parse_lazy(argv)
+        
+        self.assertEqual(lazy['--name'], 'n')
+        self.assertIsNone(lazy.get('--missing'))
+        self.assertEqual(lazy['--include'], ('a', 'b'))
+        self.assertEqual(dict(lazy), self.parser.parse(argv))
+
+
+class TestParseMany(unittest.TestCase):
+    """Testes para o parsing em lote com parse_many()"""
+    
+    def setUp(self):
+        """Cria um parser e alguns vetores de argumentos"""
+        self.parser = Parser([
+            Option('--name', '-n', default='Anonymous'),
+            Option('--port', '-p'),
+        ])
+        self.argvs = [
+            ['job', '-n', 'a', '--port=1'],
+            ['job'],
+            ['job', '--extra', 'x', '-p', '3'],
+        ]
+    
+    def test_rows(self):
+        """Testa o resultado com um dicionário por argv"""
+        rows = parse_many(self.argvs, self.parser)
+        
+        self.assertEqual(rows, [
+            {'--name': 'a', '--port': '1'},
+            {'--name': 'Anonymous'},
+            {'--name': 'Anonymous', '--extra': 'x', '--port': '3'},
+        ])
+        self.assertEqual(rows[0].lookup('-n'), 'a')
+    
+    def test_rows_match_single_parse(self):
+        """Testa equivalência com chamadas individuais de parse()"""
+        rows = parse_many(self.argvs, self.parser, defaults={'--city': 'Recife'})
+        
+        for argv, row in zip(self.argvs, rows):
+            self.assertEqual(row, self.parser.parse(argv, defaults={'--city': 'Recife'}))
+    
+    def test_columnar(self):
+        """Testa o resultado colunar (uma lista por chave)"""
+        columns = parse_many(self.argvs, self.parser, columnar=True)
+        
+        self.assertEqual(columns, {
+            '--name': ['a', 'Anonymous', 'Anonymous'],
+            '--port': ['1', None, '3'],
+            '--extra': [None, None, 'x'],
+        })
+    
+    def test_columnar_with_defaults(self):
+        """Testa defaults extras no modo colunar"""
+        columns = parse_many([['job'], ['job', '--city', 'Natal']], columnar=True,
+                             defaults={'--city': 'Recife'})
+        
+        self.assertEqual(columns, {'--city': ['Recife', 'Natal']})
+    
+    def test_accepts_generators(self):
+        """Testa que a entrada pode ser um iterável preguiçoso"""
+        rows = parse_many((['job', f'--i={i}'] for i in range(3)))
+        
+        self.assertEqual([row['--i'] for row in rows], ['0', '1', '2'])
+    
+    def test_rows_are_independent(self):
+        """Testa que os registros não compartilham o dicionário de defaults"""
+        rows = parse_many([['job'], ['job']], self.parser)
+        rows[0]['--name'] = 'changed'
+        
+        self.assertEqual(rows[1]['--name'], 'Anonymous')
+        self.assertEqual(self.parser.parse(['job'])['--name'], 'Anonymous')
+
+
+class TestGetArgsWrapper(unittest.TestCase):
+    """Testes para get_args() como wrapper do Parser"""
+    
+    def setUp(self):
+        """Salva o sys.argv original antes de cada teste"""
+        self.original_argv = sys.argv.copy()
+    
+    def tearDown(self):
+        """Restaura o sys.argv original após cada teste"""
+        sys.argv = self.original_argv
+    
+    def test_returns_dict(self):
+        """Testa que get_args() continua retornando um dicionário"""
+        sys.argv = ['script.py', '--name=João']
+        args = get_args()
+        
+        self.assertIsInstance(args, dict)
+        self.assertEqual(args, {'--name': 'João'})
+    
+    def test_defaults_are_not_mutated(self):
+        """Testa que o dicionário de defaults não é alterado"""
+        defaults = {'--name': 'Anonymous'}
+        sys.argv = ['script.py', '--name=João']
+        
+        get_args(defaults=defaults)
+        
+        self.assertEqual(defaults, {'--name': 'Anonymous'})
+    
+    def test_explicit_argv(self):
+        """Testa get_args() com vetor de argumentos explícito"""
+        sys.argv = ['script.py', '--name=Global']
+        args = get_args(argv=['job', '--name', 'Local'])
+        
+        self.assertEqual(args, {'--name': 'Local'})
+        self.assertEqual(sys.argv, ['script.py', '--name=Global'])
+
+
+if __name__ == '__main__':
+    unittest.main()
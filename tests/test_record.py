@@ -0,0 +1,144 @@
+"""
+Testes unitários para o módulo friendly_arguments.record
+"""
+
+import pickle
+import sys
+import unittest
+from collections.abc import Mapping
+
+from friendly_arguments.parser import Parser, Option, ArgumentError
+from friendly_arguments.record import Record, parse_record, parse_records, record_type
+
+
+def make_parser():
+    return Parser([
+        Option('--name', '-n'),
+        Option('--dry-run', flag=True, default=False),
+        Option('--retries', '-r', type=int, default=3),
+        Option('--tag', '-t', action='append'),
+    ])
+
+
+class TestRecordType(unittest.TestCase):
+    """Testes para record_type()"""
+    
+    def test_slots_per_option(self):
+        """Testa que a classe tem um slot por opção e nenhum __dict__"""
+        Job = record_type(make_parser())
+        
+        self.assertTrue(issubclass(Job, Record))
+        self.assertEqual(Job.__slots__, ('name', 'dry_run', 'retries', 'tag'))
+        self.assertFalse(hasattr(Job(), '__dict__'))
+    
+    def test_identifiers(self):
+        """Testa a conversão de nomes com traços, palavras reservadas e dígitos"""
+        parser = Parser([Option('--class'), Option('--2fa'), Option('--items'), Option('-x')])
+        self.assertEqual(record_type(parser).__slots__, ('class_', '_2fa', 'items_', 'x'))
+    
+    def test_colliding_identifiers(self):
+        """Testa que opções com o mesmo nome de atributo geram ArgumentError"""
+        parser = Parser([Option('--dry-run'), Option('--dry_run')])
+        with self.assertRaises(ArgumentError):
+            record_type(parser)
+    
+    def test_cached_per_parser(self):
+        """Testa que a classe é gerada uma vez e refeita quando a spec muda"""
+        parser = make_parser()
+        Job = record_type(parser)
+        self.assertIs(record_type(parser), Job)
+        
+        parser.add_option('--force', flag=True)
+        self.assertIsNot(record_type(parser), Job)
+        self.assertIn('force', record_type(parser).__slots__)
+
+
+class TestRecord(unittest.TestCase):
+    """Testes para os registros gerados"""
+    
+    def setUp(self):
+        """Cria o parser e um registro de exemplo"""
+        self.parser = make_parser()
+        self.argv = ['job', '-n', 'João', '--dry-run', '-t', 'a', '-t', 'b', '--extra=1']
+        self.record = parse_record(self.argv, self.parser)
+    
+    def test_attribute_access(self):
+        """Testa o acesso por atributo, com None para opções ausentes"""
+        self.assertEqual(self.record.name, 'João')
+        self.assertIs(self.record.dry_run, True)
+        self.assertEqual(self.record.retries, 3)
+        self.assertEqual(self.record.tag, ('a', 'b'))
+        
+        empty = parse_record(['job'], self.parser)
+        self.assertIsNone(empty.name)
+        with self.assertRaises(AttributeError):
+            empty.missing
+    
+    def test_mapping_protocol(self):
+        """Testa que o registro se comporta como o dicionário do parse()"""
+        expected = self.parser.parse(self.argv)
+        
+        self.assertIsInstance(self.record, Mapping)
+        self.assertEqual(dict(self.record), expected)
+        self.assertEqual(list(self.record), ['--name', '--dry-run', '--retries', '--tag', '--extra'])
+        self.assertEqual(self.record, expected)
+        self.assertEqual(len(self.record), len(expected))
+        self.assertEqual(self.record['--name'], 'João')
+        self.assertEqual(self.record['--extra'], '1')
+        self.assertEqual(self.record.get('--missing', 'x'), 'x')
+        self.assertNotIn('--missing', self.record)
+        
+        empty = parse_record(['job'], self.parser)
+        self.assertNotIn('--name', empty)
+        with self.assertRaises(KeyError):
+            empty['--name']
+    
+    def test_lookup_alias(self):
+        """Testa lookup() por alias"""
+        self.assertEqual(self.record.lookup('-n'), 'João')
+        self.assertEqual(self.record.lookup('-r'), 3)
+    
+    def test_repr(self):
+        """Testa a representação com nomes de atributos"""
+        record = parse_record(['job', '--name', 'a', '--other'], Parser([Option('--name')]))
+        self.assertEqual(repr(record), "Record(name='a', extra={'--other': True})")
+    
+    def test_pickle(self):
+        """Testa que registros podem ser serializados com pickle"""
+        copy = pickle.loads(pickle.dumps(self.record))
+        self.assertEqual(dict(copy), dict(self.record))
+        self.assertEqual(copy.name, 'João')
+    
+    def test_smaller_than_dict(self):
+        """Testa que o registro ocupa menos memória que o dicionário"""
+        self.assertLess(sys.getsizeof(self.record), sys.getsizeof(self.parser.parse(self.argv)))
+    
+    def test_parser_method(self):
+        """Testa Parser.parse_record()"""
+        record = self.parser.parse_record(['job', '-r', '5'], defaults={'--name': 'x'})
+        self.assertEqual((record.name, record.retries), ('x', 5))
+
+
+class TestParseRecords(unittest.TestCase):
+    """Testes para parse_records()"""
+    
+    def test_matches_parse_many(self):
+        """Testa que o resultado é igual ao de parse() para cada argv"""
+        parser = make_parser()
+        argvs = [['job', '-n', str(i), '--flag'] if i % 2 else ['job', '-r', str(i)]
+                 for i in range(50)]
+        
+        records = list(parse_records(argvs, parser, defaults={'--name': 'padrão'}))
+        
+        self.assertEqual(len(records), 50)
+        for argv, record in zip(argvs, records):
+            self.assertEqual(dict(record), parser.parse(argv, defaults={'--name': 'padrão'}))
+    
+    def test_default_parser(self):
+        """Testa que sem parser as chaves ficam no dicionário extra"""
+        record, = parse_records([['job', '--a=1', '-b']])
+        self.assertEqual(dict(record), {'--a': '1', '-b': True})
+
+
+if __name__ == '__main__':
+    unittest.main()
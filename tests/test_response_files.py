@@ -0,0 +1,120 @@
+"""
+Testes unitários para o módulo friendly_arguments.response_files
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from friendly_arguments.named import get_args
+from friendly_arguments.parser import ArgumentError
+from friendly_arguments.response_files import expand_response_files
+
+
+class TestExpandResponseFiles(unittest.TestCase):
+    """Testes para a expansão de arquivos de argumentos (@arquivo)"""
+    
+    def setUp(self):
+        """Cria um diretório temporário e salva o sys.argv original"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original_argv = sys.argv.copy()
+    
+    def tearDown(self):
+        """Remove o diretório temporário e restaura o sys.argv original"""
+        self.tmp.cleanup()
+        sys.argv = self.original_argv
+    
+    def write(self, name, content):
+        """Escreve um arquivo de argumentos e retorna o caminho"""
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+        return path
+    
+    def test_one_argument_per_line(self):
+        """Testa que cada linha vira um argumento"""
+        path = self.write('args.txt', '--name\nJoão Silva\n--verbose\n')
+        
+        tokens = list(expand_response_files(['--a=1', f'@{path}', '--b=2']))
+        
+        self.assertEqual(tokens, ['--a=1', '--name', 'João Silva', '--verbose', '--b=2'])
+    
+    def test_crlf_and_missing_final_newline(self):
+        """Testa quebras de linha CRLF e arquivo sem quebra final"""
+        path = self.write('args.txt', '--x=1\r\n--y=2')
+        
+        self.assertEqual(list(expand_response_files([f'@{path}'])), ['--x=1', '--y=2'])
+    
+    def test_empty_lines_are_arguments(self):
+        """Testa que linhas vazias intermediárias viram argumentos vazios"""
+        path = self.write('args.txt', '--name\n\n--z\n')
+        
+        self.assertEqual(list(expand_response_files([f'@{path}'])), ['--name', '', '--z'])
+    
+    def test_empty_file(self):
+        """Testa arquivo vazio"""
+        path = self.write('empty.txt', '')
+        
+        self.assertEqual(list(expand_response_files([f'@{path}'])), [])
+    
+    def test_nested_files_relative_to_parent(self):
+        """Testa inclusão aninhada com caminho relativo ao arquivo pai"""
+        os.mkdir(os.path.join(self.tmp.name, 'sub'))
+        self.write(os.path.join('sub', 'inner.txt'), '--inner=1\n')
+        path = self.write('outer.txt', '--outer=1\n@sub/inner.txt\n--last=1\n')
+        
+        tokens = list(expand_response_files([f'@{path}']))
+        
+        self.assertEqual(tokens, ['--outer=1', '--inner=1', '--last=1'])
+    
+    def test_same_file_twice_is_not_a_cycle(self):
+        """Testa que incluir o mesmo arquivo duas vezes em sequência é permitido"""
+        self.write('common.txt', '--c=1\n')
+        path = self.write('main.txt', '@common.txt\n@common.txt\n')
+        
+        self.assertEqual(list(expand_response_files([f'@{path}'])), ['--c=1', '--c=1'])
+    
+    def test_cycle_detection(self):
+        """Testa que ciclos de inclusão geram erro"""
+        self.write('a.txt', '--a=1\n@b.txt\n')
+        self.write('b.txt', '@a.txt\n')
+        
+        with self.assertRaises(ArgumentError):
+            list(expand_response_files([f"@{os.path.join(self.tmp.name, 'a.txt')}"]))
+    
+    def test_missing_file(self):
+        """Testa arquivo inexistente"""
+        with self.assertRaises(ArgumentError):
+            list(expand_response_files([f"@{os.path.join(self.tmp.name, 'nope.txt')}"]))
+    
+    def test_lone_prefix_is_kept(self):
+        """Testa que '@' sozinho é mantido como argumento comum"""
+        self.assertEqual(list(expand_response_files(['@'])), ['@'])
+    
+    def test_is_lazy(self):
+        """Testa que os argumentos são lidos sob demanda"""
+        path = self.write('args.txt', '--a=1\n--b=2\n')
+        tokens = expand_response_files([f'@{path}'])
+        
+        self.assertEqual(next(tokens), '--a=1')
+        tokens.close()
+    
+    def test_get_args_with_response_files(self):
+        """Testa get_args() com arquivos de argumentos"""
+        path = self.write('args.txt', '--name\nMaria\n--port=8080\n')
+        sys.argv = ['script.py', f'@{path}', '--port', '9090']
+        
+        args = get_args(response_files=True)
+        
+        self.assertEqual(args, {'--name': 'Maria', '--port': '9090'})
+    
+    def test_disabled_by_default(self):
+        """Testa que '@arquivo' não é expandido sem response_files=True"""
+        sys.argv = ['script.py', '--user', '@maria']
+        
+        self.assertEqual(get_args(), {'--user': '@maria'})
+
+
+if __name__ == '__main__':
+    unittest.main()
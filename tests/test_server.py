@@ -0,0 +1,164 @@
+"""
+Testes unitários para os módulos friendly_arguments.server e friendly_arguments.client
+"""
+
+import multiprocessing
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from friendly_arguments import client
+from friendly_arguments.parser import Parser, Option, ArgumentError
+from friendly_arguments.server import client_command, serve
+
+PARSER = Parser([
+    Option('--name', '-n', required=True),
+    Option('--code', type=int, default=0),
+])
+
+
+def program(args):
+    """Programa de teste: escreve o nome, o diretório e uma variável"""
+    print(args['--name'], os.getcwd(), os.environ.get('FA_TEST', ''), sys.argv[0])
+    if args['--code'] == 99:
+        raise SystemExit('saindo')
+    if args['--code'] == 98:
+        raise RuntimeError('falhou')
+    return args['--code']
+
+
+def untyped_program(args):
+    """Programa de teste sem parser: get_args()"""
+    print(sorted(args.items()))
+
+
+@unittest.skipUnless(os.name == 'posix', "requer fork e sockets Unix")
+class TestServer(unittest.TestCase):
+    """Testes para serve() e client.call()"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'server.sock')
+        self.watched = os.path.join(self.directory.name, 'config.ini')
+        with open(self.watched, 'w') as file:
+            file.write('a=1')
+        self.processes = []
+    
+    def tearDown(self):
+        for process in self.processes:
+            process.terminate()
+            process.join()
+        self.directory.cleanup()
+    
+    def start(self, main=program, parser=PARSER, idle_timeout=30.0):
+        context = multiprocessing.get_context('fork')
+        process = context.Process(target=serve, args=(main, self.path, parser),
+                                  kwargs={'idle_timeout': idle_timeout, 'watch': [self.watched]})
+        process.start()
+        self.processes.append(process)
+        deadline = time.monotonic() + 10
+        while not os.path.exists(self.path):
+            self.assertLess(time.monotonic(), deadline, "servidor não iniciou")
+            time.sleep(0.01)
+        return process
+    
+    def call(self, *args, environ=None):
+        """Executa no servidor com stdout e stderr em arquivos temporários"""
+        with open(os.devnull) as stdin, tempfile.TemporaryFile() as out, \
+                tempfile.TemporaryFile() as err:
+            code = client.call(self.path, ['tool'] + list(args), environ=environ,
+                               cwd=self.directory.name,
+                               stdio=(stdin.fileno(), out.fileno(), err.fileno()))
+            out.seek(0)
+            err.seek(0)
+            return code, out.read().decode(), err.read().decode()
+    
+    def test_runs_program(self):
+        """Testa o código de saída, a saída, o diretório, o ambiente e sys.argv"""
+        self.start()
+        code, out, err = self.call('--name', 'ana', '--code', '3', environ={'FA_TEST': 'sim'})
+        
+        self.assertEqual(code, 3)
+        self.assertEqual(out.split(), ['ana', os.path.realpath(self.directory.name), 'sim', 'tool'])
+        self.assertEqual(err, '')
+    
+    def test_many_requests(self):
+        """Testa que o servidor atende várias chamadas seguidas"""
+        self.start()
+        for name in ('a', 'b', 'c'):
+            self.assertEqual(self.call('-n', name)[1].split()[0], name)
+    
+    def test_errors(self):
+        """Testa SystemExit, ArgumentError e exceções do programa"""
+        self.start()
+        
+        code, _, err = self.call('--name', 'x', '--code', '99')
+        self.assertEqual((code, err.strip()), (1, 'saindo'))
+        
+        code, _, err = self.call('--code', '1')
+        self.assertEqual(code, 2)
+        self.assertIn('--name', err)
+        
+        code, _, err = self.call('--name', 'x', '--code', '98')
+        self.assertEqual(code, 1)
+        self.assertIn('RuntimeError: falhou', err)
+    
+    def test_default_parser(self):
+        """Testa o parsing como get_args() sem parser"""
+        self.start(untyped_program, None)
+        _, out, _ = self.call('--a=1', '-v')
+        self.assertEqual(out.strip(), "[('--a', '1'), ('-v', True)]")
+    
+    def test_unavailable(self):
+        """Testa que sem servidor call() retorna None e o cliente sai com 75"""
+        self.assertIsNone(self.call('--name', 'x')[0])
+        self.assertEqual(client.main([self.path, 'tool']), client.UNAVAILABLE)
+    
+    def test_source_change_stops_server(self):
+        """Testa que uma mudança em arquivo observado encerra o servidor"""
+        process = self.start()
+        self.assertEqual(self.call('--name', 'x')[0], 0)
+        
+        stat = os.stat(self.watched)
+        os.utime(self.watched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        
+        self.assertIsNone(self.call('--name', 'x')[0])
+        process.join(10)
+        self.assertEqual(process.exitcode, 0)
+        self.assertFalse(os.path.exists(self.path))
+    
+    def test_idle_timeout(self):
+        """Testa que o servidor sai depois do tempo ocioso"""
+        process = self.start(idle_timeout=0.2)
+        process.join(10)
+        self.assertEqual(process.exitcode, 0)
+        self.assertFalse(os.path.exists(self.path))
+    
+    def test_single_server(self):
+        """Testa que um segundo servidor no mesmo socket gera ArgumentError"""
+        self.start()
+        with self.assertRaises(ArgumentError):
+            serve(program, self.path, PARSER)
+    
+    def test_socket_permissions(self):
+        """Testa que só o dono acessa o socket"""
+        self.start()
+        self.assertEqual(os.stat(self.path).st_mode & 0o077, 0)
+    
+    def test_client_command(self):
+        """Testa o comando de shell do cliente"""
+        self.start()
+        command = client_command(self.path) + ' tool --name shell'
+        result = subprocess.run(command, shell=True, cwd=self.directory.name,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.decode().split()[0], 'shell')
+        self.assertEqual(shlex.split(command)[1:3], ['-S', os.path.abspath(client.__file__)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Testes unitários para o módulo friendly_arguments.shared
+"""
+
+import enum
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from array import array
+from pathlib import Path
+
+from friendly_arguments.parser import Parser, Option, ArgumentError
+from friendly_arguments.shared import SharedArguments, attach_arguments, publish_arguments
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Level(enum.Enum):
+    LOW = 'low'
+    HIGH = 'high'
+
+
+def make_args():
+    """Resultado com textos, flags, listas numéricas, tuplas e tipos ricos"""
+    parser = Parser([
+        Option('--name', '-n'),
+        Option('--ids', type=int, action='append'),
+        Option('--weights', type=float, action='append'),
+        Option('--tag', '-t', action='append'),
+        Option('--count', type=int),
+        Option('--output', type=Path),
+        Option('--verbose', '-v', action='count'),
+    ])
+    argv = ['prog', '-n', 'Jo\udce3o', '--count', '7', '--output', 'out.txt', '-vv',
+            '-t', 'a', '-t', 'b', '--flag', '--weights=0.5']
+    for i in range(1000):
+        argv += ['--ids', str(i)]
+    return parser.parse(argv)
+
+
+# Processos do pool: o mapeamento é recebido já anexado no inicializador
+ARGS = None
+
+
+def _init_worker(shared):
+    global ARGS
+    ARGS = shared
+
+
+def _read_worker(_):
+    return (os.getpid(), ARGS['--name'], sum(ARGS['--ids']), ARGS.lookup('-t'),
+            len(ARGS._values))
+
+
+class TestSharedArguments(unittest.TestCase):
+    """Testes para publish_arguments() e attach_arguments()"""
+    
+    def setUp(self):
+        """Publica um resultado de exemplo"""
+        self.args = make_args()
+        self.shared = publish_arguments(self.args)
+    
+    def tearDown(self):
+        """Remove o bloco de memória compartilhada"""
+        self.shared.close()
+    
+    def test_round_trip(self):
+        """Testa que todos os valores voltam iguais, na mesma ordem"""
+        attached = attach_arguments(self.shared.name)
+        try:
+            self.assertEqual(list(attached), list(self.args))
+            self.assertEqual(dict(attached), dict(self.args))
+            self.assertEqual(attached['--name'], 'Jo\udce3o')
+            self.assertEqual(attached['--output'], Path('out.txt'))
+            self.assertIs(attached['--flag'], True)
+            self.assertEqual(attached.lookup('-v'), 2)
+        finally:
+            attached.close()
+    
+    def test_lazy_decoding(self):
+        """Testa que só os valores consultados são decodificados"""
+        attached = attach_arguments(self.shared.name)
+        try:
+            self.assertEqual(len(attached), len(self.args))
+            self.assertIn('--tag', attached)
+            self.assertEqual(attached._values, {})
+            
+            self.assertEqual(attached['--tag'], ('a', 'b'))
+            self.assertIs(attached['--tag'], attached['--tag'])
+            self.assertEqual(list(attached._values), ['--tag'])
+        finally:
+            attached.close()
+    
+    def test_arrays_are_shared_views(self):
+        """Testa que listas numéricas são memoryviews somente leitura, sem cópia"""
+        attached = attach_arguments(self.shared.name)
+        try:
+            ids = attached['--ids']
+            self.assertIsInstance(ids, memoryview)
+            self.assertTrue(ids.readonly)
+            self.assertEqual(ids, array('q', range(1000)))
+            self.assertEqual(ids[999], 999)
+            self.assertEqual(attached['--weights'].tolist(), [0.5])
+            del ids
+        finally:
+            attached.close()
+    
+    def test_pickles_as_name(self):
+        """Testa que o pickle leva só o nome do bloco"""
+        data = pickle.dumps(self.shared)
+        self.assertLess(len(data), 200)
+        
+        attached = pickle.loads(data)
+        try:
+            self.assertIsInstance(attached, SharedArguments)
+            self.assertEqual(attached['--count'], 7)
+        finally:
+            attached.close()
+    
+    def test_unknown_name(self):
+        """Testa que um nome inexistente gera ArgumentError"""
+        with self.assertRaises(ArgumentError):
+            attach_arguments('friendly-arguments-missing-block')
+    
+    def test_unsupported_value(self):
+        """Testa que valores que não podem ser codificados geram ArgumentError"""
+        with self.assertRaises(ArgumentError):
+            publish_arguments({'--callback': lambda: None})
+    
+    def test_spawn_pool(self):
+        """Testa um pool com spawn: cada processo anexa e lê sem receber cópias"""
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(4, initializer=_init_worker, initargs=(self.shared,)) as pool:
+            results = pool.map(_read_worker, range(8))
+        
+        for _, name, total, tags, decoded in results:
+            self.assertEqual((name, total, tags), ('Jo\udce3o', sum(range(1000)), ('a', 'b')))
+            self.assertLessEqual(decoded, 3)
+        
+        # Os processos terminaram e o bloco continua disponível
+        attached = attach_arguments(self.shared.name)
+        self.assertEqual(attached['--count'], 7)
+        attached.close()
+    
+    def test_unrelated_process(self):
+        """Testa que um processo independente não remove o bloco ao sair"""
+        code = (
+            "import sys; from friendly_arguments.shared import attach_arguments; "
+            f"print(attach_arguments({self.shared.name!r})['--count'])"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(output.stdout.strip(), '7')
+        self.assertNotIn('leaked', output.stderr)
+        
+        attached = attach_arguments(self.shared.name)
+        self.assertEqual(attached['--count'], 7)
+        attached.close()
+    
+    def test_owner_unlinks(self):
+        """Testa que fechar o bloco do publicador o remove"""
+        shared = publish_arguments({'--name': 'x'})
+        name = shared.name
+        with shared:
+            self.assertEqual(shared['--name'], 'x')
+        with self.assertRaises(ArgumentError):
+            attach_arguments(name)
+        shared.close()  # fechar de novo não faz nada
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+"""
+Testes unitários para o módulo friendly_arguments.snapshot
+"""
+
+import enum
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from friendly_arguments.converters import ListOf
+from friendly_arguments.lazy import LazyArguments
+from friendly_arguments.parser import Parser, Option, Arguments, ArgumentError
+from friendly_arguments.snapshot import (
+    cached_parser, load_parser, load_result, save_parser, save_result
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Level(enum.Enum):
+    LOW = 'low'
+    HIGH = 'high'
+
+
+def make_parser():
+    """Parser com tipos, aliases, defaults e ações usado nos testes"""
+    return Parser([
+        Option('--name', '-n', default='anon'),
+        Option('--count', '-c', type=int),
+        Option('--level', type=Level, default=Level.LOW),
+        Option('--ids', type=ListOf(int)),
+        Option('--tag', '-t', action='append'),
+        Option('--verbose', '-v', action='count'),
+        Option('--dry-run', flag=True),
+    ])
+
+
+ARGV = ['prog', '-n', 'job', '-c', '3', '--level', 'high', '--ids', '1,2',
+        '-t', 'a', '--tag', 'b', '-vv', '--dry-run']
+
+
+class TestOptionPickle(unittest.TestCase):
+    """Testes para a serialização de Option e Parser"""
+    
+    def test_missing_default_survives(self):
+        """Testa que uma opção sem default continua sem default após o pickle"""
+        option = pickle.loads(pickle.dumps(Option('--count', type=int)))
+        self.assertFalse(option.has_default)
+        self.assertIsNone(option.converter)
+        
+        option = pickle.loads(pickle.dumps(Option('--name', default=None)))
+        self.assertTrue(option.has_default)
+        self.assertIsNone(option.default)
+    
+    def test_converters_rebound(self):
+        """Testa que um Parser compilado volta compilado e com conversores"""
+        parser = make_parser().compile()
+        copy = pickle.loads(pickle.dumps(parser))
+        
+        self.assertIsNotNone(copy._lookup)
+        self.assertEqual(copy.parse(ARGV), parser.parse(ARGV))
+        self.assertEqual(copy.parse(['prog', '-c', '7'])['--count'], 7)
+    
+    def test_uncompiled_parser(self):
+        """Testa que um Parser ainda não compilado é compilado no primeiro uso"""
+        copy = pickle.loads(pickle.dumps(make_parser()))
+        self.assertEqual(copy.parse(ARGV), make_parser().parse(ARGV))
+
+
+class TestParserSnapshot(unittest.TestCase):
+    """Testes para save_parser(), load_parser() e cached_parser()"""
+    
+    def setUp(self):
+        """Cria um diretório temporário para os snapshots"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'spec', 'tool.snapshot')
+    
+    def tearDown(self):
+        """Remove o diretório temporário"""
+        self.directory.cleanup()
+    
+    def test_round_trip(self):
+        """Testa que o parser carregado produz o mesmo resultado"""
+        save_parser(make_parser(), self.path, key='v1')
+        parser = load_parser(self.path, key='v1')
+        
+        self.assertIsInstance(parser, Parser)
+        self.assertEqual(parser.parse(ARGV), make_parser().parse(ARGV))
+        self.assertEqual(parser.fingerprint(), make_parser().fingerprint())
+    
+    def test_missing_file(self):
+        """Testa que um snapshot inexistente retorna None"""
+        self.assertIsNone(load_parser(self.path))
+    
+    def test_other_key(self):
+        """Testa que um snapshot gravado com outra chave é ignorado"""
+        save_parser(make_parser(), self.path, key='v1')
+        self.assertIsNone(load_parser(self.path, key='v2'))
+        self.assertIsNone(load_parser(self.path))
+    
+    def test_corrupt_payload(self):
+        """Testa que um snapshot alterado é ignorado"""
+        save_parser(make_parser(), self.path)
+        with open(self.path, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b'\x00')
+        self.assertIsNone(load_parser(self.path))
+    
+    def test_other_version(self):
+        """Testa que um snapshot de outra versão do formato é ignorado"""
+        save_parser(make_parser(), self.path)
+        data = Path(self.path).read_bytes()
+        header, _, payload = data.partition(b'\n')
+        fields = header.split(b' ')
+        fields[2] = b'0.0.0'
+        Path(self.path).write_bytes(b' '.join(fields) + b'\n' + payload)
+        self.assertIsNone(load_parser(self.path))
+    
+    def test_unpicklable_type(self):
+        """Testa que tipos que não podem ser serializados geram ArgumentError"""
+        parser = Parser([Option('--size', type=lambda value: int(value) * 2)])
+        with self.assertRaises(ArgumentError):
+            save_parser(parser, self.path)
+        self.assertFalse(os.path.exists(self.path))
+    
+    def test_cached_parser(self):
+        """Testa que o segundo carregamento não chama a função de construção"""
+        calls = []
+        
+        def build():
+            calls.append(1)
+            return make_parser()
+        
+        first = cached_parser(self.path, build)
+        second = cached_parser(self.path, build)
+        
+        self.assertEqual(len(calls), 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.parse(ARGV), first.parse(ARGV))
+    
+    def test_cached_parser_key_change(self):
+        """Testa que uma chave nova reconstrói e regrava o snapshot"""
+        calls = []
+        
+        def build():
+            calls.append(1)
+            return make_parser()
+        
+        cached_parser(self.path, build, key='v1')
+        cached_parser(self.path, build, key='v2')
+        cached_parser(self.path, build, key='v2')
+        self.assertEqual(len(calls), 2)
+    
+    def test_cached_parser_unpicklable(self):
+        """Testa que um spec que não pode ser salvo continua funcionando"""
+        def build():
+            return Parser([Option('--size', type=lambda value: int(value) * 2)])
+        
+        parser = cached_parser(self.path, build)
+        self.assertEqual(parser.parse(['prog', '--size', '4'])['--size'], 8)
+        self.assertFalse(os.path.exists(self.path))
+
+
+class TestResultSnapshot(unittest.TestCase):
+    """Testes para save_result() e load_result()"""
+    
+    def setUp(self):
+        """Cria um diretório temporário para os snapshots"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'args.snapshot')
+    
+    def tearDown(self):
+        """Remove o diretório temporário"""
+        self.directory.cleanup()
+    
+    def test_plain_values(self):
+        """Testa um resultado só com valores simples (formato marshal)"""
+        parser = Parser([Option('--name', '-n'), Option('--count', type=int)])
+        args = parser.parse(['prog', '-n', 'job', '--count', '3', '--flag'])
+        save_result(args, self.path)
+        
+        with open(self.path, 'rb') as file:
+            self.assertIn(b'result-marshal', file.readline())
+        
+        loaded = load_result(self.path)
+        self.assertIsInstance(loaded, Arguments)
+        self.assertEqual(loaded, args)
+        self.assertEqual(list(loaded), list(args))
+        self.assertEqual(loaded.lookup('-n'), 'job')
+    
+    def test_rich_values(self):
+        """Testa um resultado com Enum e array.array (formato pickle)"""
+        args = make_parser().parse(ARGV)
+        save_result(args, self.path)
+        loaded = load_result(self.path)
+        
+        self.assertEqual(loaded, args)
+        self.assertIs(loaded['--level'], Level.HIGH)
+        self.assertEqual(loaded.lookup('-t'), ('a', 'b'))
+    
+    def test_lazy_arguments(self):
+        """Testa que um LazyArguments é materializado antes de salvar"""
+        parser = make_parser()
+        save_result(LazyArguments(parser.compile(), ARGV), self.path)
+        self.assertEqual(load_result(self.path), parser.parse(ARGV))
+    
+    def test_key(self):
+        """Testa que a chave precisa ser a mesma na leitura"""
+        save_result({'--name': 'job'}, self.path, key=('run', 1))
+        self.assertIsNone(load_result(self.path))
+        self.assertEqual(load_result(self.path, key=('run', 1)), {'--name': 'job'})
+    
+    def test_child_process(self):
+        """Testa que um processo filho lê o resultado salvo pelo pai"""
+        parser = Parser([Option('--output', '-o', type=Path), Option('--count', type=int)])
+        save_result(parser.parse(['prog', '-o', 'out.txt', '--count', '3']), self.path)
+        code = (
+            "from friendly_arguments.snapshot import load_result; "
+            f"args = load_result({self.path!r}); "
+            "print(type(args.lookup('-o')).__name__, args['--output'].name, args['--count'])"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.split(), ['PosixPath' if os.name == 'posix' else 'WindowsPath',
+                                          'out.txt', '3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
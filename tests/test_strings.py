@@ -0,0 +1,129 @@
+"""
+Testes unitários para o módulo friendly_arguments.strings
+"""
+
+import random
+import shlex
+import types
+import unittest
+
+from friendly_arguments.named import get_args
+from friendly_arguments.parser import Parser, Option, ArgumentError
+from friendly_arguments.strings import parse_string, parse_strings, split_string
+
+
+class TestSplitString(unittest.TestCase):
+    """Testes para a compatibilidade de split_string() com shlex.split()"""
+    
+    CASES = [
+        '',
+        '   ',
+        '--name João --age 25 -v',
+        "--name 'João Silva'",
+        '--message "deploy \\"v2\\" now"',
+        '--path a\\ b --x=\\$HOME',
+        'a"b c"d',
+        "''",
+        'a "" b',
+        '"a\\\\b" "a\\nb" \'a\\b\'',
+        'line\\\nbreak "quoted\\\nbreak"',
+        'tab\tseparated\nlines\r\n',
+        'nbsp\xa0stays\x0bone\u3000word',
+        '# not a comment',
+        "--data='{\"k\": [1, 2]}'",
+        'mixed"dq"\'sq\'\\esc',
+    ]
+    
+    def test_same_words_as_shlex(self):
+        """Testa casos de aspas, escapes e espaços contra shlex.split()"""
+        for cmdline in self.CASES:
+            with self.subTest(cmdline=cmdline):
+                self.assertEqual(list(split_string(cmdline)), shlex.split(cmdline))
+    
+    def test_random_lines(self):
+        """Testa linhas aleatórias com caracteres especiais contra shlex.split()"""
+        alphabet = ['a', 'b', ' ', '\t', '\n', "'", '"', '\\', '=', '-', '\xa0', 'é']
+        rng = random.Random(2024)
+        for _ in range(20000):
+            cmdline = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+            try:
+                expected = shlex.split(cmdline)
+            except ValueError as error:
+                with self.assertRaises(ArgumentError) as context:
+                    list(split_string(cmdline))
+                self.assertEqual(str(context.exception), str(error))
+            else:
+                self.assertEqual(list(split_string(cmdline)), expected, repr(cmdline))
+    
+    def test_errors(self):
+        """Testa aspas sem fechamento e barra invertida final"""
+        for cmdline, message in [('"open', "No closing quotation"),
+                                 ("it's", "No closing quotation"),
+                                 ('end\\', "No escaped character"),
+                                 ('"end\\', "No escaped character")]:
+            with self.subTest(cmdline=cmdline):
+                with self.assertRaises(ArgumentError) as context:
+                    list(split_string(cmdline))
+                self.assertEqual(str(context.exception), message)
+                self.assertIsInstance(context.exception, ValueError)
+    
+    def test_unterminated_quote_is_linear(self):
+        """Testa que uma aspa sem fechamento no fim de uma linha longa falha rápido"""
+        with self.assertRaises(ArgumentError):
+            list(split_string('a' * 100000 + "'"))
+        with self.assertRaises(ArgumentError):
+            list(split_string('ab ' * 30000 + '"x'))
+
+
+class TestParseString(unittest.TestCase):
+    """Testes para parse_string() e parse_strings()"""
+    
+    def setUp(self):
+        """Cria um parser com aliases, tipos e ações"""
+        self.parser = Parser([
+            Option('--message', '-m'),
+            Option('--replicas', '-r', type=int, default=1),
+            Option('--tag', '-t', action='append'),
+            Option('--verbose', '-v', action='count'),
+        ])
+    
+    def test_same_as_shlex_and_parse(self):
+        """Testa que o resultado é igual ao de Parser.parse() sobre shlex.split()"""
+        cmdline = '-m "deploy v2" -r 3 -t a --tag=\'b c\' -vv extra --other x\\ y'
+        expected = self.parser.parse(['prog'] + shlex.split(cmdline))
+        self.assertEqual(parse_string(cmdline, self.parser), expected)
+        self.assertEqual(parse_string(cmdline, self.parser)['--replicas'], 3)
+    
+    def test_default_parser(self):
+        """Testa que sem parser as regras são as de get_args()"""
+        cmdline = "--name 'Ana Maria' --verbose --age=30"
+        self.assertEqual(parse_string(cmdline), get_args(argv=['prog'] + shlex.split(cmdline)))
+    
+    def test_defaults(self):
+        """Testa defaults extras por alias"""
+        args = parse_string('', self.parser, defaults={'-m': 'none'})
+        self.assertEqual(args, {'--replicas': 1, '--message': 'none'})
+        self.assertEqual(args.lookup('-r'), 1)
+    
+    def test_batch(self):
+        """Testa que o lote é um gerador com um resultado por linha, em ordem"""
+        lines = ['-m a -r 2', "-m 'b c'", '-t x -t "y z"\n', '']
+        results = parse_strings(lines, self.parser)
+        self.assertIsInstance(results, types.GeneratorType)
+        
+        results = list(results)
+        self.assertEqual(results, [parse_string(line, self.parser) for line in lines])
+        self.assertEqual(results[1]['--message'], 'b c')
+        self.assertEqual(results[2]['--tag'], ('x', 'y z'))
+        self.assertIsNot(results[0], results[3])
+    
+    def test_batch_error(self):
+        """Testa que uma linha inválida interrompe o lote com ArgumentError"""
+        results = parse_strings(['-m ok', '-m "open'], self.parser)
+        self.assertEqual(next(results)['--message'], 'ok')
+        with self.assertRaises(ArgumentError):
+            next(results)
+
+
+if __name__ == '__main__':
+    unittest.main()
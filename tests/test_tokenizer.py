@@ -0,0 +1,171 @@
+"""
+Testes unitários para o tokenizador de Parser._parse_tokens
+"""
+
+import os
+import unittest
+
+from friendly_arguments.binary import parse_bytes
+from friendly_arguments.incremental import IncrementalParser
+from friendly_arguments.parser import Parser, Option
+
+
+def make_parser():
+    return Parser([
+        Option('--verbose', '-v', flag=True, default=False),
+        Option('--debug', '-d', flag=True, default=False),
+        Option('--count', '-c', action='count', default=0),
+        Option('--number', '-n', type=int),
+        Option('--name', '-N'),
+        Option('--offset', type=float),
+        Option('--tag', '-t', action='append'),
+    ])
+
+
+class TestCombinedShortOptions(unittest.TestCase):
+    """Testes para opções curtas combinadas e valores colados"""
+    
+    def setUp(self):
+        self.parser = make_parser()
+    
+    def test_combined_flags(self):
+        """Testa que -vd equivale a -v -d"""
+        args = self.parser.parse(['prog', '-vd'])
+        self.assertIs(args['--verbose'], True)
+        self.assertIs(args['--debug'], True)
+    
+    def test_repeated_count(self):
+        """Testa que -ccc conta três vezes"""
+        self.assertEqual(self.parser.parse(['prog', '-ccc'])['--count'], 3)
+        self.assertEqual(self.parser.parse(['prog', '-vcc', '-c'])['--count'], 3)
+    
+    def test_attached_value(self):
+        """Testa -n5, -n=5 e -Nana"""
+        self.assertEqual(self.parser.parse(['prog', '-n5'])['--number'], 5)
+        self.assertEqual(self.parser.parse(['prog', '-n=5'])['--number'], 5)
+        self.assertEqual(self.parser.parse(['prog', '-Nana'])['--name'], 'ana')
+    
+    def test_flags_then_value(self):
+        """Testa que o valor fica com a primeira letra que recebe valor"""
+        args = self.parser.parse(['prog', '-vn5'])
+        self.assertIs(args['--verbose'], True)
+        self.assertEqual(args['--number'], 5)
+        
+        args = self.parser.parse(['prog', '-vdn', '7'])
+        self.assertIs(args['--debug'], True)
+        self.assertEqual(args['--number'], 7)
+        
+        self.assertEqual(self.parser.parse(['prog', '-vn=5'])['--number'], 5)
+    
+    def test_attached_values_repeat(self):
+        """Testa valores colados em opções append"""
+        args = self.parser.parse(['prog', '-ta', '-t', 'b', '-tc'])
+        self.assertEqual(args['--tag'], ('a', 'b', 'c'))
+    
+    def test_undeclared_letter(self):
+        """Testa que letras não declaradas mantêm o token como uma chave só"""
+        args = self.parser.parse(['prog', '-vx'])
+        self.assertIs(args['-vx'], True)
+        self.assertIs(args['--verbose'], False)
+    
+    def test_declared_cluster_name_wins(self):
+        """Testa que um nome declarado igual ao grupo tem prioridade"""
+        parser = Parser([
+            Option('-v', flag=True),
+            Option('-d', flag=True),
+            Option('-vd', flag=True, default=False),
+        ])
+        args = parser.parse(['prog', '-vd'])
+        self.assertIs(args['-vd'], True)
+        self.assertNotIn('-v', args)
+    
+    def test_declared_name_with_value_wins(self):
+        """Testa que -name=bob é a opção -name, não -n com o valor ame=bob"""
+        parser = Parser([Option('-name'), Option('-n')])
+        argv = ['prog', 'x', '-name=bob']
+        expected = {'-name': 'bob'}
+        self.assertEqual(dict(parser.parse(argv)), expected)
+        self.assertEqual(dict(parser.parse_lazy(argv).materialize()), expected)
+        self.assertEqual(parser.parse_lazy(argv)['-name'], 'bob')
+        self.assertEqual(dict(parse_bytes([os.fsencode(token) for token in argv], parser)),
+                         {'-name': b'bob'})
+        shell = IncrementalParser(parser)
+        shell.update(argv[1:])
+        self.assertEqual(dict(shell.result), expected)
+        
+        self.assertEqual(dict(parser.parse(['prog', '-n=bob'])), {'-n': 'bob'})
+        self.assertEqual(dict(parser.parse(['prog', '-nbob=1'])), {'-n': 'bob=1'})
+
+
+class TestValues(unittest.TestCase):
+    """Testes para a classificação de tokens como valores"""
+    
+    def setUp(self):
+        self.parser = make_parser()
+    
+    def test_negative_numbers(self):
+        """Testa que números negativos são valores"""
+        args = self.parser.parse(['prog', '--offset', '-0.5', '-n', '-3'])
+        self.assertEqual(args['--offset'], -0.5)
+        self.assertEqual(args['--number'], -3)
+    
+    def test_declared_negative_option(self):
+        """Testa que um número declarado como opção continua sendo opção"""
+        parser = Parser([Option('--level'), Option('-1', flag=True, default=False)])
+        args = parser.parse(['prog', '--level', '-1'])
+        self.assertIs(args['--level'], True)
+        self.assertIs(args['-1'], True)
+    
+    def test_dash_is_value(self):
+        """Testa que '-' sozinho é um valor"""
+        self.assertEqual(self.parser.parse(['prog', '--name', '-'])['--name'], '-')
+    
+    def test_end_of_options(self):
+        """Testa que nada depois de '--' é opção"""
+        args = self.parser.parse(['prog', '-v', '--', '--debug', '-n', '5'])
+        self.assertIs(args['--verbose'], True)
+        self.assertIs(args['--debug'], False)
+        self.assertNotIn('--number', args)
+    
+    def test_flag_before_end_of_options(self):
+        """Testa que uma opção pendente antes de '--' vira flag"""
+        args = self.parser.parse(['prog', '--name', '--', 'ana'])
+        self.assertIs(args['--name'], True)
+    
+    def test_bare_assignment_is_positional(self):
+        """Testa que a=b sem traço não vira chave"""
+        args = self.parser.parse(['prog', 'a=b', '--name', 'ana'])
+        self.assertNotIn('a', args)
+        self.assertEqual(args['--name'], 'ana')
+
+
+class TestEquivalence(unittest.TestCase):
+    """Testa que os modos lazy e bytes concordam com o parsing normal"""
+    
+    ARGV = ['prog', 'file', '-vc', '-ccn5', '--offset', '-2.5', '-ta', '-t', 'b',
+            '--name=ana', '-x', '-9', '--', '--debug']
+    
+    def test_lazy(self):
+        """Testa parse_lazy() nos mesmos tokens"""
+        parser = make_parser()
+        eager = parser.parse(self.ARGV)
+        lazy = parser.parse_lazy(self.ARGV)
+        for key in eager:
+            self.assertEqual(lazy[key], eager[key], key)
+        self.assertEqual(dict(lazy.materialize()), dict(eager))
+    
+    def test_bytes(self):
+        """Testa parse_bytes() nos mesmos tokens"""
+        parser = make_parser()
+        eager = parser.parse(self.ARGV)
+        binary = parse_bytes([os.fsencode(token) for token in self.ARGV], parser)
+        # Valores sem tipo continuam em bytes
+        self.assertEqual(dict(binary), {
+            key: os.fsencode(value) if isinstance(value, str) else
+            tuple(map(os.fsencode, value)) if isinstance(value, tuple) else value
+            for key, value in eager.items()
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Testes unitários para o módulo friendly_arguments.validation
+"""
+
+import enum
+import pickle
+import unittest
+
+from friendly_arguments.binary import parse_bytes
+from friendly_arguments.converters import ListOf
+from friendly_arguments.incremental import IncrementalParser
+from friendly_arguments.layered import layered_args
+from friendly_arguments.parser import Parser, Option, ArgumentError, parse_many
+from friendly_arguments.validation import ValidationError, validate
+
+
+class Format(enum.Enum):
+    JSON = 'json'
+    YAML = 'yaml'
+    CSV = 'csv'
+
+
+def make_parser():
+    """Parser com todos os tipos de restrição"""
+    parser = Parser([
+        Option('--name', '-n', required=True),
+        Option('--port', '-p', type=int, default=8080, min=1, max=65535),
+        Option('--format', type=Format, choices=[Format.JSON, Format.YAML]),
+        Option('--level', choices=['debug', 'info']),
+        Option('--ids', type=int, action='append', min=0),
+        Option('--ports', type=ListOf(int), max=1024),
+        Option('--json', flag=True, default=False),
+        Option('--yaml', flag=True, default=False),
+    ])
+    parser.add_exclusive('--json', '--yaml')
+    return parser
+
+
+class TestValidation(unittest.TestCase):
+    """Testes para as restrições declaradas nas opções"""
+    
+    def setUp(self):
+        """Cria o parser com restrições"""
+        self.parser = make_parser()
+    
+    def test_valid_command_line(self):
+        """Testa que uma linha válida é parseada normalmente"""
+        args = self.parser.parse(['app', '-n', 'api', '-p', '80', '--format', 'json',
+                                  '--ids', '3', '--ports=80,443', '--json'])
+        
+        self.assertEqual(args['--name'], 'api')
+        self.assertEqual(args['--port'], 80)
+        self.assertIs(args['--format'], Format.JSON)
+    
+    def test_all_errors_at_once(self):
+        """Testa que todas as violações são reportadas numa única exceção"""
+        argv = ['app', '--port', '0', '--format', 'csv', '--level', 'trace',
+                '--ids', '1', '--ids=-5', '--ports=80,8080', '--json', '--yaml']
+        
+        with self.assertRaises(ValidationError) as context:
+            self.parser.parse(argv)
+        
+        self.assertEqual(context.exception.errors, [
+            "Option --name is required",
+            "Option --port must be at least 1 (got 0)",
+            "Option --format must be one of JSON, YAML (got CSV)",
+            "Option --level must be one of 'debug', 'info' (got 'trace')",
+            "Option --ids must be at least 0 (got -5)",
+            "Option --ports must be at most 1024 (got 8080)",
+            "Options --json and --yaml can't be used together",
+        ])
+        self.assertIn('7 invalid arguments', str(context.exception))
+    
+    def test_is_argument_error(self):
+        """Testa que ValidationError é um ArgumentError com uma mensagem só"""
+        with self.assertRaises(ArgumentError) as context:
+            self.parser.parse(['app'])
+        
+        self.assertEqual(str(context.exception), "Option --name is required")
+    
+    def test_defaults_are_not_checked(self):
+        """Testa que os valores padrão declarados não contam como dados"""
+        parser = Parser([Option('--mode', default='auto', choices=['fast', 'slow'])])
+        self.assertEqual(parser.parse(['app'])['--mode'], 'auto')
+    
+    def test_explicit_default_values_are_checked(self):
+        """Testa que um valor dado igual ao padrão também é validado"""
+        parser = Parser([
+            Option('--level', type=int, default=5, choices=[1, 2, 3]),
+            Option('--retries', type=int, default=0),
+            Option('--no-retry', flag=True, default=False),
+        ])
+        parser.add_exclusive('--retries', '--no-retry')
+        self.assertEqual(parser.parse(['app'])['--level'], 5)
+        
+        for argv in (['app', '--level', '5'], ['app', '--retries', '0', '--no-retry']):
+            with self.assertRaises(ValidationError):
+                parser.parse(argv)
+            with self.assertRaises(ValidationError):
+                parse_many([argv], parser, columnar=True)
+            with self.assertRaises(ValidationError):
+                dict(parser.parse_lazy(argv))
+            with self.assertRaises(ValidationError):
+                parse_bytes([token.encode() for token in argv], parser)
+            with self.assertRaises(ValidationError):
+                layered_args(argv, parser)
+            shell = IncrementalParser(parser)
+            shell.update(argv[1:])
+            self.assertEqual(len(shell.errors), 1)
+        
+        with self.assertRaises(ValidationError):
+            layered_args(['app'], parser, env_prefix='APP_', environ={'APP_LEVEL': '5'})
+    
+    def test_required_satisfied_by_defaults(self):
+        """Testa que defaults da chamada satisfazem opções obrigatórias"""
+        args = self.parser.parse(['app'], defaults={'-n': 'padrão'})
+        self.assertEqual(args['--name'], 'padrão')
+    
+    def test_no_constraints_no_validator(self):
+        """Testa que sem restrições nenhum validador é compilado"""
+        parser = Parser([Option('--name'), Option('--port', type=int)]).compile()
+        self.assertIsNone(parser._validator)
+        self.assertIsNotNone(self.parser.compile()._validator)
+    
+    def test_unknown_exclusive_option(self):
+        """Testa que grupos exclusivos com opções não declaradas geram ArgumentError"""
+        parser = Parser([Option('--json', flag=True)])
+        parser.add_exclusive('--json', '--xml')
+        with self.assertRaises(ArgumentError):
+            parser.compile()
+        with self.assertRaises(ArgumentError):
+            parser.add_exclusive('--json')
+    
+    def test_every_parse_path(self):
+        """Testa a validação em parse_many(), no modo colunar, lazy e em camadas"""
+        with self.assertRaises(ValidationError):
+            parse_many([['app', '-n', 'a'], ['app']], self.parser)
+        with self.assertRaises(ValidationError):
+            parse_many([['app']], self.parser, columnar=True)
+        self.assertEqual(
+            parse_many([['app']], self.parser, columnar=True, defaults={'--name': 'a'})['--name'],
+            ['a'],
+        )
+        
+        lazy = self.parser.parse_lazy(['app', '--port', '0', '-n', 'a'])
+        self.assertEqual(lazy['--name'], 'a')
+        with self.assertRaises(ValidationError):
+            dict(lazy)
+        
+        args = layered_args(['app'], self.parser, env_prefix='APP_',
+                            environ={'APP_NAME': 'env'})
+        # A opção obrigatória vem do ambiente; a porta do ambiente é inválida
+        with self.assertRaises(ValidationError) as context:
+            layered_args(['app', '-n', 'a'], self.parser, env_prefix='APP_',
+                         environ={'APP_PORT': '70000'})
+        self.assertEqual(args['--name'], 'env')
+        self.assertEqual(len(context.exception.errors), 1)
+    
+    def test_validate_function(self):
+        """Testa validate() sobre um resultado já construído"""
+        args = self.parser.parse(['app', '-n', 'a'])
+        args['--port'] = 0
+        with self.assertRaises(ValidationError):
+            validate(args, self.parser)
+    
+    def test_pickle(self):
+        """Testa que parsers e erros de validação podem ser serializados"""
+        parser = pickle.loads(pickle.dumps(self.parser.compile()))
+        with self.assertRaises(ValidationError):
+            parser.parse(['app'])
+        
+        error = pickle.loads(pickle.dumps(ValidationError(['a', 'b'])))
+        self.assertEqual(error.errors, ['a', 'b'])
+    
+    def test_fingerprint_includes_constraints(self):
+        """Testa que o fingerprint muda com as restrições"""
+        changed = make_parser()
+        changed.add_exclusive('--json', '--format')
+        self.assertNotEqual(changed.fingerprint(), make_parser().fingerprint())
+
+
+if __name__ == '__main__':
+    unittest.main()